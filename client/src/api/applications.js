@@ -4,6 +4,10 @@ export const applicationsAPI = {
   applyToJob: (applicationData) => api.post('/applications', applicationData),
   getCandidateApplications: () => api.get('/applications/candidate'),
   getCompanyApplications: () => api.get('/applications/company'),
+  filterCompanyApplications: (params) => api.get('/applications/company/filter', { params }),
   updateApplicationStatus: (id, status) => api.put(`/applications/${id}/status`, { status }),
   getApplicationById: (id) => api.get(`/applications/${id}`),
+  getApplicationScore: (id) => api.get(`/applications/${id}/score`),
+  getApplicationDuplicates: (id) => api.get(`/applications/${id}/duplicates`),
+  getTopApplications: (jobId, params) => api.get(`/applications/job/${jobId}/top`, { params }),
 }
\ No newline at end of file
@@ -2,6 +2,8 @@ import api from './auth'
 
 export const jobsAPI = {
   getAllJobs: () => api.get('/jobs'),
+  searchJobs: (params) => api.get('/jobs/search', { params }),
+  getRecommendations: (params) => api.get('/jobs/recommendations', { params }),
   getJobById: (id) => api.get(`/jobs/${id}`),
   createJob: (jobData) => api.post('/jobs', jobData),
   updateJob: (id, jobData) => api.put(`/jobs/${id}`, jobData),
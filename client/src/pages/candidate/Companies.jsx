@@ -34,7 +34,8 @@ const Companies = () => {
         jobTitle: app.job.title,
         appliedDate: app.appliedDate,
         status: app.status,
-        matchPercentage: app.matchScore || 75,
+        matchPercentage: app.matchScore,
+        scoringStatus: app.scoringStatus || 'completed',
         logo: app.job.companyName.charAt(0),
         updatedAt: app.updated_at
       }))
@@ -249,17 +250,21 @@ const Companies = () => {
                       <div className="mt-2">
                         <div className="flex items-center justify-end space-x-2">
                           <span className="text-sm text-gray-600">Match:</span>
-                          <div className="flex items-center">
-                            <div className="w-16 bg-gray-200 rounded-full h-2">
-                              <div 
-                                className="bg-primary-600 h-2 rounded-full" 
-                                style={{ width: `${application.matchPercentage}%` }}
-                              ></div>
+                          {['pending', 'processing'].includes(application.scoringStatus) ? (
+                            <span className="text-sm text-gray-500">Scoring...</span>
+                          ) : (
+                            <div className="flex items-center">
+                              <div className="w-16 bg-gray-200 rounded-full h-2">
+                                <div 
+                                  className="bg-primary-600 h-2 rounded-full" 
+                                  style={{ width: `${application.matchPercentage}%` }}
+                                ></div>
+                              </div>
+                              <span className="ml-2 text-sm font-medium text-gray-900">
+                                {application.matchPercentage}%
+                              </span>
                             </div>
-                            <span className="ml-2 text-sm font-medium text-gray-900">
-                              {application.matchPercentage}%
-                            </span>
-                          </div>
+                          )}
                         </div>
                       </div>
                     </div>
@@ -5,21 +5,34 @@ import JobCard from '../../components/JobCard'
 import ApplyJobModal from '../../components/ApplyJobModal'
 import { jobsAPI } from '../../api/jobs'
 
+const PER_PAGE = 20
+
+// Match the last word as a prefix so results update while typing
+const toSearchQuery = (text) => {
+  const trimmed = text.trim()
+  return trimmed && /\w$/.test(trimmed) ? `${trimmed}*` : trimmed
+}
+
 const Jobs = () => {
   const [jobs, setJobs] = useState([])
+  const [query, setQuery] = useState('')
+  const [page, setPage] = useState(1)
+  const [total, setTotal] = useState(0)
   const [selectedJob, setSelectedJob] = useState(null)
   const [isModalOpen, setIsModalOpen] = useState(false)
   const [isLoading, setIsLoading] = useState(true)
   const [successMessage, setSuccessMessage] = useState('')
 
   useEffect(() => {
-    fetchJobs()
-  }, [])
+    const timer = setTimeout(fetchJobs, 300)
+    return () => clearTimeout(timer)
+  }, [query, page])
 
   const fetchJobs = async () => {
     try {
-      const response = await jobsAPI.getAllJobs()
-      setJobs(response.data)
+      const response = await jobsAPI.searchJobs({ q: toSearchQuery(query), page, per_page: PER_PAGE })
+      setJobs(response.data.jobs)
+      setTotal(response.data.total)
     } catch (error) {
       console.error('Error fetching jobs:', error)
       // Fallback to mock data for demo
@@ -74,6 +87,11 @@ const Jobs = () => {
     }
   }
 
+  const handleQueryChange = (e) => {
+    setQuery(e.target.value)
+    setPage(1)
+  }
+
   const handleApply = (job) => {
     setSelectedJob(job)
     setIsModalOpen(true)
@@ -112,6 +130,16 @@ const Jobs = () => {
               <p className="text-gray-600">Find your next opportunity</p>
             </div>
 
+            <div className="mb-6">
+              <input
+                type="text"
+                value={query}
+                onChange={handleQueryChange}
+                placeholder="Search by title, skill, location or keyword"
+                className="w-full px-3 py-2 border border-gray-300 rounded-lg focus:outline-none focus:ring-2 focus:ring-primary-500"
+              />
+            </div>
+
             {successMessage && (
               <div className="mb-6 bg-green-50 border border-green-200 text-green-700 px-4 py-3 rounded-lg">
                 {successMessage}
@@ -130,7 +158,31 @@ const Jobs = () => {
 
             {jobs.length === 0 && (
               <div className="text-center py-12">
-                <p className="text-gray-500">No jobs available at the moment.</p>
+                <p className="text-gray-500">
+                  {query.trim() ? 'No jobs match your search.' : 'No jobs available at the moment.'}
+                </p>
+              </div>
+            )}
+
+            {total > PER_PAGE && (
+              <div className="flex items-center justify-between mt-6">
+                <button
+                  onClick={() => setPage(page - 1)}
+                  disabled={page === 1}
+                  className="btn-secondary disabled:opacity-50"
+                >
+                  Previous
+                </button>
+                <span className="text-sm text-gray-600">
+                  Page {page} of {Math.ceil(total / PER_PAGE)}
+                </span>
+                <button
+                  onClick={() => setPage(page + 1)}
+                  disabled={page * PER_PAGE >= total}
+                  className="btn-secondary disabled:opacity-50"
+                >
+                  Next
+                </button>
               </div>
             )}
           </div>
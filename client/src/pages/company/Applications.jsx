@@ -4,6 +4,11 @@ import TopNavbar from '../../components/TopNavbar'
 import { Eye, Check, X, Download, User } from 'lucide-react'
 import { applicationsAPI } from '../../api/applications'
 
+// How often to ask for scores that are still being computed
+const SCORE_POLL_INTERVAL = 3000
+
+const isScoring = (application) => ['pending', 'processing'].includes(application.scoringStatus)
+
 const Applications = () => {
   const [applications, setApplications] = useState([])
   const [selectedApplication, setSelectedApplication] = useState(null)
@@ -15,6 +20,33 @@ const Applications = () => {
     fetchApplications()
   }, [])
 
+  // Scores are computed in the background; poll until every one has arrived
+  useEffect(() => {
+    const scoring = applications.filter(isScoring)
+    if (scoring.length === 0) return
+
+    const timeout = setTimeout(async () => {
+      const results = await Promise.allSettled(
+        scoring.map(app => applicationsAPI.getApplicationScore(app._id))
+      )
+      const scores = {}
+      results.forEach((result, index) => {
+        if (result.status === 'fulfilled') {
+          scores[scoring[index]._id] = result.value.data
+        }
+      })
+      setApplications(prev =>
+        prev.map(app =>
+          scores[app._id]
+            ? { ...app, matchScore: scores[app._id].match_score, scoringStatus: scores[app._id].scoring_status }
+            : app
+        )
+      )
+    }, SCORE_POLL_INTERVAL)
+
+    return () => clearTimeout(timeout)
+  }, [applications])
+
   const fetchApplications = async () => {
     try {
       const response = await applicationsAPI.getCompanyApplications()
@@ -25,13 +57,15 @@ const Applications = () => {
         jobTitle: app.job.title,
         appliedDate: app.appliedDate,
         status: app.status,
-        matchScore: app.matchScore || 75,
+        matchScore: app.matchScore,
+        scoringStatus: app.scoringStatus || 'completed',
         degree: app.degree,
         experience: app.experience,
         profilePhoto: app.candidate?.profile?.profilePhoto || null,
         resumeUrl: app.resumeUrl,
         skills: app.candidate?.profile?.skills || [],
-        mobile: app.candidate?.profile?.mobile || ''
+        mobile: app.candidate?.profile?.mobile || '',
+        possibleDuplicates: app.possibleDuplicates || []
       }))
       setApplications(applicationsData)
     } catch (error) {
@@ -210,6 +244,17 @@ const Applications = () => {
                               <p className="text-sm text-gray-500">
                                 {application.email}
                               </p>
+                              {application.possibleDuplicates?.length > 0 && (
+                                <p
+                                  className="text-xs text-amber-600"
+                                  title={application.possibleDuplicates
+                                    .map(duplicate => `${duplicate.candidateName} (${duplicate.jobTitle}), ${Math.round(duplicate.similarity * 100)}% similar`)
+                                    .join('\n')}
+                                >
+                                  Possible duplicate of {application.possibleDuplicates[0].candidateName}
+                                  {application.possibleDuplicates.length > 1 && ` +${application.possibleDuplicates.length - 1} more`}
+                                </p>
+                              )}
                             </div>
                           </div>
                         </td>
@@ -218,17 +263,23 @@ const Applications = () => {
                           {new Date(application.appliedDate).toLocaleDateString()}
                         </td>
                         <td className="py-4 px-4">
-                          <div className="flex items-center">
-                            <div className="w-16 bg-gray-200 rounded-full h-2 mr-2">
-                              <div 
-                                className="bg-primary-600 h-2 rounded-full" 
-                                style={{ width: `${application.matchScore}%` }}
-                              ></div>
+                          {isScoring(application) ? (
+                            <span className="text-sm text-gray-500">Scoring...</span>
+                          ) : application.scoringStatus === 'failed' ? (
+                            <span className="text-sm text-gray-500">Not scored</span>
+                          ) : (
+                            <div className="flex items-center">
+                              <div className="w-16 bg-gray-200 rounded-full h-2 mr-2">
+                                <div 
+                                  className="bg-primary-600 h-2 rounded-full" 
+                                  style={{ width: `${application.matchScore}%` }}
+                                ></div>
+                              </div>
+                              <span className="text-sm font-medium text-gray-900">
+                                {application.matchScore}%
+                              </span>
                             </div>
-                            <span className="text-sm font-medium text-gray-900">
-                              {application.matchScore}%
-                            </span>
-                          </div>
+                          )}
                         </td>
                         <td className="py-4 px-4">
                           <span className={`inline-flex px-2 py-1 text-xs font-medium rounded-full ${getStatusColor(application.status)}`}>
@@ -329,7 +380,13 @@ const Applications = () => {
                   <label className="block text-sm font-medium text-gray-700 mb-1">
                     Match Score
                   </label>
-                  <p className="text-gray-900">{selectedApplication.matchScore}%</p>
+                  <p className="text-gray-900">
+                    {isScoring(selectedApplication)
+                      ? 'Scoring...'
+                      : selectedApplication.scoringStatus === 'failed'
+                        ? 'Not scored'
+                        : `${selectedApplication.matchScore}%`}
+                  </p>
                 </div>
                 <div>
                   <label className="block text-sm font-medium text-gray-700 mb-1">
@@ -3,6 +3,7 @@ from flask_cors import CORS
 from flask_jwt_extended import JWTManager
 from pymongo import MongoClient
 import os
+import threading
 from config import Config
 
 # Import routes
@@ -11,6 +12,13 @@ from routes.job_routes import job_bp
 from routes.resume_routes import resume_bp
 from routes.application_routes import application_bp
 
+# Import models and services
+from models.application_model import Application
+from models.job_model import Job
+from services import extraction_pool, keyword_stats, scoring_worker
+from services.match_cache import MatchScoreCache
+from services.parse_cache import ParseCache
+
 def create_app():
     app = Flask(__name__)
     app.config.from_object(Config)
@@ -24,6 +32,9 @@ def create_app():
         client = MongoClient(Config.MONGO_URI)
         app.db = client.get_default_database()
         print("Connected to MongoDB successfully")
+        Application(app.db).ensure_indexes()
+        MatchScoreCache(app.db).ensure_indexes()
+        keyword_stats.init_app(app.db)
     except Exception as e:
         print(f"Failed to connect to MongoDB: {e}")
         return None
@@ -31,6 +42,13 @@ def create_app():
     # Create upload directory
     os.makedirs(Config.UPLOAD_FOLDER, exist_ok=True)
     
+    # Store feature blocks on jobs posted before the current version, so scoring stops rebuilding them
+    threading.Thread(target=Job(app.db).backfill_features, name='job-features-backfill', daemon=True).start()
+    
+    # Pick up applications left unscored by a previous run or a stopped process
+    if scoring_worker.is_async():
+        scoring_worker.start_recovery(app.db)
+    
     # Register blueprints
     app.register_blueprint(auth_bp, url_prefix='/api/auth')
     app.register_blueprint(job_bp, url_prefix='/api/jobs')
@@ -42,6 +60,15 @@ def create_app():
     def health_check():
         return jsonify({'status': 'healthy', 'message': 'SkillSync API is running'})
     
+    # Metrics endpoint
+    @app.route('/api/metrics')
+    def metrics():
+        return jsonify({
+            'extraction': extraction_pool.get_metrics(),
+            'parse_cache': ParseCache.stats(),
+            'match_scores': MatchScoreCache.stats()
+        })
+    
     # Error handlers
     @app.errorhandler(404)
     def not_found(error):
@@ -4,6 +4,7 @@ from flask_jwt_extended import JWTManager, create_access_token, jwt_required, ge
 import bcrypt
 from datetime import datetime, timedelta
 import os
+from services.skill_taxonomy import find_skill_labels
 
 app = Flask(__name__)
 app.config['JWT_SECRET_KEY'] = 'your-secret-key'
@@ -415,21 +416,12 @@ def extract_text_from_file(file):
 def extract_text_from_pdf(file):
     """Extract text from PDF file"""
     try:
-        from PyPDF2 import PdfReader
-        import io
+        from services.resume_parser import read_pdf_text
         
-        # Read file content
-        file_content = file.read()
+        # Read pages straight from the upload stream instead of copying it
+        text = read_pdf_text(file.stream)
         file.seek(0)  # Reset file pointer
         
-        # Create PDF reader
-        pdf_reader = PdfReader(io.BytesIO(file_content))
-        text = ""
-        
-        # Extract text from all pages
-        for page in pdf_reader.pages:
-            text += page.extract_text() + "\n"
-        
         return text.strip()
         
     except Exception as e:
@@ -439,21 +431,11 @@ def extract_text_from_pdf(file):
 def extract_text_from_docx(file):
     """Extract text from DOCX file"""
     try:
-        from docx import Document
-        import io
+        from services.resume_parser import read_docx_text
         
-        # Read file content
-        file_content = file.read()
+        text = read_docx_text(file.stream)
         file.seek(0)  # Reset file pointer
         
-        # Create document object
-        doc = Document(io.BytesIO(file_content))
-        text = ""
-        
-        # Extract text from all paragraphs
-        for paragraph in doc.paragraphs:
-            text += paragraph.text + "\n"
-        
         return text.strip()
         
     except Exception as e:
@@ -462,22 +444,7 @@ def extract_text_from_docx(file):
 
 def extract_skills_from_job_description(description):
     """Extract technical skills from job description"""
-    common_skills = [
-        'JavaScript', 'TypeScript', 'Python', 'Java', 'React', 'Node.js', 
-        'Angular', 'Vue.js', 'HTML', 'CSS', 'SQL', 'MongoDB', 'PostgreSQL',
-        'MySQL', 'AWS', 'Azure', 'Docker', 'Kubernetes', 'Git', 'Jenkins',
-        'C++', 'C#', 'PHP', 'Ruby', 'Go', 'Rust', 'Swift', 'Kotlin',
-        'Django', 'Flask', 'Spring', 'Express.js', 'Laravel', 'Rails'
-    ]
-    
-    description_lower = description.lower()
-    found_skills = []
-    
-    for skill in common_skills:
-        if skill.lower() in description_lower:
-            found_skills.append(skill)
-    
-    return found_skills
+    return find_skill_labels(description)
 
 def preprocess_text(text):
     """Clean and preprocess text for analysis"""
@@ -0,0 +1,71 @@
+"""Compare pair-by-pair SkillMatcher scoring with the sparse BatchScorer.
+
+Run from the server directory:
+    python -m benchmarks.bench_batch_scoring --resumes 300 --jobs 100
+"""
+import argparse
+import time
+from benchmarks.corpus import generate_corpus, generate_jobs
+from services import keyword_stats
+from services.batch_scorer import SCORE_COMPONENTS, BatchScorer
+from services.job_features import build_job_features
+from services.resume_features import build_resume_features, to_resume_data
+from services.resume_parser import ResumeParser
+from services.skill_matcher import SkillMatcher
+
+def scalar_scores(matcher, resumes, jobs):
+    """The per-pair path used by the routes"""
+    return [[matcher.calculate_ats_score(resume, job) for job in jobs] for resume in resumes]
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--resumes', type=int, default=300)
+    parser.add_argument('--jobs', type=int, default=100)
+    args = parser.parse_args()
+
+    # Score stored records, as the routes do, so both paths skip parsing
+    resume_parser = ResumeParser()
+    resumes = [to_resume_data(build_resume_features(resume_parser.parse_text(text)))
+               for text in generate_corpus(args.resumes)]
+    jobs = generate_jobs(args.jobs)
+    for job in jobs:
+        job['features'] = build_job_features(job)
+    # Keyword statistics as if these jobs were the active corpus
+    document_frequency = {}
+    for job in jobs:
+        for keyword in job['features']['keywords']:
+            document_frequency[keyword] = document_frequency.get(keyword, 0) + 1
+    keyword_stats.set_snapshot({'documentFrequency': document_frequency, 'documentCount': len(jobs)})
+    # A posting without a description scores no keyword points
+    del jobs[-1]['description']
+
+    matcher = SkillMatcher()
+    scorer = BatchScorer()
+
+    start = time.perf_counter()
+    expected = scalar_scores(matcher, resumes, jobs)
+    scalar_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batch = scorer.score(resumes, jobs)
+    batch_time = time.perf_counter() - start
+
+    # Results must be identical, not just close
+    assert batch['ats_score'].tolist() == expected
+    for i, resume in enumerate(resumes[:20]):
+        for j, job in enumerate(jobs):
+            skill_analysis = matcher.analyze_match(resume, job)['skill_analysis']
+            breakdown = matcher._calculate_score_breakdown(resume, job, skill_analysis)
+            assert all(breakdown[name] == batch[name][i, j] for name in SCORE_COMPONENTS), (i, j)
+
+    assert scorer.score_applicants(resumes, jobs[0]) == [row[0] for row in expected]
+    assert scorer.score_jobs(resumes[0], jobs) == expected[0]
+
+    pairs = len(resumes) * len(jobs)
+    print(f"resumes: {len(resumes)}  jobs: {len(jobs)}  pairs: {pairs}")
+    print(f"scalar SkillMatcher: {scalar_time * 1000:.1f} ms ({scalar_time / pairs * 1e6:.1f} us/pair)")
+    print(f"BatchScorer:         {batch_time * 1000:.1f} ms ({batch_time / pairs * 1e6:.2f} us/pair)")
+    print(f"speedup:             {scalar_time / batch_time:.1f}x")
+
+if __name__ == '__main__':
+    main()
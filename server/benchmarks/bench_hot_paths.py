@@ -0,0 +1,172 @@
+"""Time the parser, preprocessor and matcher hot paths and flag regressions against a JSON baseline.
+
+Every stage runs over deterministic synthetic resumes of each profile (short,
+long, skills-dense and pathological) and reports its best time per document
+over several rounds. ``--save`` records the results as the baseline; later
+runs compare against it and exit with status 1 when a stage got slower by
+more than ``--threshold``. Timings only compare on the same machine and
+settings, so record a baseline before making a change.
+
+Text extraction goes through the extraction pool when ``EXTRACTION_WORKERS``
+is above 0, as in the app; set it to 0 to time the parsing alone.
+
+Run from the server directory:
+    python -m benchmarks.bench_hot_paths --save
+    python -m benchmarks.bench_hot_paths --threshold 0.2
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+from datetime import datetime
+from benchmarks.corpus import PROFILES, build_docx, build_pdf, generate_jobs, generate_profile
+from config import Config
+from services.job_features import build_job_features
+from services.resume_parser import ResumeParser
+from services.skill_matcher import SkillMatcher
+from services.text_preprocessing import TextPreprocessor
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), 'baselines', 'hot_paths.json')
+
+STAGES = ('extract_text_pdf', 'extract_text_docx', 'clean_text', 'extract_skills',
+          'analyze_match', 'calculate_ats_score')
+
+def build_cases(profile, count, seed, directory):
+    """Resume texts of one profile with their files, parsed data and a job for each"""
+    parser = ResumeParser()
+    jobs = generate_jobs(count, seed=seed)
+    cases = []
+    for index, text in enumerate(generate_profile(profile, count, seed)):
+        pdf_path = os.path.join(directory, f'{profile}_{index}.pdf')
+        with open(pdf_path, 'wb') as file:
+            file.write(build_pdf([text]))
+        docx_path = os.path.join(directory, f'{profile}_{index}.docx')
+        with open(docx_path, 'wb') as file:
+            file.write(build_docx(text))
+
+        job = jobs[index]
+        job['_id'] = f'job{index}'
+        job['features'] = build_job_features(job)
+        cases.append({
+            'text': text,
+            'pdf_path': pdf_path,
+            'docx_path': docx_path,
+            'resume_data': parser.parse_text(text),
+            'job': job
+        })
+    return cases
+
+def stage_functions():
+    """One callable per stage, taking a prepared case"""
+    # The demo server builds its app on import, so only load it when timing it
+    import app_simple
+
+    parser = ResumeParser()
+    preprocessor = TextPreprocessor()
+    matcher = SkillMatcher()
+
+    def analyze_match(case):
+        result = matcher.analyze_match(case['resume_data'], case['job'])
+        # Results are lazy, so build every field as the analyze route does
+        return result.to_dict() if 'error' not in result else result
+
+    return {
+        'extract_text_pdf': lambda case: parser._extract_text(case['pdf_path']),
+        'extract_text_docx': lambda case: parser._extract_text(case['docx_path']),
+        'clean_text': lambda case: preprocessor.clean_text(case['text']),
+        'extract_skills': lambda case: parser._extract_skills(case['text']),
+        'analyze_match': analyze_match,
+        'calculate_ats_score': lambda case: app_simple.calculate_ats_score(case['text'], case['job'])
+    }
+
+def time_stage(func, cases, repeat):
+    """Best milliseconds per document over repeat rounds, after one warm-up round"""
+    for case in cases:
+        func(case)
+
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for case in cases:
+            func(case)
+        best = min(best, time.perf_counter() - start)
+    return best / len(cases) * 1000
+
+def load_baseline(path):
+    if not os.path.exists(path):
+        return None
+    with open(path) as file:
+        return json.load(file)
+
+def save_baseline(path, settings, results):
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    baseline = {
+        'created_at': datetime.utcnow().isoformat(),
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'settings': settings,
+        'results': results
+    }
+    with open(path, 'w') as file:
+        json.dump(baseline, file, indent=2, sort_keys=True)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--docs', type=int, default=20, help='documents per profile')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--profiles', nargs='+', choices=PROFILES, default=list(PROFILES))
+    parser.add_argument('--stages', nargs='+', choices=STAGES, default=list(STAGES))
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE)
+    parser.add_argument('--save', action='store_true', help='record this run as the baseline')
+    parser.add_argument('--threshold', type=float, default=0.2, help='allowed slowdown, as a fraction')
+    parser.add_argument('--min-delta', type=float, default=0.01,
+                        help='ignore slowdowns below this many milliseconds per document')
+    args = parser.parse_args()
+
+    settings = {'docs': args.docs, 'seed': args.seed, 'extraction_workers': Config.EXTRACTION_WORKERS}
+    baseline = None if args.save else load_baseline(args.baseline)
+    if baseline and baseline['settings'] != settings:
+        print(f"warning: baseline settings {baseline['settings']} differ from {settings}")
+    previous = baseline['results'] if baseline else {}
+
+    functions = stage_functions()
+    results = {}
+    regressions = []
+    print(f"{'stage':<20} {'profile':<13} {'ms/doc':>10} {'baseline':>10} {'change':>8}")
+    with tempfile.TemporaryDirectory() as directory:
+        cases = {profile: build_cases(profile, args.docs, args.seed, directory) for profile in args.profiles}
+        for stage in args.stages:
+            for profile in args.profiles:
+                elapsed = time_stage(functions[stage], cases[profile], args.repeat)
+                results.setdefault(stage, {})[profile] = elapsed
+
+                expected = previous.get(stage, {}).get(profile)
+                if expected is None:
+                    print(f"{stage:<20} {profile:<13} {elapsed:>10.3f} {'-':>10} {'-':>8}")
+                    continue
+
+                change = (elapsed - expected) / expected if expected else 0.0
+                flag = ''
+                if change > args.threshold and elapsed - expected > args.min_delta:
+                    regressions.append((stage, profile, change))
+                    flag = '  REGRESSION'
+                print(f"{stage:<20} {profile:<13} {elapsed:>10.3f} {expected:>10.3f} {change:>+7.0%}{flag}")
+
+    if args.save:
+        save_baseline(args.baseline, settings, results)
+        print(f"baseline saved to {args.baseline}")
+    elif baseline is None:
+        print(f"no baseline at {args.baseline}; run with --save to record one")
+
+    if regressions:
+        print(f"{len(regressions)} stage(s) slower than baseline by more than {args.threshold:.0%}:")
+        for stage, profile, change in regressions:
+            print(f"  {stage} ({profile}): {change:+.0%}")
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
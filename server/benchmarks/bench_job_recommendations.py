@@ -0,0 +1,72 @@
+"""Time pruned job recommendations against scoring every posting, by corpus size.
+
+Run from the server directory:
+    python -m benchmarks.bench_job_recommendations --sizes 1000 10000
+"""
+import argparse
+import time
+from datetime import datetime, timedelta
+from benchmarks.corpus import generate_corpus, generate_jobs
+from services.job_features import build_job_features
+from services.job_recommender import JobRecommendationIndex
+from services.resume_features import build_resume_features, to_resume_data
+from services.resume_parser import ResumeParser
+from services.skill_matcher import SkillMatcher
+
+def build_jobs(count):
+    now = datetime.utcnow()
+    jobs = generate_jobs(count)
+    for index, job in enumerate(jobs):
+        job['_id'] = f'job{index}'
+        job['created_at'] = now - timedelta(minutes=index)
+        job['features'] = build_job_features(job)
+    return jobs
+
+def scan_recommend(matcher, resume, jobs, limit):
+    """The one-by-one approach: score the resume against every posting"""
+    scores = [matcher.calculate_ats_score(resume, job) for job in jobs]
+    return sorted(scores, reverse=True)[:limit]
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000])
+    parser.add_argument('--resumes', type=int, default=10)
+    parser.add_argument('--limit', type=int, default=10)
+    args = parser.parse_args()
+
+    resume_parser = ResumeParser()
+    resumes = [to_resume_data(build_resume_features(resume_parser.parse_text(text)))
+               for text in generate_corpus(args.resumes)]
+    matcher = SkillMatcher()
+
+    print(f"{'jobs':>7} {'build ms':>9} {'index ms/query':>14} {'scan ms/query':>14} {'speedup':>8}")
+    for size in args.sizes:
+        jobs = build_jobs(size)
+
+        start = time.perf_counter()
+        index = JobRecommendationIndex()
+        for job in jobs:
+            index.add(job)
+        build_ms = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        recommended = [index.recommend(resume, args.limit) for resume in resumes]
+        index_ms = (time.perf_counter() - start) / len(resumes) * 1000
+
+        start = time.perf_counter()
+        scanned = [scan_recommend(matcher, resume, jobs, args.limit) for resume in resumes]
+        scan_ms = (time.perf_counter() - start) / len(resumes) * 1000
+
+        # Pruning may pick different jobs among equal scores, never a different set of scores.
+        # Jobs sharing no skill are out of scope for the index, so compare against scanned scores
+        # only where the index found enough candidates.
+        jobs_by_id = {job['_id']: job for job in jobs}
+        for resume, results, expected in zip(resumes, recommended, scanned):
+            for job_id, score, _ in results:
+                assert score == matcher.calculate_ats_score(resume, jobs_by_id[job_id]), job_id
+            assert [score for _, score, _ in results] == expected[:len(results)], (results, expected)
+
+        print(f"{size:>7} {build_ms:>9.0f} {index_ms:>14.2f} {scan_ms:>14.1f} {scan_ms / index_ms:>7.0f}x")
+
+if __name__ == '__main__':
+    main()
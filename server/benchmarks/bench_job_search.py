@@ -0,0 +1,71 @@
+"""Time inverted-index job search against scanning every posting, by corpus size.
+
+Run from the server directory:
+    python -m benchmarks.bench_job_search --sizes 1000 10000 50000
+"""
+import argparse
+import random
+import time
+from datetime import datetime, timedelta
+from benchmarks.corpus import generate_jobs
+from services.job_search import JobSearchIndex, tokenize
+
+LOCATIONS = ['Berlin', 'Paris', 'London', 'Remote', 'New York', 'Bangalore', 'Toronto', 'Austin']
+
+QUERIES = ['python', 'react developer', 'kubernetes remote', 'pyth*', 'data berlin', 'aws docker production']
+
+def build_jobs(count, seed=11):
+    rng = random.Random(seed)
+    now = datetime.utcnow()
+    jobs = generate_jobs(count)
+    for index, job in enumerate(jobs):
+        job['_id'] = f'job{index}'
+        job['location'] = rng.choice(LOCATIONS)
+        job['created_at'] = now - timedelta(minutes=index)
+    return jobs
+
+def scan_search(jobs, query, limit=20):
+    """The client-side approach: look at every posting for each query"""
+    terms = [(term.rstrip('*'), term.endswith('*')) for term in query.lower().split()]
+    matches = []
+    for job in jobs:
+        words = set(tokenize(' '.join([job['title'], job['description'], job['location'], ' '.join(job['requiredSkills'])])))
+        if all(any(word.startswith(term) for word in words) if prefix else term in words for term, prefix in terms):
+            matches.append(job['_id'])
+    return len(matches), matches[:limit]
+
+def _average_ms(func, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat * 1000
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000, 50000])
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"{'jobs':>7} {'build ms':>9} {'update ms':>9} {'index ms/query':>15} {'scan ms/query':>14} {'speedup':>8}")
+    for size in args.sizes:
+        jobs = build_jobs(size)
+
+        start = time.perf_counter()
+        index = JobSearchIndex()
+        for job in jobs:
+            index.add(job)
+        build_ms = (time.perf_counter() - start) * 1000
+
+        # Both approaches must agree on which postings match
+        for query in QUERIES:
+            assert index.search(query, 0, size)[0] == scan_search(jobs, query)[0], query
+
+        update_ms = _average_ms(lambda: (index.remove(jobs[0]['_id']), index.add(jobs[0])), args.repeat)
+        index_ms = sum(_average_ms(lambda: index.search(query), args.repeat) for query in QUERIES) / len(QUERIES)
+        scan_repeat = max(1, args.repeat // 10)
+        scan_ms = sum(_average_ms(lambda: scan_search(jobs, query), scan_repeat) for query in QUERIES) / len(QUERIES)
+
+        print(f"{size:>7} {build_ms:>9.0f} {update_ms:>9.3f} {index_ms:>15.3f} {scan_ms:>14.1f} {scan_ms / index_ms:>7.0f}x")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,52 @@
+"""Time single-pass keyword frequency against the per-keyword regex loop.
+
+Equivalence of the two is covered by tests/test_keyword_frequency.py.
+
+Run from the server directory:
+    python -m benchmarks.bench_keyword_frequency --pages 10
+"""
+import argparse
+import re
+import time
+from benchmarks.corpus import generate_corpus
+from services.text_preprocessing import TextPreprocessor, count_whole_words
+
+def legacy_frequency(text, keywords):
+    """The original loop: one word-boundary findall per keyword"""
+    frequency = {}
+    text_lower = text.lower()
+    for keyword in keywords:
+        pattern = r'\b' + re.escape(keyword) + r'\b'
+        count = len(re.findall(pattern, text_lower))
+        if count > 0:
+            frequency[keyword] = count
+    return frequency
+
+def _best_time(func, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--pages', type=int, default=10, help='resume length, about 4 paragraphs per page')
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    preprocessor = TextPreprocessor()
+    for pages in sorted({1, args.pages}):
+        text = generate_corpus(1, paragraphs=pages * 4)[0]
+        keywords = preprocessor.extract_keywords(text)
+        assert count_whole_words(text.lower(), keywords) == legacy_frequency(text, keywords)
+
+        legacy_time = _best_time(lambda: legacy_frequency(text, keywords), args.repeat)
+        single_time = _best_time(lambda: count_whole_words(text.lower(), keywords), args.repeat)
+        print(f"{pages:>3} pages, {len(text):>6} chars, {len(keywords):>4} keywords: "
+              f"regex loop {legacy_time * 1000:8.2f} ms  single pass {single_time * 1000:6.2f} ms  "
+              f"speedup {legacy_time / single_time:6.1f}x")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,68 @@
+"""Peak memory and time of PDF text extraction for a large upload.
+
+Compares the original approach (copy the upload into BytesIO, then
+``text += page.extract_text()``) with the streaming extractor, with and
+without the page/character budgets. Run from the server directory:
+    python -m benchmarks.bench_pdf_extraction --size-mb 16
+"""
+import argparse
+import io
+import time
+import tracemalloc
+from PyPDF2 import PdfReader
+from benchmarks.corpus import generate_pdf
+from config import Config
+from services.resume_parser import read_pdf_text
+
+def legacy_extract(upload):
+    """The original app_simple.extract_text_from_pdf"""
+    file_content = upload.read()
+    upload.seek(0)
+    pdf_reader = PdfReader(io.BytesIO(file_content))
+    text = ""
+    for page in pdf_reader.pages:
+        text += page.extract_text() + "\n"
+    return text
+
+def streaming_unbounded(upload):
+    return read_pdf_text(upload, max_pages=10 ** 9, max_chars=10 ** 12)
+
+def streaming_budgeted(upload):
+    return read_pdf_text(upload)
+
+def measure(func, data):
+    """Return (seconds, peak traced bytes, extracted chars)"""
+    upload = io.BytesIO(data)
+    start = time.perf_counter()
+    text = func(upload)
+    seconds = time.perf_counter() - start
+
+    upload = io.BytesIO(data)
+    tracemalloc.start()
+    func(upload)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return seconds, peak, len(text)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--size-mb', type=float, default=16.0, help='approximate PDF size')
+    parser.add_argument('--skip-legacy', action='store_true')
+    args = parser.parse_args()
+
+    probe = generate_pdf(20)
+    page_count = max(1, int(args.size_mb * 1024 * 1024 / (len(probe) / 20)))
+    data = generate_pdf(page_count)
+    print(f"pdf: {len(data) / 1024 / 1024:.1f} MB, {page_count} pages "
+          f"(budget: {Config.MAX_RESUME_PAGES} pages / {Config.MAX_RESUME_CHARS} chars)")
+
+    candidates = [('streaming + budget', streaming_budgeted), ('streaming, no budget', streaming_unbounded)]
+    if not args.skip_legacy:
+        candidates.append(('legacy BytesIO + +=', legacy_extract))
+
+    for name, func in candidates:
+        seconds, peak, chars = measure(func, data)
+        print(f"{name:22s} {seconds:8.2f} s  peak {peak / 1024 / 1024:8.1f} MB  {chars:>10d} chars")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,167 @@
+"""Deterministic synthetic resume and job description generator for benchmarks"""
+import io
+import random
+from typing import List
+from services.skill_taxonomy import SKILL_NAMES
+
+FILLER_WORDS = [
+    'developed', 'designed', 'implemented', 'maintained', 'scalable', 'services',
+    'team', 'customers', 'platform', 'performance', 'improved', 'reduced', 'latency',
+    'delivered', 'features', 'production', 'collaborated', 'stakeholders', 'reliable',
+    'automated', 'pipelines', 'migrated', 'legacy', 'systems', 'architecture', 'data',
+    'analytics', 'reporting', 'mentored', 'engineers', 'owned', 'roadmap', 'quality',
+    'the', 'and', 'with', 'for', 'using', 'across', 'multiple', 'projects', 'in'
+]
+
+SECTION_HEADERS = ['SUMMARY', 'EXPERIENCE', 'EDUCATION', 'SKILLS', 'PROJECTS', 'CERTIFICATIONS']
+
+def _sentence(rng: random.Random, skills: List[str], skill_ratio: float) -> str:
+    words = []
+    for _ in range(rng.randint(8, 18)):
+        if rng.random() < skill_ratio:
+            words.append(rng.choice(skills))
+        else:
+            words.append(rng.choice(FILLER_WORDS))
+    return ' '.join(words).capitalize() + '.'
+
+def generate_resume(rng: random.Random, paragraphs: int = 6, skill_ratio: float = 0.1) -> str:
+    """Generate one resume-like document"""
+    skills = rng.sample(SKILL_NAMES, 25)
+    lines = [
+        'Jane Candidate',
+        'jane.candidate@example.com | +1 555-010-0199',
+    ]
+    for index in range(paragraphs):
+        lines.append('')
+        lines.append(SECTION_HEADERS[index % len(SECTION_HEADERS)])
+        for _ in range(rng.randint(3, 6)):
+            lines.append('- ' + _sentence(rng, skills, skill_ratio))
+    lines.append('')
+    lines.append(f'{rng.randint(1, 12)} years of experience, Bachelor of Computer Science')
+    return '\n'.join(lines)
+
+def generate_job_description(rng: random.Random, sentences: int = 8, skill_ratio: float = 0.15) -> str:
+    """Generate one job-description-like document"""
+    skills = rng.sample(SKILL_NAMES, 12)
+    return ' '.join(_sentence(rng, skills, skill_ratio) for _ in range(sentences))
+
+def generate_corpus(count: int, seed: int = 42, paragraphs: int = 6, skill_ratio: float = 0.1) -> List[str]:
+    """Generate a reproducible list of resumes"""
+    rng = random.Random(seed)
+    return [generate_resume(rng, paragraphs, skill_ratio) for _ in range(count)]
+
+def generate_pathological_resume(rng: random.Random) -> str:
+    """Generate a resume built to stress the parser: no line breaks, heading floods, huge tokens or misspellings"""
+    skills = rng.sample(SKILL_NAMES, 25)
+    kind = rng.randrange(5)
+    if kind == 0:
+        # One unbroken line, so no section headings are found
+        return ' '.join(_sentence(rng, skills, 0.2) for _ in range(150))
+    if kind == 1:
+        # Every other line looks like a heading
+        lines = []
+        for index in range(300):
+            lines.append(SECTION_HEADERS[index % len(SECTION_HEADERS)] + ':')
+            lines.append(_sentence(rng, skills, 0.1))
+        return '\n'.join(lines)
+    if kind == 2:
+        # Very long tokens and punctuation runs
+        words = [''.join(rng.choice('abcdefghijklmnopqrstuvwxyz') for _ in range(rng.randint(200, 2000)))
+                 for _ in range(20)]
+        return '\n'.join(words + ['.-/+#' * 2000, '(' * 500 + ')' * 500])
+    if kind == 3:
+        # Near-miss skill names for the typo-tolerant resolver
+        typos = []
+        for _ in range(800):
+            skill = rng.choice(skills)
+            position = rng.randrange(len(skill))
+            typos.append(skill[:position] + skill[position + 1:] if len(skill) > 3 else skill)
+        return ' '.join(typos)
+    # Non-ASCII text mixed with skills
+    words = ['résumé', 'développeur', 'Ärger', 'данные', '数据', 'ingeniería', '\u2022', '\u2014', '\u00a0']
+    return '\n'.join(' '.join(rng.choice(words + skills) for _ in range(20)) for _ in range(200))
+
+PROFILES = ('short', 'long', 'skills_dense', 'pathological')
+
+def generate_profile(profile: str, count: int, seed: int = 42) -> List[str]:
+    """Generate a reproducible list of resumes of one shape: short, long, skills_dense or pathological"""
+    rng = random.Random(seed)
+    if profile == 'short':
+        return [generate_resume(rng, paragraphs=2) for _ in range(count)]
+    if profile == 'long':
+        return [generate_resume(rng, paragraphs=40) for _ in range(count)]
+    if profile == 'skills_dense':
+        return [generate_resume(rng, skill_ratio=0.6) for _ in range(count)]
+    if profile == 'pathological':
+        return [generate_pathological_resume(rng) for _ in range(count)]
+    raise ValueError(f"Unknown profile: {profile}")
+
+def generate_jobs(count: int, seed: int = 7, sentences: int = 8) -> List[dict]:
+    """Generate a reproducible list of job postings shaped like stored job documents"""
+    rng = random.Random(seed)
+    jobs = []
+    for index in range(count):
+        description = generate_job_description(rng, sentences)
+        jobs.append({
+            'title': f'Engineer {index}',
+            'description': description,
+            'requiredSkills': rng.sample(SKILL_NAMES, rng.randint(0, 6))
+        })
+    return jobs
+
+def _pdf_escape(line: str) -> str:
+    return line.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)')
+
+def build_pdf(pages: List[str]) -> bytes:
+    """Build a minimal uncompressed PDF with one text page per string"""
+    objects = [
+        b'<< /Type /Catalog /Pages 2 0 R >>',
+        None,  # page tree, filled in once page object numbers are known
+        b'<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>',
+    ]
+    page_numbers = []
+
+    for page_text in pages:
+        lines = [b'BT /F1 10 Tf 12 TL 40 800 Td']
+        for line in page_text.split('\n'):
+            lines.append(f'({_pdf_escape(line)}) Tj T*'.encode('latin-1', 'replace'))
+        lines.append(b'ET')
+        stream = b'\n'.join(lines)
+        objects.append(b'<< /Length %d >>\nstream\n%s\nendstream' % (len(stream), stream))
+        content_number = len(objects)
+        objects.append(
+            b'<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 842] '
+            b'/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>' % content_number
+        )
+        page_numbers.append(len(objects))
+
+    kids = b' '.join(b'%d 0 R' % number for number in page_numbers)
+    objects[1] = b'<< /Type /Pages /Kids [%s] /Count %d >>' % (kids, len(page_numbers))
+
+    output = bytearray(b'%PDF-1.4\n')
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(output))
+        output += b'%d 0 obj\n%s\nendobj\n' % (number, body)
+
+    xref_offset = len(output)
+    output += b'xref\n0 %d\n0000000000 65535 f \n' % (len(objects) + 1)
+    for offset in offsets:
+        output += b'%010d 00000 n \n' % offset
+    output += b'trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n' % (len(objects) + 1, xref_offset)
+    return bytes(output)
+
+def generate_pdf(page_count: int, seed: int = 42, paragraphs_per_page: int = 4) -> bytes:
+    """Generate a reproducible multi-page resume PDF"""
+    rng = random.Random(seed)
+    return build_pdf([generate_resume(rng, paragraphs_per_page) for _ in range(page_count)])
+
+def build_docx(text: str) -> bytes:
+    """Build a DOCX file with one paragraph per line"""
+    import docx
+    document = docx.Document()
+    for line in text.split('\n'):
+        document.add_paragraph(line)
+    output = io.BytesIO()
+    document.save(output)
+    return output.getvalue()
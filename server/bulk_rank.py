@@ -0,0 +1,204 @@
+"""Rank a folder or zip of resumes against one job, outside the web flow.
+
+Examples (run from the server directory):
+    python bulk_rank.py --job-id 64f0c2... resumes/ --output ranked.csv
+    python bulk_rank.py --job-file job.json resumes.zip --output ranked.jsonl --workers 8
+
+Scored files are appended to ``<output>.progress.jsonl`` as they finish, so an
+interrupted run picks up where it stopped when started again.
+"""
+import argparse
+import csv
+import json
+import os
+import sys
+import tempfile
+import time
+import zipfile
+from multiprocessing import Pool
+from config import Config
+
+RESUME_EXTENSIONS = ('.pdf', '.doc', '.docx')
+
+CSV_FIELDS = [
+    'rank', 'file', 'ats_score', 'skill_match', 'keyword_match', 'experience_match',
+    'education_match', 'structure', 'match_percentage', 'matched_skills', 'missing_skills', 'error'
+]
+
+_job = None
+
+def load_job(args):
+    """Load the job posting from MongoDB or a JSON file"""
+    if args.job_file:
+        with open(args.job_file, encoding='utf-8') as file:
+            return json.load(file)
+
+    from pymongo import MongoClient
+    from models.job_model import Job
+
+    db = MongoClient(Config.MONGO_URI).get_default_database()
+    job = Job(db).get_job_by_id(args.job_id)
+    if not job:
+        raise SystemExit(f"Job not found: {args.job_id}")
+    return job
+
+def collect_resumes(source, extract_dir):
+    """List (key, path) pairs for every resume in a directory or zip archive"""
+    resumes = []
+
+    if zipfile.is_zipfile(source):
+        with zipfile.ZipFile(source) as archive:
+            for index, member in enumerate(archive.infolist()):
+                if member.is_dir() or not member.filename.lower().endswith(RESUME_EXTENSIONS):
+                    continue
+                # Flatten member names so archive paths cannot escape the temp dir
+                target = os.path.join(extract_dir, f"{index}_{os.path.basename(member.filename)}")
+                with archive.open(member) as src, open(target, 'wb') as dst:
+                    dst.write(src.read())
+                resumes.append((member.filename, target))
+    else:
+        for root, _, files in os.walk(source):
+            for name in sorted(files):
+                if name.lower().endswith(RESUME_EXTENSIONS):
+                    path = os.path.join(root, name)
+                    resumes.append((os.path.relpath(path, source), path))
+
+    return sorted(resumes)
+
+def load_keyword_stats(args):
+    """Load job keyword statistics for TF-IDF keyword scoring, when a database is used"""
+    if args.job_file:
+        return None
+
+    from pymongo import MongoClient
+    from services import keyword_stats
+
+    keyword_stats.init_app(MongoClient(Config.MONGO_URI).get_default_database())
+    return keyword_stats.get_snapshot()
+
+def _init_worker(job, stats_snapshot):
+    """Set up a ranking worker process"""
+    from services import keyword_stats
+
+    global _job
+    _job = job
+    keyword_stats.set_snapshot(stats_snapshot)
+    # Workers already run in parallel; nested extraction pools would oversubscribe
+    Config.EXTRACTION_WORKERS = 0
+
+def _score_resume(item):
+    """Parse and score a single resume"""
+    from services.resume_parser import ResumeParser
+    from services.skill_matcher import SkillMatcher
+
+    key, path = item
+    result = {'file': key}
+
+    resume_data = ResumeParser().parse_resume(path)
+    if 'error' in resume_data:
+        result.update({'ats_score': 0, 'error': resume_data['error']})
+        return result
+
+    analysis = SkillMatcher().analyze_match(resume_data, _job)
+    if 'error' in analysis:
+        result.update({'ats_score': 0, 'error': analysis['error']})
+        return result
+
+    # Parts are computed as they are read; recommendations are never built here
+    try:
+        result.update({
+            'ats_score': analysis['ats_score'],
+            **analysis['score_breakdown'],
+            'match_percentage': round(analysis['match_details']['match_percentage'], 1),
+            'matched_skills': analysis['skill_analysis']['matched_skills'],
+            'missing_skills': analysis['skill_analysis']['missing_skills']
+        })
+    except KeyError:
+        # A part failed to compute; the result now carries its error
+        result.update({'ats_score': 0, 'error': analysis['error']})
+    return result
+
+def load_progress(progress_path):
+    """Read results already written by a previous run"""
+    results = {}
+    if not os.path.exists(progress_path):
+        return results
+
+    with open(progress_path, encoding='utf-8') as file:
+        for line in file:
+            try:
+                result = json.loads(line)
+            except ValueError:
+                continue  # Partially written last line of an interrupted run
+            results[result['file']] = result
+    return results
+
+def write_ranking(results, output_path, output_format):
+    """Write results sorted by score, best first"""
+    ranked = sorted(results, key=lambda result: (-result.get('ats_score', 0), result['file']))
+
+    with open(output_path, 'w', encoding='utf-8', newline='') as file:
+        if output_format == 'jsonl':
+            for rank, result in enumerate(ranked, start=1):
+                file.write(json.dumps({'rank': rank, **result}) + '\n')
+            return
+
+        writer = csv.DictWriter(file, fieldnames=CSV_FIELDS, extrasaction='ignore')
+        writer.writeheader()
+        for rank, result in enumerate(ranked, start=1):
+            row = {'rank': rank, **result}
+            row['matched_skills'] = ';'.join(result.get('matched_skills', []))
+            row['missing_skills'] = ';'.join(result.get('missing_skills', []))
+            writer.writerow(row)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Rank resumes against a job posting')
+    job_group = parser.add_mutually_exclusive_group(required=True)
+    job_group.add_argument('--job-id', help='MongoDB id of the job')
+    job_group.add_argument('--job-file', help='JSON file with title, description and requiredSkills')
+    parser.add_argument('source', help='directory or zip archive of PDF/DOCX resumes')
+    parser.add_argument('--output', required=True, help='ranked output file (.csv or .jsonl)')
+    parser.add_argument('--format', choices=['csv', 'jsonl'], help='output format (default: from extension)')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+    parser.add_argument('--restart', action='store_true', help='ignore progress from a previous run')
+    args = parser.parse_args(argv)
+
+    output_format = args.format or ('jsonl' if args.output.endswith('.jsonl') else 'csv')
+    progress_path = args.output + '.progress.jsonl'
+    if args.restart and os.path.exists(progress_path):
+        os.remove(progress_path)
+
+    job = load_job(args)
+    stats_snapshot = load_keyword_stats(args)
+    results = load_progress(progress_path)
+
+    with tempfile.TemporaryDirectory(prefix='bulk_rank_') as extract_dir:
+        resumes = collect_resumes(args.source, extract_dir)
+        pending = [item for item in resumes if item[0] not in results]
+        print(f"{len(resumes)} resumes found, {len(resumes) - len(pending)} already scored, "
+              f"{len(pending)} to score with {args.workers} workers", file=sys.stderr)
+
+        start = time.perf_counter()
+        with open(progress_path, 'a', encoding='utf-8') as progress, \
+                Pool(args.workers, initializer=_init_worker, initargs=(job, stats_snapshot)) as pool:
+            for done, result in enumerate(pool.imap_unordered(_score_resume, pending, chunksize=4), start=1):
+                progress.write(json.dumps(result) + '\n')
+                progress.flush()
+                results[result['file']] = result
+
+                if done % 50 == 0 or done == len(pending):
+                    elapsed = time.perf_counter() - start
+                    print(f"  {done}/{len(pending)} scored, {done / elapsed:.1f} resumes/s", file=sys.stderr)
+
+        elapsed = time.perf_counter() - start
+
+    # Only rank files that are still in the source
+    current = {key for key, _ in resumes}
+    write_ranking([result for key, result in results.items() if key in current], args.output, output_format)
+
+    rate = len(pending) / elapsed if elapsed > 0 and pending else 0.0
+    print(f"Wrote {len(current)} ranked resumes to {args.output} "
+          f"({len(pending)} scored in {elapsed:.1f}s, {rate:.1f} resumes/s)", file=sys.stderr)
+
+if __name__ == '__main__':
+    main()
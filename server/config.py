@@ -16,6 +16,44 @@ class Config:
     UPLOAD_FOLDER = os.getenv('UPLOAD_FOLDER', 'uploads')
     MAX_CONTENT_LENGTH = 16 * 1024 * 1024  # 16MB max file size
     
+    # Resume Text Budgets (text beyond these adds nothing to scoring)
+    MAX_RESUME_PAGES = int(os.getenv('MAX_RESUME_PAGES', '30'))
+    MAX_RESUME_CHARS = int(os.getenv('MAX_RESUME_CHARS', '200000'))
+    
+    # Resume Parse Cache Configuration
+    PARSE_CACHE_SIZE = int(os.getenv('PARSE_CACHE_SIZE', '256'))
+    
+    # Text Extraction Pool Configuration (0 workers extracts in the request thread)
+    EXTRACTION_WORKERS = int(os.getenv('EXTRACTION_WORKERS', '2'))
+    EXTRACTION_QUEUE_LIMIT = int(os.getenv('EXTRACTION_QUEUE_LIMIT', '16'))
+    EXTRACTION_QUEUE_TIMEOUT = float(os.getenv('EXTRACTION_QUEUE_TIMEOUT', '5'))
+    EXTRACTION_TIMEOUT = float(os.getenv('EXTRACTION_TIMEOUT', '60'))
+    # Seconds clients are told to wait before retrying when extraction is saturated
+    EXTRACTION_RETRY_AFTER = int(os.getenv('EXTRACTION_RETRY_AFTER', '10'))
+    
+    # Application Scoring Configuration ('sync' scores before responding, 'async' returns 202)
+    SCORING_MODE = os.getenv('SCORING_MODE', 'sync').lower()
+    SCORING_WORKERS = int(os.getenv('SCORING_WORKERS', '4'))
+    # Seconds after which an application still waiting or being scored is queued again
+    SCORING_STALE_AFTER = float(os.getenv('SCORING_STALE_AFTER', '600'))
+    
+    # Job Search Index (seconds between pulls of jobs changed by other processes)
+    JOB_SEARCH_REFRESH = float(os.getenv('JOB_SEARCH_REFRESH', '30'))
+    
+    # Keyword Statistics (seconds before reloading job keyword frequencies written by other processes)
+    KEYWORD_STATS_TTL = float(os.getenv('KEYWORD_STATS_TTL', '300'))
+    
+    # Rescoring after job edits (applications per bulk write, seconds to pause between batches)
+    RESCORE_BATCH_SIZE = int(os.getenv('RESCORE_BATCH_SIZE', '200'))
+    RESCORE_BATCH_DELAY = float(os.getenv('RESCORE_BATCH_DELAY', '0.05'))
+    
+    # Match Score Cache Configuration (TTL in seconds also bounds drift from keyword statistics)
+    MATCH_CACHE_SIZE = int(os.getenv('MATCH_CACHE_SIZE', '4096'))
+    MATCH_CACHE_TTL = int(os.getenv('MATCH_CACHE_TTL', '3600'))
+    
+    # Near-Duplicate Detection (estimated Jaccard similarity of resume shingles)
+    NEAR_DUPLICATE_THRESHOLD = float(os.getenv('NEAR_DUPLICATE_THRESHOLD', '0.8'))
+    
     # CORS Configuration
     CORS_ORIGINS = os.getenv('CORS_ORIGINS', 'http://localhost:5173').split(',')
     
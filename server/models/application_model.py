@@ -1,11 +1,24 @@
-from pymongo import MongoClient
+from pymongo import MongoClient, ASCENDING, DESCENDING
 from bson import ObjectId
-from datetime import datetime
+from datetime import datetime, timedelta
+from config import Config
+from services.minhash import estimated_similarity, find_near_duplicates, lsh_bands
+from services.skill_bitmap import bitmap_query, decode_skill_ids, skill_bitmap
+from services.skill_taxonomy import SKILLS_BY_ID
 
 class Application:
     def __init__(self, db):
         self.collection = db.applications
-        
+    
+    def ensure_indexes(self):
+        """Create indexes used by application queries"""
+        # Multikey index over LSH band keys for near-duplicate lookups
+        self.collection.create_index('lshBands')
+        # Top-K ranking per job, with and without a status filter; _id breaks score ties for cursors
+        self.collection.create_index([('jobId', ASCENDING), ('matchScore', DESCENDING), ('_id', DESCENDING)])
+        self.collection.create_index([('jobId', ASCENDING), ('status', ASCENDING),
+                                      ('matchScore', DESCENDING), ('_id', DESCENDING)])
+    
     def create_application(self, application_data):
         """Create a new job application"""
         app_doc = {
@@ -18,6 +31,9 @@ class Application:
             'resumeUrl': application_data.get('resumeUrl'),
             'status': 'pending',  # pending, accepted, rejected
             'matchScore': application_data.get('matchScore', 0),
+            'scoringStatus': application_data.get('scoringStatus', 'completed'),  # pending, processing, completed, failed
+            'resumeFeatures': application_data.get('resumeFeatures'),
+            **self.resume_index_fields(application_data.get('resumeFeatures')),
             'appliedDate': datetime.utcnow(),
             'created_at': datetime.utcnow(),
             'updated_at': datetime.utcnow()
@@ -37,6 +53,7 @@ class Application:
                 'as': 'job'
             }},
             {'$unwind': '$job'},
+            {'$project': {'job.features': 0, 'resumeFeatures': 0, 'minhash': 0, 'lshBands': 0, 'skillBitmap': 0}},
             {'$sort': {'appliedDate': -1}}
         ]
         
@@ -60,6 +77,7 @@ class Application:
                 'as': 'job'
             }},
             {'$unwind': '$job'},
+            {'$project': {'job.features': 0, 'resumeFeatures': 0, 'lshBands': 0, 'skillBitmap': 0}},
             {'$match': {'job.companyId': ObjectId(company_id)}},
             {'$lookup': {
                 'from': 'users',
@@ -68,6 +86,8 @@ class Application:
                 'as': 'candidate'
             }},
             {'$unwind': '$candidate'},
+            {'$project': {'candidate.password': 0, 'candidate.resumeFeatures': 0, 'candidate.skillBitmap': 0,
+                          'candidate.profile.resumeFeatures': 0, 'candidate.profile.skillBitmap': 0}},
             {'$sort': {'appliedDate': -1}}
         ]
         
@@ -80,6 +100,19 @@ class Application:
             app['job']['companyId'] = str(app['job']['companyId'])
             app['candidate']['_id'] = str(app['candidate']['_id'])
         
+        # Flag near-identical resumes among the company's applications
+        duplicates = find_near_duplicates([app.pop('minhash', None) for app in applications], Config.NEAR_DUPLICATE_THRESHOLD)
+        for index, app in enumerate(applications):
+            app['possibleDuplicates'] = [
+                {
+                    'applicationId': applications[other]['_id'],
+                    'candidateName': applications[other]['candidateName'],
+                    'jobTitle': applications[other]['job'].get('title'),
+                    'similarity': round(similarity, 2)
+                }
+                for other, similarity in sorted(duplicates.get(index, []), key=lambda item: -item[1])
+            ]
+        
         return applications
     
     def get_application_by_id(self, application_id):
@@ -93,13 +126,16 @@ class Application:
                 'as': 'job'
             }},
             {'$unwind': '$job'},
+            {'$project': {'job.features': 0, 'resumeFeatures': 0, 'minhash': 0, 'lshBands': 0, 'skillBitmap': 0}},
             {'$lookup': {
                 'from': 'users',
                 'localField': 'candidateId',
                 'foreignField': '_id',
                 'as': 'candidate'
             }},
-            {'$unwind': '$candidate'}
+            {'$unwind': '$candidate'},
+            {'$project': {'candidate.password': 0, 'candidate.resumeFeatures': 0, 'candidate.skillBitmap': 0,
+                          'candidate.profile.resumeFeatures': 0, 'candidate.profile.skillBitmap': 0}}
         ]
         
         result = list(self.collection.aggregate(pipeline))
@@ -122,6 +158,147 @@ class Application:
         )
         return result.modified_count > 0
     
+    def claim_scoring(self, application_id, stale_after):
+        """Mark a pending or stalled application as being scored; False if someone else is scoring it"""
+        stalled_before = datetime.utcnow() - timedelta(seconds=stale_after)
+        result = self.collection.update_one(
+            {'_id': ObjectId(application_id), '$or': [
+                {'scoringStatus': 'pending'},
+                {'scoringStatus': 'processing', 'updated_at': {'$lt': stalled_before}}
+            ]},
+            {'$set': {'scoringStatus': 'processing', 'updated_at': datetime.utcnow()}}
+        )
+        return result.modified_count > 0
+    
+    def update_score(self, application_id, match_score, scoring_status='completed', resume_features=None):
+        """Store the computed match score and the resume features it was computed from"""
+        update = {
+            'matchScore': match_score,
+            'scoringStatus': scoring_status,
+            'updated_at': datetime.utcnow()
+        }
+        if resume_features is not None:
+            update['resumeFeatures'] = resume_features
+            update.update(self.resume_index_fields(resume_features))
+        
+        result = self.collection.update_one(
+            {'_id': ObjectId(application_id)},
+            {'$set': update}
+        )
+        return result.modified_count > 0
+    
+    def get_scoring_status(self, application_id):
+        """Get match score and scoring status of an application"""
+        return self.collection.find_one(
+            {'_id': ObjectId(application_id)},
+            {'candidateId': 1, 'jobId': 1, 'matchScore': 1, 'scoringStatus': 1}
+        )
+    
+    def get_pending_scoring(self, stale_after, pending_after=0):
+        """Get applications pending for pending_after seconds, and those stuck in processing for stale_after"""
+        now = datetime.utcnow()
+        return list(self.collection.find(
+            {'$or': [
+                {'scoringStatus': 'pending', 'updated_at': {'$lte': now - timedelta(seconds=pending_after)}},
+                # Left behind by a process that stopped while scoring them
+                {'scoringStatus': 'processing', 'updated_at': {'$lt': now - timedelta(seconds=stale_after)}}
+            ]},
+            {'jobId': 1, 'resumeUrl': 1}
+        ))
+    
+    def get_near_duplicates(self, application_id, job_ids, threshold):
+        """Find applications to the given jobs whose resume nearly matches this one"""
+        application = self.collection.find_one({'_id': ObjectId(application_id)}, {'minhash': 1, 'lshBands': 1})
+        if not application or not application.get('lshBands'):
+            return []
+        
+        # Band keys narrow the search to likely matches through the index
+        candidates = self.collection.find(
+            {
+                '_id': {'$ne': application['_id']},
+                'jobId': {'$in': [ObjectId(job_id) for job_id in job_ids]},
+                'lshBands': {'$in': application['lshBands']}
+            },
+            {'candidateId': 1, 'candidateName': 1, 'jobId': 1, 'minhash': 1}
+        )
+        
+        duplicates = []
+        for candidate in candidates:
+            similarity = estimated_similarity(application['minhash'], candidate.get('minhash'))
+            if similarity >= threshold:
+                duplicates.append({
+                    'applicationId': str(candidate['_id']),
+                    'candidateId': str(candidate['candidateId']),
+                    'candidateName': candidate['candidateName'],
+                    'jobId': str(candidate['jobId']),
+                    'similarity': round(similarity, 2)
+                })
+        
+        return sorted(duplicates, key=lambda duplicate: -duplicate['similarity'])
+    
+    def filter_by_skills(self, job_ids, all_skill_ids=(), any_skill_ids=()):
+        """Get compact applications to the given jobs whose resume has all of all_skill_ids and any of any_skill_ids"""
+        query = {'jobId': {'$in': [ObjectId(job_id) for job_id in job_ids]}}
+        query.update(bitmap_query('skillBitmap', all_skill_ids, any_skill_ids))
+        
+        applications = list(self.collection.find(
+            query,
+            {'candidateId': 1, 'jobId': 1, 'candidateName': 1, 'email': 1, 'status': 1,
+             'matchScore': 1, 'scoringStatus': 1, 'appliedDate': 1, 'skillBitmap': 1}
+        ).sort('appliedDate', -1))
+        for app in applications:
+            app['_id'] = str(app['_id'])
+            app['candidateId'] = str(app['candidateId'])
+            app['jobId'] = str(app['jobId'])
+            app['skills'] = [SKILLS_BY_ID[skill_id].label for skill_id in decode_skill_ids(app.pop('skillBitmap', None))]
+        
+        return applications
+    
+    def get_top_applications(self, job_id, limit, statuses=None, cursor=None):
+        """Get a job's highest scoring applications after a cursor; returns (applications, next cursor)"""
+        query = {'jobId': ObjectId(job_id), 'matchScore': {'$ne': None}}
+        if statuses:
+            query['status'] = {'$in': list(statuses)}
+        if cursor:
+            # Keyset pagination: continue below the last (score, id) returned
+            score, last_id = self._decode_cursor(cursor)
+            query['$or'] = [
+                {'matchScore': {'$lt': score}},
+                {'matchScore': score, '_id': {'$lt': last_id}}
+            ]
+        
+        applications = list(self.collection.find(
+            query,
+            {'candidateId': 1, 'jobId': 1, 'candidateName': 1, 'email': 1, 'degree': 1, 'experience': 1,
+             'status': 1, 'matchScore': 1, 'appliedDate': 1}
+        ).sort([('matchScore', DESCENDING), ('_id', DESCENDING)]).limit(limit + 1))
+        
+        next_cursor = None
+        if len(applications) > limit:
+            applications = applications[:limit]
+            last = applications[-1]
+            next_cursor = f"{last['matchScore']}:{last['_id']}"
+        
+        for app in applications:
+            app['_id'] = str(app['_id'])
+            app['candidateId'] = str(app['candidateId'])
+            app['jobId'] = str(app['jobId'])
+        
+        return applications, next_cursor
+    
+    def _decode_cursor(self, cursor):
+        """Split a ranking cursor into its score and application id; ValueError if malformed"""
+        score, _, last_id = cursor.partition(':')
+        if not ObjectId.is_valid(last_id):
+            raise ValueError('Invalid cursor')
+        score = float(score)
+        return (int(score) if score.is_integer() else score), ObjectId(last_id)
+    
+    def resume_index_fields(self, resume_features):
+        """MinHash signature and LSH band keys for near-duplicate detection, and the skill bitmap for filtering"""
+        signature = (resume_features or {}).get('minhash')
+        return {'minhash': signature, 'lshBands': lsh_bands(signature), 'skillBitmap': skill_bitmap(resume_features)}
+    
     def check_existing_application(self, candidate_id, job_id):
         """Check if candidate has already applied to this job"""
         return self.collection.find_one({
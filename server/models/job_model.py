@@ -1,10 +1,15 @@
-from pymongo import MongoClient
+from pymongo import MongoClient, ReturnDocument, UpdateOne
 from bson import ObjectId
 from datetime import datetime
+from services import job_recommender, job_search, keyword_stats, rescoring
+from services.job_features import JOB_FEATURES_VERSION, build_job_features, get_job_features, has_current_features
+from services.match_cache import MatchScoreCache
 
 class Job:
     def __init__(self, db):
+        self.db = db
         self.collection = db.jobs
+        self.match_scores = MatchScoreCache(db)
         
     def create_job(self, job_data, company_id):
         """Create a new job posting"""
@@ -23,31 +28,56 @@ class Job:
             'created_at': datetime.utcnow(),
             'updated_at': datetime.utcnow()
         }
+        job_doc['features'] = build_job_features(job_doc)
         
         result = self.collection.insert_one(job_doc)
+        keyword_stats.record_change(added=job_doc['features']['keywords'], documents=1)
+        job_search.index_job(job_doc)
+        job_recommender.index_job(job_doc)
         return str(result.inserted_id)
     
     def get_all_jobs(self, status='active'):
         """Get all active job postings"""
-        jobs = list(self.collection.find({'status': status}).sort('created_at', -1))
+        jobs = list(self.collection.find({'status': status}, {'features': 0}).sort('created_at', -1))
         for job in jobs:
             job['_id'] = str(job['_id'])
             job['companyId'] = str(job['companyId'])
             job['postedDate'] = self._format_date(job['created_at'])
         return jobs
     
-    def get_job_by_id(self, job_id):
+    def get_job_by_id(self, job_id, include_features=True):
         """Get job by ID"""
-        job = self.collection.find_one({'_id': ObjectId(job_id)})
+        projection = None if include_features else {'features': 0}
+        job = self.collection.find_one({'_id': ObjectId(job_id)}, projection)
+        if job and include_features and not has_current_features(job):
+            # Posted before the current feature version: rebuild the block once and keep it
+            job['features'] = build_job_features(job)
+            self._store_features([job])
         if job:
             job['_id'] = str(job['_id'])
             job['companyId'] = str(job['companyId'])
             job['postedDate'] = self._format_date(job['created_at'])
         return job
     
+    def get_jobs_by_ids(self, job_ids):
+        """Get jobs by ID, in the order given"""
+        jobs = {
+            str(job['_id']): job
+            for job in self.collection.find({'_id': {'$in': [ObjectId(job_id) for job_id in job_ids]}}, {'features': 0})
+        }
+        ordered = []
+        for job_id in job_ids:
+            job = jobs.get(str(job_id))
+            if job:
+                job['_id'] = str(job['_id'])
+                job['companyId'] = str(job['companyId'])
+                job['postedDate'] = self._format_date(job['created_at'])
+                ordered.append(job)
+        return ordered
+    
     def get_company_jobs(self, company_id):
         """Get all jobs posted by a company"""
-        jobs = list(self.collection.find({'companyId': ObjectId(company_id)}).sort('created_at', -1))
+        jobs = list(self.collection.find({'companyId': ObjectId(company_id)}, {'features': 0}).sort('created_at', -1))
         for job in jobs:
             job['_id'] = str(job['_id'])
             job['companyId'] = str(job['companyId'])
@@ -68,20 +98,74 @@ class Job:
             'hrContact': job_data.get('hrContact', ''),
             'updated_at': datetime.utcnow()
         }
+        update_data['features'] = build_job_features(update_data)
         
-        result = self.collection.update_one(
+        previous = self.collection.find_one_and_update(
             {'_id': ObjectId(job_id), 'companyId': ObjectId(company_id)},
-            {'$set': update_data}
+            {'$set': update_data},
+            return_document=ReturnDocument.BEFORE
         )
-        return result.modified_count > 0
+        if not previous:
+            return False
+        
+        # Only active postings count towards keyword statistics
+        if previous.get('status') == 'active':
+            keyword_stats.record_change(
+                added=update_data['features']['keywords'],
+                removed=get_job_features(previous)['keywords']
+            )
+        job_search.index_job({**previous, **update_data})
+        job_recommender.index_job({**previous, **update_data})
+        self.match_scores.invalidate_job(job_id)
+        
+        # Stored match scores only go stale when the scoring inputs changed
+        if self._scoring_inputs(update_data['features']) != self._scoring_inputs(get_job_features(previous)):
+            rescoring.submit_job_rescoring(self.db, job_id)
+        return True
     
     def delete_job(self, job_id, company_id):
         """Delete a job posting (soft delete by setting status to inactive)"""
-        result = self.collection.update_one(
+        previous = self.collection.find_one_and_update(
             {'_id': ObjectId(job_id), 'companyId': ObjectId(company_id)},
-            {'$set': {'status': 'inactive', 'updated_at': datetime.utcnow()}}
+            {'$set': {'status': 'inactive', 'updated_at': datetime.utcnow()}},
+            return_document=ReturnDocument.BEFORE
         )
-        return result.modified_count > 0
+        if not previous:
+            return False
+        
+        if previous.get('status') == 'active':
+            keyword_stats.record_change(removed=get_job_features(previous)['keywords'], documents=-1)
+        job_search.remove_job(job_id)
+        job_recommender.remove_job(job_id)
+        self.match_scores.invalidate_job(job_id)
+        return True
+    
+    def backfill_features(self, batch_size=500):
+        """Store current feature blocks on every job that lacks one; returns how many were written"""
+        written = 0
+        batch = []
+        for job in self.collection.find({'features.version': {'$ne': JOB_FEATURES_VERSION}}):
+            job['features'] = build_job_features(job)
+            batch.append(job)
+            if len(batch) >= batch_size:
+                written += self._store_features(batch)
+                batch = []
+        if batch:
+            written += self._store_features(batch)
+        return written
+    
+    def _store_features(self, jobs):
+        """Write rebuilt feature blocks back, unless the job was edited since it was read"""
+        operations = [
+            UpdateOne({'_id': ObjectId(job['_id']), 'updated_at': job.get('updated_at')},
+                      {'$set': {'features': job['features']}})
+            for job in jobs
+        ]
+        return self.collection.bulk_write(operations, ordered=False).modified_count
+    
+    def _scoring_inputs(self, features):
+        """Parts of a feature block that affect match scores"""
+        return features['skills'], features['keywords'], features.get('termFrequencies')
     
     def _format_date(self, date):
         """Format date for display"""
@@ -2,6 +2,10 @@ from pymongo import MongoClient
 from bson import ObjectId
 from datetime import datetime
 import bcrypt
+from services.skill_bitmap import skill_bitmap
+
+# Derived from the uploaded resume on the server, never taken from client input
+SERVER_FIELDS = ('resumeFeatures', 'skillBitmap')
 
 class User:
     def __init__(self, db):
@@ -54,6 +58,7 @@ class User:
     
     def update_profile(self, user_id, profile_data):
         """Update user profile"""
+        profile_data = {key: value for key, value in profile_data.items() if key not in SERVER_FIELDS}
         update_data = {
             'profile': profile_data,
             'updated_at': datetime.utcnow()
@@ -65,6 +70,27 @@ class User:
         )
         return result.modified_count > 0
     
+    def update_resume_features(self, user_id, resume_features):
+        """Store the feature record of the candidate's profile resume and its skill bitmap"""
+        # Kept outside the profile, which clients can overwrite
+        result = self.collection.update_one(
+            {'_id': ObjectId(user_id)},
+            {'$set': {
+                'resumeFeatures': resume_features,
+                'skillBitmap': skill_bitmap(resume_features),
+                'updated_at': datetime.utcnow()
+            }}
+        )
+        return result.modified_count > 0
+    
+    def public_profile(self, user):
+        """Profile fields safe to return to clients"""
+        profile = dict(user.get('profile', {}))
+        # Older versions stored these inside the profile
+        for field in SERVER_FIELDS:
+            profile.pop(field, None)
+        return profile
+    
     def email_exists(self, email):
         """Check if email already exists"""
         return self.collection.find_one({'email': email.lower()}) is not None
\ No newline at end of file
@@ -2,16 +2,26 @@ from flask import Blueprint, request, jsonify, current_app
 from flask_jwt_extended import jwt_required, get_jwt_identity
 from werkzeug.utils import secure_filename
 import os
+from config import Config
 from models.application_model import Application
 from models.user_model import User
 from models.job_model import Job
-from services.resume_parser import ResumeParser
-from services.skill_matcher import SkillMatcher
+from services.extraction_pool import ExtractionUnavailable
+from services.match_cache import MatchScoreCache
+from services.parse_cache import ParseCache
+from services.resume_features import build_resume_features, load_profile_resume_data, to_resume_data
+from services.skill_bitmap import resolve_skill_query
+from services import scoring_worker
+from utils.error_helper import extraction_unavailable
+from utils.match_helper import get_match
 
 application_bp = Blueprint('applications', __name__)
 
 ALLOWED_EXTENSIONS = {'pdf', 'doc', 'docx'}
 
+# Most applications one ranking page may return
+MAX_RANKING_LIMIT = 100
+
 def allowed_file(filename):
     return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
 
@@ -52,7 +62,9 @@ def apply_to_job():
             return jsonify({'error': 'You have already applied to this job'}), 400
         
         resume_url = None
+        resume_features = None
         match_score = 0
+        scoring_status = 'completed'
         
         # Handle resume upload if provided
         if 'resume' in request.files:
@@ -63,13 +75,37 @@ def apply_to_job():
                 file.save(file_path)
                 resume_url = file_path
                 
-                # Calculate match score
+                if scoring_worker.is_async():
+                    # Score in the background once the application is stored
+                    match_score = None
+                    scoring_status = 'pending'
+                else:
+                    # Calculate match score
+                    try:
+                        resume_data = ParseCache(current_app.db).parse(file_path)
+                        if 'error' not in resume_data:
+                            resume_features = build_resume_features(resume_data)
+                            resume_data = to_resume_data(resume_features)
+                        
+                        match_score = MatchScoreCache(current_app.db).get_score(
+                            resume_data, job, lambda: get_match(resume_data, job).get('ats_score', 0)
+                        )
+                    except ExtractionUnavailable:
+                        raise
+                    except Exception as e:
+                        print(f"Error calculating match score: {e}")
+                        match_score = 0
+        else:
+            # No new file: score the profile resume from its stored feature record
+            resume_data = load_profile_resume_data(current_app.db, user)
+            if resume_data is not None:
                 try:
-                    parser = ResumeParser()
-                    resume_data = parser.parse_resume(file_path)
-                    
-                    matcher = SkillMatcher()
-                    match_score = matcher.calculate_ats_score(resume_data, job)
+                    resume_features = resume_data.get('features')
+                    match_score = MatchScoreCache(current_app.db).get_score(
+                        resume_data, job, lambda: get_match(resume_data, job).get('ats_score', 0)
+                    )
+                except ExtractionUnavailable:
+                    raise
                 except Exception as e:
                     print(f"Error calculating match score: {e}")
                     match_score = 0
@@ -83,17 +119,31 @@ def apply_to_job():
             'degree': degree,
             'experience': experience,
             'resumeUrl': resume_url,
-            'matchScore': match_score
+            'matchScore': match_score,
+            'scoringStatus': scoring_status,
+            'resumeFeatures': resume_features
         }
         
         application_id = application_model.create_application(application_data)
         
+        if scoring_status == 'pending':
+            scoring_worker.submit_application_scoring(current_app.db, application_id, resume_url, job_id)
+            return jsonify({
+                'message': 'Application submitted successfully, match score is being calculated',
+                'application_id': application_id,
+                'match_score': None,
+                'scoring_status': scoring_status
+            }), 202
+        
         return jsonify({
             'message': 'Application submitted successfully',
             'application_id': application_id,
-            'match_score': match_score
+            'match_score': match_score,
+            'scoring_status': scoring_status
         }), 201
         
+    except ExtractionUnavailable as e:
+        return extraction_unavailable(e)
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -139,6 +189,92 @@ def get_company_applications():
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+@application_bp.route('/company/filter', methods=['GET'])
+@jwt_required()
+def filter_company_applications():
+    try:
+        user_id = get_jwt_identity()
+        
+        # Verify user is a company
+        user_model = User(current_app.db)
+        user = user_model.find_by_id(user_id)
+        
+        if not user or user['role'] != 'company':
+            return jsonify({'error': 'Only companies can access this endpoint'}), 403
+        
+        # Comma-separated skill names or aliases: ?all=python,kubernetes&any=react,vue
+        all_skill_ids, unknown_all = resolve_skill_query(request.args.get('all', '').split(','))
+        any_skill_ids, unknown_any = resolve_skill_query(request.args.get('any', '').split(','))
+        unknown = unknown_all + unknown_any
+        if unknown:
+            return jsonify({'error': f"Unknown skills: {', '.join(unknown)}"}), 400
+        
+        job_model = Job(current_app.db)
+        company_jobs = job_model.get_company_jobs(user_id)
+        job_id = request.args.get('job_id')
+        if job_id:
+            company_jobs = [job for job in company_jobs if job['_id'] == job_id]
+            if not company_jobs:
+                return jsonify({'error': 'Job not found'}), 404
+        
+        application_model = Application(current_app.db)
+        applications = application_model.filter_by_skills(
+            [job['_id'] for job in company_jobs], all_skill_ids, any_skill_ids
+        )
+        
+        job_titles = {job['_id']: job['title'] for job in company_jobs}
+        for app in applications:
+            app['jobTitle'] = job_titles.get(app['jobId'])
+        
+        return jsonify(applications), 200
+        
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@application_bp.route('/job/<job_id>/top', methods=['GET'])
+@jwt_required()
+def get_top_applications(job_id):
+    try:
+        user_id = get_jwt_identity()
+        
+        # Verify user is a company and owns the job
+        user_model = User(current_app.db)
+        user = user_model.find_by_id(user_id)
+        
+        if not user or user['role'] != 'company':
+            return jsonify({'error': 'Only companies can rank applications'}), 403
+        
+        job_model = Job(current_app.db)
+        job = job_model.get_job_by_id(job_id, include_features=False)
+        if not job or job['companyId'] != user_id:
+            return jsonify({'error': 'Job not found or unauthorized'}), 404
+        
+        try:
+            limit = min(max(int(request.args.get('limit', 20)), 1), MAX_RANKING_LIMIT)
+        except ValueError:
+            return jsonify({'error': 'limit must be a number'}), 400
+        
+        statuses = [status for status in request.args.get('status', '').split(',') if status]
+        if any(status not in ['pending', 'accepted', 'rejected'] for status in statuses):
+            return jsonify({'error': 'Invalid status'}), 400
+        
+        application_model = Application(current_app.db)
+        try:
+            applications, next_cursor = application_model.get_top_applications(
+                job_id, limit, statuses, request.args.get('cursor')
+            )
+        except ValueError:
+            return jsonify({'error': 'Invalid cursor'}), 400
+        
+        return jsonify({
+            'job_id': job_id,
+            'applications': applications,
+            'next_cursor': next_cursor
+        }), 200
+        
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
 @application_bp.route('/<application_id>', methods=['GET'])
 @jwt_required()
 def get_application(application_id):
@@ -165,6 +301,77 @@ def get_application(application_id):
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+@application_bp.route('/<application_id>/score', methods=['GET'])
+@jwt_required()
+def get_application_score(application_id):
+    try:
+        user_id = get_jwt_identity()
+        
+        application_model = Application(current_app.db)
+        application = application_model.get_scoring_status(application_id)
+        
+        if not application:
+            return jsonify({'error': 'Application not found'}), 404
+        
+        # Check if user has permission to view this application
+        user_model = User(current_app.db)
+        user = user_model.find_by_id(user_id)
+        
+        if not user:
+            return jsonify({'error': 'User not found'}), 404
+        
+        if user['role'] == 'candidate' and str(application['candidateId']) != user_id:
+            return jsonify({'error': 'Unauthorized'}), 403
+        elif user['role'] == 'company':
+            job = Job(current_app.db).get_job_by_id(application['jobId'])
+            if not job or job['companyId'] != user_id:
+                return jsonify({'error': 'Unauthorized'}), 403
+        
+        return jsonify({
+            'application_id': application_id,
+            'match_score': application.get('matchScore'),
+            'scoring_status': application.get('scoringStatus', 'completed')
+        }), 200
+        
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@application_bp.route('/<application_id>/duplicates', methods=['GET'])
+@jwt_required()
+def get_application_duplicates(application_id):
+    try:
+        user_id = get_jwt_identity()
+        
+        # Verify user is a company and owns the job
+        user_model = User(current_app.db)
+        user = user_model.find_by_id(user_id)
+        
+        if not user or user['role'] != 'company':
+            return jsonify({'error': 'Only companies can view duplicate applications'}), 403
+        
+        application_model = Application(current_app.db)
+        application = application_model.get_scoring_status(application_id)
+        
+        if not application:
+            return jsonify({'error': 'Application not found'}), 404
+        
+        job_model = Job(current_app.db)
+        job = job_model.get_job_by_id(application['jobId'])
+        if not job or job['companyId'] != user_id:
+            return jsonify({'error': 'Unauthorized'}), 403
+        
+        # Only compare against applications to this company's jobs
+        job_ids = [company_job['_id'] for company_job in job_model.get_company_jobs(user_id)]
+        duplicates = application_model.get_near_duplicates(application_id, job_ids, Config.NEAR_DUPLICATE_THRESHOLD)
+        
+        return jsonify({
+            'application_id': application_id,
+            'duplicates': duplicates
+        }), 200
+        
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
 @application_bp.route('/<application_id>/status', methods=['PUT'])
 @jwt_required()
 def update_application_status(application_id):
@@ -60,7 +60,7 @@ def login():
             'name': user['name'],
             'email': user['email'],
             'role': user['role'],
-            'profile': user.get('profile', {})
+            'profile': user_model.public_profile(user)
         }
         
         return jsonify({
@@ -87,7 +87,7 @@ def get_profile():
             'name': user['name'],
             'email': user['email'],
             'role': user['role'],
-            'profile': user.get('profile', {})
+            'profile': user_model.public_profile(user)
         }
         
         return jsonify(user_data), 200
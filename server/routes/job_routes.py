@@ -2,9 +2,15 @@ from flask import Blueprint, request, jsonify, current_app
 from flask_jwt_extended import jwt_required, get_jwt_identity
 from models.job_model import Job
 from models.user_model import User
+from services import job_recommender, job_search
+from services.extraction_pool import ExtractionUnavailable
+from services.resume_features import load_profile_resume_data
+from utils.error_helper import extraction_unavailable
 
 job_bp = Blueprint('jobs', __name__)
 
+MAX_RECOMMENDATIONS = 50
+
 @job_bp.route('', methods=['GET'])
 def get_all_jobs():
     try:
@@ -15,11 +21,67 @@ def get_all_jobs():
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+@job_bp.route('/search', methods=['GET'])
+def search_jobs():
+    try:
+        query = request.args.get('q', '')
+        page = max(request.args.get('page', 1, type=int), 1)
+        per_page = min(max(request.args.get('per_page', 20, type=int), 1), 100)
+        
+        # Rank in the search index, then load only this page of postings
+        total, results = job_search.search_jobs(current_app.db, query, (page - 1) * per_page, per_page)
+        job_model = Job(current_app.db)
+        jobs = job_model.get_jobs_by_ids([job_id for job_id, _ in results])
+        
+        return jsonify({
+            'jobs': jobs,
+            'total': total,
+            'page': page,
+            'per_page': per_page
+        }), 200
+        
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@job_bp.route('/recommendations', methods=['GET'])
+@jwt_required()
+def get_recommended_jobs():
+    try:
+        user_id = get_jwt_identity()
+        limit = min(max(request.args.get('limit', 10, type=int), 1), MAX_RECOMMENDATIONS)
+        
+        # Verify user is a candidate
+        user_model = User(current_app.db)
+        user = user_model.find_by_id(user_id)
+        
+        if not user or user['role'] != 'candidate':
+            return jsonify({'error': 'Only candidates can get job recommendations'}), 403
+        
+        resume_data = load_profile_resume_data(current_app.db, user)
+        if resume_data is None:
+            return jsonify({'error': 'No resume found. Please upload a resume first'}), 400
+        
+        # Rank in the recommendation index, then load only the recommended postings
+        results = job_recommender.recommend_jobs(current_app.db, resume_data, limit)
+        job_model = Job(current_app.db)
+        jobs = job_model.get_jobs_by_ids([job_id for job_id, _, _ in results])
+        
+        matches = {job_id: (score, matched) for job_id, score, matched in results}
+        for job in jobs:
+            job['ats_score'], job['matched_skills'] = matches[job['_id']]
+        
+        return jsonify(jobs), 200
+        
+    except ExtractionUnavailable as e:
+        return extraction_unavailable(e)
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
 @job_bp.route('/<job_id>', methods=['GET'])
 def get_job(job_id):
     try:
         job_model = Job(current_app.db)
-        job = job_model.get_job_by_id(job_id)
+        job = job_model.get_job_by_id(job_id, include_features=False)
         
         if not job:
             return jsonify({'error': 'Job not found'}), 404
@@ -2,10 +2,14 @@ from flask import Blueprint, request, jsonify, current_app
 from flask_jwt_extended import jwt_required, get_jwt_identity
 from werkzeug.utils import secure_filename
 import os
-from services.resume_parser import ResumeParser
-from services.skill_matcher import SkillMatcher
+from services.extraction_pool import ExtractionUnavailable
+from services.match_cache import MatchScoreCache
+from services.parse_cache import ParseCache
+from services.resume_features import build_resume_features, load_profile_resume_data
 from models.user_model import User
 from models.job_model import Job
+from utils.error_helper import extraction_unavailable
+from utils.match_helper import get_match
 
 resume_bp = Blueprint('resume', __name__)
 
@@ -44,24 +48,30 @@ def upload_resume():
         file.save(file_path)
         
         # Parse resume
-        parser = ResumeParser()
-        resume_data = parser.parse_resume(file_path)
+        resume_data = ParseCache(current_app.db).parse(file_path)
         
-        # Update user profile with resume data
+        # Keep the current profile resume when the new one can't be read
+        if 'error' in resume_data:
+            return jsonify({'error': resume_data['error']}), 400
+        
+        # Update user profile with resume data and its feature record for later scoring
         profile_update = {
             'resumeUrl': file_path,
             'skills': resume_data.get('skills', []),
             'experience': resume_data.get('experience', ''),
-            'education': resume_data.get('education', '')
+            'education': resume_data.get('education', ''),
         }
         
         user_model.update_profile(user_id, profile_update)
+        user_model.update_resume_features(user_id, build_resume_features(resume_data))
         
         return jsonify({
             'message': 'Resume uploaded and parsed successfully',
             'resume_data': resume_data
         }), 200
         
+    except ExtractionUnavailable as e:
+        return extraction_unavailable(e)
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -89,21 +99,20 @@ def analyze_resume():
         if not job:
             return jsonify({'error': 'Job not found'}), 404
         
-        # Get user's resume data
-        resume_path = user.get('profile', {}).get('resumeUrl')
-        if not resume_path or not os.path.exists(resume_path):
+        # Get user's resume data from the stored feature record
+        resume_data = load_profile_resume_data(current_app.db, user)
+        if resume_data is None:
             return jsonify({'error': 'No resume found. Please upload a resume first'}), 400
         
-        # Parse resume if not already parsed
-        parser = ResumeParser()
-        resume_data = parser.parse_resume(resume_path)
-        
         # Perform skill matching
-        matcher = SkillMatcher()
-        analysis = matcher.analyze_match(resume_data, job)
+        analysis = get_match(resume_data, job)
+        if 'error' not in analysis:
+            analysis = analysis.to_dict()
         
         return jsonify(analysis), 200
         
+    except ExtractionUnavailable as e:
+        return extraction_unavailable(e)
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -127,20 +136,20 @@ def get_ats_score(job_id):
         if not job:
             return jsonify({'error': 'Job not found'}), 404
         
-        # Get user's resume data
-        resume_path = user.get('profile', {}).get('resumeUrl')
-        if not resume_path or not os.path.exists(resume_path):
+        # Get user's resume data from the stored feature record
+        resume_data = load_profile_resume_data(current_app.db, user)
+        if resume_data is None:
             return jsonify({'error': 'No resume found. Please upload a resume first'}), 400
         
-        # Parse resume and calculate ATS score
-        parser = ResumeParser()
-        resume_data = parser.parse_resume(resume_path)
-        
-        matcher = SkillMatcher()
-        score = matcher.calculate_ats_score(resume_data, job)
+        # Calculate ATS score
+        score = MatchScoreCache(current_app.db).get_score(
+            resume_data, job, lambda: get_match(resume_data, job).get('ats_score', 0)
+        )
         
         return jsonify({'ats_score': score}), 200
         
+    except ExtractionUnavailable as e:
+        return extraction_unavailable(e)
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -164,19 +173,17 @@ def get_skill_analysis(job_id):
         if not job:
             return jsonify({'error': 'Job not found'}), 404
         
-        # Get user's resume data
-        resume_path = user.get('profile', {}).get('resumeUrl')
-        if not resume_path or not os.path.exists(resume_path):
+        # Get user's resume data from the stored feature record
+        resume_data = load_profile_resume_data(current_app.db, user)
+        if resume_data is None:
             return jsonify({'error': 'No resume found. Please upload a resume first'}), 400
         
-        # Parse resume and analyze skills
-        parser = ResumeParser()
-        resume_data = parser.parse_resume(resume_path)
-        
-        matcher = SkillMatcher()
-        analysis = matcher.analyze_skills(resume_data, job)
+        # Analyze skills
+        analysis = get_match(resume_data, job).get('skill_analysis', {})
         
         return jsonify(analysis), 200
         
+    except ExtractionUnavailable as e:
+        return extraction_unavailable(e)
     except Exception as e:
         return jsonify({'error': str(e)}), 500
\ No newline at end of file
@@ -0,0 +1,123 @@
+"""Score blocks of resumes against blocks of jobs in one pass.
+
+Resumes and jobs become sparse term matrices over a vocabulary shared by the
+batch, so skill overlaps and matched keyword weights for every pair come
+from a single sparse product. The components that depend on the resume only are
+computed once per resume and broadcast. Every value matches what
+``SkillMatcher`` computes for the same pair, including the final integer
+score.
+"""
+from collections import Counter
+from typing import Dict, List, Tuple
+import numpy as np
+from scipy import sparse
+from services import keyword_stats
+from services.job_features import get_job_features
+from services.resume_features import get_resume_features
+from services.skill_matcher import PHRASE_WEIGHT, SkillMatcher
+
+SCORE_COMPONENTS = ('skill_match', 'keyword_match', 'experience_match', 'education_match', 'structure')
+
+def _term_matrices(left: List[Dict[str, float]], right: List[Dict[str, float]]) -> Tuple[sparse.csr_matrix, sparse.csr_matrix]:
+    """Build sparse term-value matrices for two groups of rows over their joint vocabulary"""
+    vocabulary = {}
+
+    def to_matrix(rows):
+        indptr, indices, data = [0], [], []
+        for row in rows:
+            for term, value in row.items():
+                indices.append(vocabulary.setdefault(term, len(vocabulary)))
+                data.append(value)
+            indptr.append(len(indices))
+        return indptr, indices, data
+
+    left_parts, right_parts = to_matrix(left), to_matrix(right)
+    return tuple(
+        sparse.csr_matrix((np.array(data, dtype=np.float64), indices, indptr), shape=(len(indptr) - 1, len(vocabulary)))
+        for indptr, indices, data in (left_parts, right_parts)
+    )
+
+def _presence(terms) -> Dict[str, float]:
+    """Row of 1.0 values for a collection of terms"""
+    return dict.fromkeys(terms, 1.0)
+
+def _overlap(left: sparse.csr_matrix, right: sparse.csr_matrix) -> np.ndarray:
+    """Sum of right-row values over shared terms for every (left row, right row) pair"""
+    return (left @ right.T).toarray()
+
+class BatchScorer:
+    def __init__(self):
+        self.matcher = SkillMatcher()
+
+    def score(self, resumes: List[Dict], jobs: List[Dict]) -> Dict[str, np.ndarray]:
+        """Score every resume against every job, returning N x M arrays per component and 'ats_score'"""
+        resume_features = [get_resume_features(resume) for resume in resumes]
+        job_features = [get_job_features(job) for job in jobs]
+        shape = (len(resumes), len(jobs))
+
+        # Skill matching (40%): matched job skills over all job skills, compared case-insensitively
+        # Job skills keep their multiplicity, as the scalar path counts each entry
+        resume_skills, job_skills = _term_matrices(
+            [_presence(skill.lower() for skill in features['skills']) for features in resume_features],
+            [Counter(skill.lower() for skill in features['skills']) for features in job_features]
+        )
+        matched = _overlap(resume_skills, job_skills)
+        total_job_skills = np.asarray(job_skills.sum(axis=1)).ravel()
+        skill_score = np.zeros(shape)
+        has_skills = total_job_skills > 0
+        skill_score[:, has_skills] = matched[:, has_skills] / total_job_skills[has_skills] * 40
+
+        # Keyword match (20%): share of each job's integer TF-IDF keyword weight found in the resume.
+        # Integer weights make the sums exact whatever order the product adds them in.
+        resume_keywords, job_keywords = _term_matrices(
+            [_presence(features['keywords']) for features in resume_features],
+            [keyword_stats.job_term_weights(features) for features in job_features]
+        )
+        matched_weight = _overlap(resume_keywords, job_keywords)
+        total_weight = np.asarray(job_keywords.sum(axis=1)).ravel()
+        has_description = np.array(['description' in job for job in jobs], dtype=bool)
+        comparable = has_description & (total_weight > 0)
+        keyword_score = np.zeros(shape)
+        keyword_score[:, comparable] = matched_weight[:, comparable] / total_weight[comparable]
+
+        # A quarter of it goes to the job's hashed two-word phrases found in the resume,
+        # for pairs where the job has phrases and the resume record stores them
+        resume_phrases, job_phrases = _term_matrices(
+            [_presence(features.get('phrases') or []) for features in resume_features],
+            [_presence(features.get('phrases') or []) for features in job_features]
+        )
+        phrase_score = _overlap(resume_phrases, job_phrases)
+        total_phrases = np.asarray(job_phrases.sum(axis=1)).ravel()
+        has_phrases = np.outer([features.get('phrases') is not None for features in resume_features],
+                               comparable & (total_phrases > 0))
+        phrase_score[:, total_phrases > 0] /= total_phrases[total_phrases > 0]
+        keyword_score[has_phrases] = (1 - PHRASE_WEIGHT) * keyword_score[has_phrases] + PHRASE_WEIGHT * phrase_score[has_phrases]
+        keyword_score = keyword_score * 20
+
+        # Experience, education and structure only depend on the resume
+        experience_score = np.array([self.matcher._calculate_experience_score(resume, {}) * 20 for resume in resumes])
+        education_score = np.array([self.matcher._calculate_education_score(resume, {}) * 10 for resume in resumes])
+        structure_score = np.array([self.matcher._calculate_structure_score(resume) * 10 for resume in resumes])
+
+        breakdown = {
+            'skill_match': skill_score,
+            'keyword_match': keyword_score,
+            'experience_match': np.broadcast_to(experience_score[:, None], shape),
+            'education_match': np.broadcast_to(education_score[:, None], shape),
+            'structure': np.broadcast_to(structure_score[:, None], shape)
+        }
+
+        # Same summation order and truncation as SkillMatcher._total_score
+        total = np.zeros(shape)
+        for name in SCORE_COMPONENTS:
+            total = total + breakdown[name]
+        breakdown['ats_score'] = np.minimum(np.trunc(total), 100).astype(int)
+        return breakdown
+
+    def score_applicants(self, resumes: List[Dict], job: Dict) -> List[int]:
+        """ATS scores of many resumes for a single job"""
+        return self.score(resumes, [job])['ats_score'][:, 0].tolist()
+
+    def score_jobs(self, resume: Dict, jobs: List[Dict]) -> List[int]:
+        """ATS scores of a single resume for many jobs"""
+        return self.score([resume], jobs)['ats_score'][0].tolist()
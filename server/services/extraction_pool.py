@@ -0,0 +1,120 @@
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from config import Config
+
+class ExtractionUnavailable(Exception):
+    """Raised when a resume can't be extracted right now; the request can be retried"""
+
+class ExtractionQueueFull(ExtractionUnavailable):
+    """Raised when too many extractions are already waiting"""
+
+class ExtractionTimeout(ExtractionUnavailable):
+    """Raised when an extraction takes longer than the timeout"""
+
+_executor = None
+_executor_lock = threading.Lock()
+_slots = threading.BoundedSemaphore(max(Config.EXTRACTION_QUEUE_LIMIT, 1))
+
+_metrics_lock = threading.Lock()
+_metrics = {
+    'queue_depth': 0,
+    'peak_queue_depth': 0,
+    'completed': 0,
+    'failed': 0,
+    'rejected': 0,
+    'timed_out': 0,
+    'total_extraction_seconds': 0.0,
+    'max_extraction_seconds': 0.0,
+    'total_wait_seconds': 0.0
+}
+
+def _extract_in_worker(file_path):
+    """Run text extraction inside a pool process"""
+    from services.resume_parser import ResumeParser
+
+    start = time.perf_counter()
+    text = ResumeParser()._read_text(file_path)
+    return text, time.perf_counter() - start
+
+def _get_executor():
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ProcessPoolExecutor(max_workers=Config.EXTRACTION_WORKERS)
+        return _executor
+
+def _reset_executor():
+    """Drop a broken pool so the next call starts fresh workers"""
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
+
+def _record(**changes):
+    with _metrics_lock:
+        for key, value in changes.items():
+            _metrics[key] += value
+        _metrics['peak_queue_depth'] = max(_metrics['peak_queue_depth'], _metrics['queue_depth'])
+
+def is_enabled():
+    """Whether extraction should be offloaded to worker processes"""
+    return Config.EXTRACTION_WORKERS > 0
+
+def extract_text(file_path, timeout=None):
+    """Extract resume text in the process pool and wait for the result"""
+    if not _slots.acquire(timeout=Config.EXTRACTION_QUEUE_TIMEOUT):
+        _record(rejected=1)
+        raise ExtractionQueueFull('Resume extraction queue is full, please retry shortly')
+
+    _record(queue_depth=1)
+    submitted = time.perf_counter()
+    try:
+        future = _get_executor().submit(_extract_in_worker, file_path)
+    except Exception:
+        _release_slot()
+        _record(failed=1)
+        raise
+    # The slot is freed when the worker is done, not when the caller stops waiting,
+    # so an extraction that overran its timeout still counts against capacity
+    future.add_done_callback(_release_slot)
+
+    try:
+        text, extraction_seconds = future.result(timeout=timeout or Config.EXTRACTION_TIMEOUT)
+    except FutureTimeoutError:
+        # Drops it if still queued; a running worker can't be interrupted
+        future.cancel()
+        _record(failed=1, timed_out=1)
+        raise ExtractionTimeout('Resume extraction timed out, please retry shortly')
+    except BrokenProcessPool:
+        _reset_executor()
+        _record(failed=1)
+        raise
+    except Exception:
+        _record(failed=1)
+        raise
+
+    wait_seconds = time.perf_counter() - submitted - extraction_seconds
+    _record(completed=1, total_extraction_seconds=extraction_seconds, total_wait_seconds=max(wait_seconds, 0.0))
+    with _metrics_lock:
+        _metrics['max_extraction_seconds'] = max(_metrics['max_extraction_seconds'], extraction_seconds)
+    return text
+
+def _release_slot(future=None):
+    _record(queue_depth=-1)
+    _slots.release()
+
+def get_metrics():
+    """Get extraction pool metrics"""
+    with _metrics_lock:
+        metrics = dict(_metrics)
+
+    completed = metrics['completed']
+    metrics['workers'] = Config.EXTRACTION_WORKERS
+    metrics['queue_limit'] = Config.EXTRACTION_QUEUE_LIMIT
+    metrics['avg_extraction_seconds'] = metrics['total_extraction_seconds'] / completed if completed else 0.0
+    metrics['avg_wait_seconds'] = metrics['total_wait_seconds'] / completed if completed else 0.0
+    return metrics
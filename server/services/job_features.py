@@ -0,0 +1,52 @@
+"""Job requirement features computed once when a posting is written.
+
+``Job.create_job`` and ``Job.update_job`` store the block under ``features``;
+SkillMatcher reads it instead of re-parsing the description for every
+applicant. The version covers both this module and the skill taxonomy.
+Stale blocks are rebuilt on the fly; ``Job.get_job_by_id`` and the startup
+backfill write the rebuilt block back, so each posting is parsed once.
+"""
+from typing import Dict
+from services.skill_taxonomy import TAXONOMY_VERSION, find_skills, resolve_skill
+from services.text_preprocessing import TextPreprocessor
+
+JOB_FEATURES_VERSION = f"4:{TAXONOMY_VERSION}"
+
+_preprocessor = TextPreprocessor()
+
+def build_job_features(job_data: Dict) -> Dict:
+    """Compute the feature block for a job posting"""
+    description = job_data.get('description') or ''
+
+    # Required skills first, then skills mentioned in the description
+    skills = []
+    for skill in list(job_data.get('requiredSkills') or []) + find_skills(description):
+        normalized = _preprocessor.normalize_skill_name(skill)
+        if normalized and normalized not in skills:
+            skills.append(normalized)
+
+    skill_ids = [skill_id for skill_id in (resolve_skill(skill) for skill in skills) if skill_id is not None]
+    document = _preprocessor.tokenize(description)
+    term_frequencies = document.keyword_frequency
+
+    return {
+        'version': JOB_FEATURES_VERSION,
+        'skills': skills,
+        'skillIds': skill_ids,
+        'keywords': sorted(document.keywords()),
+        # Stored as pairs because keywords such as 'node.js' are not valid field names
+        'termFrequencies': sorted([term, count] for term, count in term_frequencies.items()),
+        # Hashed indices of the description's two-word phrases
+        'phrases': document.hashed_ngrams().indices.tolist()
+    }
+
+def has_current_features(job_data: Dict) -> bool:
+    """Whether the job carries a feature block built by this version"""
+    features = job_data.get('features')
+    return bool(features) and features.get('version') == JOB_FEATURES_VERSION
+
+def get_job_features(job_data: Dict) -> Dict:
+    """Get the stored feature block, rebuilding it if missing or outdated"""
+    if has_current_features(job_data):
+        return job_data['features']
+    return build_job_features(job_data)
@@ -0,0 +1,68 @@
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Dict
+from config import Config
+
+class JobIndexSync:
+    """Keeps a process-local job index in step with the jobs collection.
+
+    The first query loads every active job. Later queries pull the jobs
+    updated since the last sync, at most every ``JOB_SEARCH_REFRESH``
+    seconds, so writes made by other processes show up without a reload.
+    Writes in this process are applied directly through ``index_job`` and
+    ``remove_job``. The index needs ``add(job)`` and ``remove(job_id)``.
+    """
+
+    def __init__(self, index, projection: Dict):
+        self.index = index
+        self.projection = projection
+        self._lock = threading.Lock()
+        self._loaded = False
+        self._synced_until = None
+        self._checked_at = None
+
+    def sync(self, db):
+        """Pull jobs changed since the last sync, or load them all the first time"""
+        if self._is_fresh():
+            return
+
+        with self._lock:
+            if self._is_fresh():
+                return
+
+            if not self._loaded:
+                jobs = db.jobs.find({'status': 'active'}, self.projection)
+            else:
+                # Overlap slightly so writes landing on the watermark are not missed
+                jobs = db.jobs.find({'updated_at': {'$gte': self._synced_until - timedelta(seconds=1)}}, self.projection)
+
+            latest = self._synced_until
+            for job in jobs:
+                if job.get('status') == 'active':
+                    self.index.add(job)
+                else:
+                    self.index.remove(job['_id'])
+                updated_at = job.get('updated_at')
+                if updated_at and (latest is None or updated_at > latest):
+                    latest = updated_at
+
+            self._synced_until = latest or self._synced_until or datetime.utcnow()
+            self._loaded = True
+            self._checked_at = time.monotonic()
+
+    def index_job(self, job: Dict):
+        """Add or refresh a job after a write in this process"""
+        if not self._loaded:
+            return  # The first query loads everything anyway
+        if job.get('status', 'active') == 'active':
+            self.index.add(job)
+        else:
+            self.index.remove(job['_id'])
+
+    def remove_job(self, job_id):
+        """Drop a job after a write in this process"""
+        self.index.remove(job_id)
+
+    def _is_fresh(self) -> bool:
+        return self._loaded and time.monotonic() - self._checked_at < Config.JOB_SEARCH_REFRESH
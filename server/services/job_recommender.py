@@ -0,0 +1,171 @@
+"""Best-fitting active jobs for a resume, from skill posting lists with max-score pruning.
+
+Each active job is listed under every skill it requires, keyed by taxonomy
+skill id, with the skill points that skill is worth for the job (40 split
+across its skills, as in ``SkillMatcher``). A recommendation query walks
+only the lists of the resume's skills, so jobs sharing no skill are never
+looked at, and sums each job's skill points along the way. Adding full
+keyword points and the resume's experience, education and structure points,
+which don't depend on the job, gives every candidate job an upper bound on
+its ATS score. Jobs are then scored exactly by ``SkillMatcher`` in order of
+that bound, stopping as soon as the next bound cannot beat the current top N.
+
+Each process keeps its own index, synced with MongoDB like the search index.
+"""
+import heapq
+import threading
+from typing import Dict, List, Tuple
+from services import keyword_stats
+from services.job_features import get_job_features
+from services.job_index_sync import JobIndexSync
+from services.resume_features import get_resume_features
+from services.skill_matcher import SkillMatcher
+from services.skill_taxonomy import resolve_skill
+
+# Score weights of the components that depend on the job
+SKILL_POINTS = 40
+KEYWORD_POINTS = 20
+
+# Absorbs float rounding when comparing upper bounds with exact scores
+_EPSILON = 1e-9
+
+# Job fields SkillMatcher reads besides the feature record
+_SCORED_FIELDS = ('title', 'description', 'requiredSkills')
+
+def _skill_key(skill: str):
+    """Posting list key of a normalized skill: its taxonomy id, or the name for skills outside it"""
+    skill_id = resolve_skill(skill)
+    return skill_id if skill_id is not None else skill.lower()
+
+class _IndexedMatcher(SkillMatcher):
+    """SkillMatcher taking job keyword weights from the index, which keeps them per job"""
+
+    def __init__(self, index: 'JobRecommendationIndex', stats_generation: int):
+        super().__init__()
+        self._index = index
+        self._stats_generation = stats_generation
+
+    def _job_term_weights(self, job_data: Dict) -> Dict[str, int]:
+        return self._index._keyword_weights(job_data, self._stats_generation)
+
+class JobRecommendationIndex:
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._postings = {}  # skill key -> {doc number: skill points}
+        self._jobs = {}  # doc number -> (job id, job data for scoring, created timestamp)
+        self._doc_numbers = {}  # job id -> doc number
+        self._weights = {}  # job id -> (keyword statistics generation, keyword weights)
+        self._next_doc = 0
+
+    def __len__(self):
+        return len(self._jobs)
+
+    def add(self, job: Dict):
+        """Index a job posting, replacing any previous version of it"""
+        job_id = str(job['_id'])
+        features = get_job_features(job)
+        skills = [skill.lower() for skill in features['skills']]
+        created = job.get('created_at')
+        # Only what SkillMatcher reads from a job
+        job_data = {field: job[field] for field in _SCORED_FIELDS if field in job}
+        job_data.update({'_id': job_id, 'features': features})
+
+        with self._lock:
+            self.remove(job_id)
+            doc = self._next_doc
+            self._next_doc += 1
+            self._doc_numbers[job_id] = doc
+            self._jobs[doc] = (job_id, job_data, created.timestamp() if created else 0.0)
+            for skill in skills:
+                # Names sharing a taxonomy id share a list, so their points add up
+                postings = self._postings.setdefault(_skill_key(skill), {})
+                postings[doc] = postings.get(doc, 0.0) + SKILL_POINTS / len(skills)
+
+    def remove(self, job_id: str):
+        """Drop a job posting from the index"""
+        with self._lock:
+            doc = self._doc_numbers.pop(str(job_id), None)
+            if doc is None:
+                return
+            _, job_data, _ = self._jobs.pop(doc)
+            self._weights.pop(str(job_id), None)
+            for skill in set(job_data['features']['skills']):
+                key = _skill_key(skill.lower())
+                postings = self._postings.get(key)
+                if postings is not None:
+                    postings.pop(doc, None)
+                    if not postings:
+                        del self._postings[key]
+
+    def recommend(self, resume_data: Dict, limit: int = 10) -> List[Tuple[str, int, List[str]]]:
+        """Top jobs for a resume; returns [(job id, ATS score, matched skills)]"""
+        resume_features = get_resume_features(resume_data)
+        if resume_features is not resume_data.get('features'):
+            resume_data = {**resume_data, 'features': resume_features}
+        resume_skills = {skill.lower() for skill in resume_data['features']['skills']}
+        matcher = _IndexedMatcher(self, keyword_stats.generation())
+
+        # Experience, education and structure points don't depend on the job
+        no_skills = {'matched_skills': [], 'missing_skills': []}
+        breakdown = matcher._calculate_score_breakdown(resume_data, {}, no_skills)
+        fixed_points = breakdown['experience_match'] + breakdown['education_match'] + breakdown['structure']
+
+        def exact_score(job_data):
+            skill_analysis = matcher._analyze_skills(matcher._extract_resume_skills(resume_data),
+                                                     matcher._extract_job_skills(job_data))
+            breakdown = matcher._calculate_score_breakdown(resume_data, job_data, skill_analysis)
+            return matcher._total_score(breakdown), skill_analysis['matched_skills']
+
+        with self._lock:
+            # Skill points of every job sharing a skill with the resume, one list at a time
+            skill_points = {}
+            for key in {_skill_key(skill) for skill in resume_skills}:
+                for doc, points in self._postings.get(key, {}).items():
+                    skill_points[doc] = skill_points.get(doc, 0.0) + points
+
+            bounds = [(min(int(points + KEYWORD_POINTS + fixed_points + _EPSILON), 100), doc)
+                      for doc, points in skill_points.items()]
+            bounds.sort(reverse=True)
+
+            top = []  # min-heap of (score, created, doc, matched skills)
+            for bound, doc in bounds:
+                # Every job left has at most this bound, so none of them can enter the top N
+                if len(top) >= limit and bound <= top[0][0]:
+                    break
+                _, job_data, created = self._jobs[doc]
+                score, matched = exact_score(job_data)
+                entry = (score, created, doc, matched)
+                if len(top) < limit:
+                    heapq.heappush(top, entry)
+                elif entry[:2] > top[0][:2]:
+                    heapq.heapreplace(top, entry)
+
+            ranked = sorted(top, key=lambda entry: (entry[0], entry[1]), reverse=True)
+            return [(self._jobs[doc][0], score, matched) for score, _, doc, matched in ranked]
+
+    def _keyword_weights(self, job_data: Dict, stats_generation: int) -> Dict[str, int]:
+        """Job keyword weights, kept per job until keyword statistics change"""
+        cached = self._weights.get(job_data['_id'])
+        if cached is None or cached[0] != stats_generation:
+            cached = (stats_generation, keyword_stats.job_term_weights(job_data['features']))
+            self._weights[job_data['_id']] = cached
+        return cached[1]
+
+_INDEX_PROJECTION = {'title': 1, 'description': 1, 'requiredSkills': 1, 'features': 1,
+                     'status': 1, 'created_at': 1, 'updated_at': 1}
+
+_index = JobRecommendationIndex()
+_sync = JobIndexSync(_index, _INDEX_PROJECTION)
+
+def recommend_jobs(db, resume_data: Dict, limit: int = 10) -> List[Tuple[str, int, List[str]]]:
+    """Recommend active jobs, syncing the process index with MongoDB first if needed"""
+    _sync.sync(db)
+    return _index.recommend(resume_data, limit)
+
+def index_job(job: Dict):
+    """Add or refresh a job after a write in this process"""
+    _sync.index_job(job)
+
+def remove_job(job_id):
+    """Drop a job after a write in this process"""
+    _sync.remove_job(job_id)
@@ -0,0 +1,172 @@
+"""Full-text job search over an in-process inverted index.
+
+Postings map each term to the active jobs containing it, with a
+field-weighted term frequency, so a query only touches the postings of its
+own terms. Results are ranked with BM25; a term ending in ``*`` matches
+every indexed term with that prefix.
+
+Each process keeps its own index. ``Job`` writes update it directly, and
+changes made by other processes are pulled every ``JOB_SEARCH_REFRESH``
+seconds by querying jobs updated since the last sync.
+"""
+import bisect
+import heapq
+import math
+import re
+import threading
+from typing import Dict, List, Tuple
+from services.job_index_sync import JobIndexSync
+
+_TOKEN_PATTERN = re.compile(r'\w+')
+
+# A title hit says more about a posting than a description hit
+FIELD_WEIGHTS = {'title': 3.0, 'requiredSkills': 2.0, 'location': 1.5, 'description': 1.0}
+
+# BM25 parameters
+K1 = 1.2
+B = 0.75
+
+# Most terms a single prefix may expand to
+MAX_PREFIX_EXPANSION = 50
+
+def tokenize(text: str) -> List[str]:
+    """Lowercased word tokens"""
+    return _TOKEN_PATTERN.findall(text.lower()) if text else []
+
+class JobSearchIndex:
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._postings = {}  # term -> {job_id: weighted term frequency}
+        self._job_terms = {}  # job_id -> terms, for removal
+        self._job_lengths = {}  # job_id -> weighted length
+        self._job_created = {}  # job_id -> creation timestamp, for unranked listings
+        self._total_length = 0.0
+        self._sorted_terms = None
+
+    def __len__(self):
+        return len(self._job_terms)
+
+    def add(self, job: Dict):
+        """Index a job posting, replacing any previous version of it"""
+        job_id = str(job['_id'])
+        frequencies = {}
+        for field, weight in FIELD_WEIGHTS.items():
+            value = job.get(field) or ''
+            if isinstance(value, list):
+                value = ' '.join(value)
+            for term in tokenize(value):
+                frequencies[term] = frequencies.get(term, 0.0) + weight
+
+        created = job.get('created_at')
+        with self._lock:
+            self.remove(job_id)
+            for term, frequency in frequencies.items():
+                if term not in self._postings:
+                    self._postings[term] = {}
+                    self._sorted_terms = None
+                self._postings[term][job_id] = frequency
+            self._job_terms[job_id] = list(frequencies)
+            self._job_lengths[job_id] = sum(frequencies.values())
+            self._job_created[job_id] = created.timestamp() if created else 0.0
+            self._total_length += self._job_lengths[job_id]
+
+    def remove(self, job_id: str):
+        """Drop a job posting from the index"""
+        job_id = str(job_id)
+        with self._lock:
+            terms = self._job_terms.pop(job_id, None)
+            if terms is None:
+                return
+            for term in terms:
+                postings = self._postings[term]
+                del postings[job_id]
+                if not postings:
+                    del self._postings[term]
+                    self._sorted_terms = None
+            self._total_length -= self._job_lengths.pop(job_id)
+            del self._job_created[job_id]
+
+    def search(self, query: str, offset: int = 0, limit: int = 20) -> Tuple[int, List[Tuple[str, float]]]:
+        """Find jobs containing every query term; returns (total matches, [(job_id, score)]) for one page"""
+        with self._lock:
+            clauses = [self._expand(term) for term in self._parse(query)]
+            if not clauses:
+                # No query: newest postings first
+                newest = heapq.nlargest(offset + limit, self._job_created.items(), key=lambda item: item[1])
+                return len(self._job_created), [(job_id, 0.0) for job_id, _ in newest[offset:]]
+
+            # Each clause is {job_id: (weighted frequency, idf)}; a job must match all of them
+            clauses.sort(key=len)
+            matches = set(clauses[0])
+            for clause in clauses[1:]:
+                matches.intersection_update(clause)
+            if not matches:
+                return 0, []
+
+            average_length = self._total_length / len(self._job_terms)
+            scores = {}
+            for job_id in matches:
+                length_norm = K1 * (1 - B + B * self._job_lengths[job_id] / average_length)
+                score = 0.0
+                for clause in clauses:
+                    frequency, idf = clause[job_id]
+                    score += idf * frequency * (K1 + 1) / (frequency + length_norm)
+                scores[job_id] = score
+
+            ranked = heapq.nlargest(offset + limit, scores.items(),
+                                    key=lambda item: (item[1], self._job_created[item[0]]))
+            return len(matches), ranked[offset:]
+
+    def _parse(self, query: str) -> List[Tuple[str, bool]]:
+        """Split a query into (term, is_prefix) pairs"""
+        terms = []
+        for match in re.finditer(r'(\w+)(\*?)', (query or '').lower()):
+            terms.append((match.group(1), bool(match.group(2))))
+        return terms
+
+    def _expand(self, parsed: Tuple[str, bool]) -> Dict[str, Tuple[float, float]]:
+        """Postings of a term, or the best posting per job over a prefix's terms"""
+        term, is_prefix = parsed
+        job_count = len(self._job_terms)
+        terms = self._prefix_terms(term) if is_prefix else ([term] if term in self._postings else [])
+
+        clause = {}
+        for matched_term in terms:
+            postings = self._postings[matched_term]
+            df = len(postings)
+            idf = math.log(1 + (job_count - df + 0.5) / (df + 0.5))
+            for job_id, frequency in postings.items():
+                current = clause.get(job_id)
+                if current is None or frequency * idf > current[0] * current[1]:
+                    clause[job_id] = (frequency, idf)
+        return clause
+
+    def _prefix_terms(self, prefix: str) -> List[str]:
+        if self._sorted_terms is None:
+            self._sorted_terms = sorted(self._postings)
+        start = bisect.bisect_left(self._sorted_terms, prefix)
+        terms = []
+        for term in self._sorted_terms[start:start + MAX_PREFIX_EXPANSION]:
+            if not term.startswith(prefix):
+                break
+            terms.append(term)
+        return terms
+
+_INDEX_PROJECTION = {'title': 1, 'description': 1, 'location': 1, 'requiredSkills': 1,
+                     'status': 1, 'created_at': 1, 'updated_at': 1}
+
+_index = JobSearchIndex()
+_sync = JobIndexSync(_index, _INDEX_PROJECTION)
+
+def search_jobs(db, query: str, offset: int = 0, limit: int = 20) -> Tuple[int, List[Tuple[str, float]]]:
+    """Search active jobs, syncing the process index with MongoDB first if needed"""
+    _sync.sync(db)
+    return _index.search(query, offset, limit)
+
+def index_job(job: Dict):
+    """Add or refresh a job after a write in this process"""
+    _sync.index_job(job)
+
+def remove_job(job_id):
+    """Drop a job after a write in this process"""
+    _sync.remove_job(job_id)
@@ -0,0 +1,161 @@
+"""Document frequencies of job keywords over all active postings, kept up to date incrementally.
+
+``Job.create_job``, ``update_job`` and ``delete_job`` pass the keyword sets
+entering or leaving the active corpus to ``record_change``, which applies
+``$inc`` deltas to the ``job_keyword_stats`` collection and to this
+process's copy of the table. Scoring reads the in-process table, so an IDF
+lookup is a dict access. The copy is reloaded every
+``KEYWORD_STATS_TTL`` seconds to pick up changes made by other processes;
+the corpus is only rescanned when the collection has never been built.
+"""
+import math
+import threading
+import time
+from typing import Dict, Iterable, Optional
+from pymongo import UpdateOne
+from config import Config
+from utils.lru_cache import LRUCache
+
+# Keywords are stripped of edge punctuation, so this id cannot clash with a term
+DOCUMENT_COUNT_ID = '__documents__'
+
+# Job term weights are scaled to integers so sums are exact in any order
+WEIGHT_SCALE = 1000
+
+_lock = threading.Lock()
+_collection = None
+_document_frequency = {}
+_document_count = 0
+_loaded_at = None
+# Incremented whenever the table changes, so callers can keep derived weights until then
+_generation = 0
+# IDF values and job weights computed since the table last changed
+_idf_cache = {}
+_weights_cache = LRUCache(1024)
+
+def init_app(db):
+    """Attach the stats collection, building it from active jobs on first use"""
+    global _collection
+    _collection = db.job_keyword_stats
+    if _collection.find_one({'_id': DOCUMENT_COUNT_ID}) is None:
+        rebuild(db)
+    else:
+        _load()
+
+def rebuild(db):
+    """Recount document frequencies over every active job (one full scan)"""
+    from services.job_features import get_job_features
+
+    document_frequency = {}
+    document_count = 0
+    for job in db.jobs.find({'status': 'active'}):
+        document_count += 1
+        for keyword in set(get_job_features(job)['keywords']):
+            document_frequency[keyword] = document_frequency.get(keyword, 0) + 1
+
+    collection = db.job_keyword_stats
+    collection.delete_many({})
+    operations = [UpdateOne({'_id': term}, {'$set': {'df': df}}, upsert=True)
+                  for term, df in document_frequency.items()]
+    operations.append(UpdateOne({'_id': DOCUMENT_COUNT_ID}, {'$set': {'df': document_count}}, upsert=True))
+    collection.bulk_write(operations, ordered=False)
+
+    _replace(document_frequency, document_count)
+
+def record_change(added: Iterable[str] = (), removed: Iterable[str] = (), documents: int = 0):
+    """Apply keyword sets entering and leaving the active job corpus"""
+    deltas = {}
+    for term in set(added):
+        deltas[term] = deltas.get(term, 0) + 1
+    for term in set(removed):
+        deltas[term] = deltas.get(term, 0) - 1
+    deltas = {term: delta for term, delta in deltas.items() if delta}
+
+    if _collection is not None and (deltas or documents):
+        operations = [UpdateOne({'_id': term}, {'$inc': {'df': delta}}, upsert=True)
+                      for term, delta in deltas.items()]
+        if documents:
+            operations.append(UpdateOne({'_id': DOCUMENT_COUNT_ID}, {'$inc': {'df': documents}}, upsert=True))
+        _collection.bulk_write(operations, ordered=False)
+
+        decremented = [term for term, delta in deltas.items() if delta < 0]
+        if decremented:
+            _collection.delete_many({'_id': {'$in': decremented}, 'df': {'$lte': 0}})
+
+    global _document_count, _generation
+    with _lock:
+        for term, delta in deltas.items():
+            df = _document_frequency.get(term, 0) + delta
+            if df > 0:
+                _document_frequency[term] = df
+            else:
+                _document_frequency.pop(term, None)
+        _document_count = max(_document_count + documents, 0)
+        _generation += 1
+        _idf_cache.clear()
+        _weights_cache.clear()
+
+def idf(term: str) -> float:
+    """Smoothed inverse document frequency of a term among active jobs"""
+    value = _idf_cache.get(term)
+    if value is None:
+        value = math.log((_document_count + 1) / (_document_frequency.get(term, 0) + 1)) + 1
+        _idf_cache[term] = value
+    return value
+
+def job_term_weights(features: Dict) -> Dict[str, int]:
+    """Integer TF-IDF weight of each keyword in a job's feature block (cached, do not modify)"""
+    _refresh_if_stale()
+    term_frequencies = features.get('termFrequencies') or []
+    key = (tuple(features['keywords']), tuple(tuple(pair) for pair in term_frequencies))
+    weights = _weights_cache.get(key)
+    if weights is None:
+        frequencies = dict(term_frequencies)
+        weights = {}
+        for keyword in features['keywords']:
+            tf = 1 + math.log(frequencies.get(keyword, 1))
+            weights[keyword] = max(int(round(tf * idf(keyword) * WEIGHT_SCALE)), 1)
+        _weights_cache.put(key, weights)
+    return weights
+
+def generation() -> int:
+    """Counter that changes whenever IDF values may have changed"""
+    _refresh_if_stale()
+    return _generation
+
+def get_snapshot() -> Dict:
+    """Copy of the current table, for handing to worker processes"""
+    _refresh_if_stale()
+    with _lock:
+        return {'documentFrequency': dict(_document_frequency), 'documentCount': _document_count}
+
+def set_snapshot(snapshot: Optional[Dict]):
+    """Use a table produced by get_snapshot in a process without a database"""
+    if snapshot:
+        _replace(snapshot['documentFrequency'], snapshot['documentCount'])
+
+def _replace(document_frequency: Dict[str, int], document_count: int):
+    global _document_frequency, _document_count, _loaded_at, _generation
+    with _lock:
+        _document_frequency = dict(document_frequency)
+        _document_count = document_count
+        _loaded_at = time.monotonic()
+        _generation += 1
+        _idf_cache.clear()
+        _weights_cache.clear()
+
+def _load():
+    document_frequency = {}
+    document_count = 0
+    for stat in _collection.find():
+        if stat['_id'] == DOCUMENT_COUNT_ID:
+            document_count = stat['df']
+        elif stat['df'] > 0:
+            document_frequency[stat['_id']] = stat['df']
+    _replace(document_frequency, document_count)
+
+def _refresh_if_stale():
+    if _collection is None or _loaded_at is None:
+        return
+    if time.monotonic() - _loaded_at > Config.KEYWORD_STATS_TTL:
+        _load()
@@ -0,0 +1,117 @@
+import threading
+from datetime import datetime
+from config import Config
+from services import keyword_stats
+from services.job_features import JOB_FEATURES_VERSION
+from services.resume_features import RESUME_FEATURES_VERSION
+from services.skill_matcher import SCORER_VERSION
+from utils.lru_cache import LRUCache
+
+# Process-wide tier shared by every MatchScoreCache instance
+_memory_cache = LRUCache(Config.MATCH_CACHE_SIZE)
+
+_counter_lock = threading.Lock()
+_persistent_hits = 0
+_persistent_misses = 0
+
+class MatchScoreCache:
+    """Cache of ATS scores per resume content and job revision.
+
+    Keys combine the resume content hash, the job id and its ``updated_at``,
+    and the scorer and feature versions, so an edited posting or a new scorer
+    never reads an old score. Lookups go through an in-process LRU first and
+    then the ``match_scores`` collection. In-process entries are also keyed
+    by the keyword statistics generation, so they are dropped as soon as IDF
+    values change; stored scores can lag behind those changes for at most
+    the TTL of the collection's expiry index.
+    """
+
+    def __init__(self, db=None):
+        self.collection = db.match_scores if db is not None else None
+
+    def ensure_indexes(self):
+        """Create the expiry index and the per-job index used for invalidation"""
+        if self.collection is None:
+            return
+        self.collection.create_index('created_at', expireAfterSeconds=Config.MATCH_CACHE_TTL)
+        self.collection.create_index('jobId')
+
+    def get_score(self, resume_data, job, compute):
+        """Get the ATS score of a resume for a job, calling compute() on a miss"""
+        key = self._cache_key(resume_data, job)
+        if key is None:
+            return compute()
+
+        memory_key = (key, keyword_stats.generation())
+        score = _memory_cache.get(memory_key)
+        if score is not None:
+            return score
+
+        score = self._load(key)
+        if score is None:
+            score = compute()
+            self._store(key, job, score)
+
+        _memory_cache.put(memory_key, score)
+        return score
+
+    def invalidate_job(self, job_id):
+        """Drop stored scores of a job after it changes"""
+        # In-process entries carry the old updated_at in their key and are never read again
+        if self.collection is None:
+            return
+
+        try:
+            self.collection.delete_many({'jobId': str(job_id)})
+        except Exception as e:
+            print(f"Error invalidating match scores: {e}")
+
+    def _cache_key(self, resume_data, job):
+        """Build cache key from resume content, job revision and scorer versions"""
+        features = resume_data.get('features') or {}
+        content_hash = features.get('contentHash') or resume_data.get('content_hash')
+        updated_at = job.get('updated_at')
+        if not content_hash or '_id' not in job or not isinstance(updated_at, datetime):
+            return None
+        return (f"{content_hash}:{job['_id']}:{updated_at.isoformat()}:"
+                f"{SCORER_VERSION}:{RESUME_FEATURES_VERSION}:{JOB_FEATURES_VERSION}")
+
+    def _load(self, key):
+        """Load a score from the persistent tier"""
+        global _persistent_hits, _persistent_misses
+        if self.collection is None:
+            return None
+
+        try:
+            doc = self.collection.find_one({'_id': key}, {'score': 1})
+        except Exception as e:
+            print(f"Error reading match score cache: {e}")
+            return None
+
+        with _counter_lock:
+            if doc:
+                _persistent_hits += 1
+            else:
+                _persistent_misses += 1
+        return doc['score'] if doc else None
+
+    def _store(self, key, job, score):
+        """Save a score to the persistent tier"""
+        if self.collection is None:
+            return
+
+        try:
+            self.collection.replace_one(
+                {'_id': key},
+                {'jobId': str(job['_id']), 'score': score, 'created_at': datetime.utcnow()},
+                upsert=True
+            )
+        except Exception as e:
+            print(f"Error writing match score cache: {e}")
+
+    @staticmethod
+    def stats():
+        """Get hit and miss counts of both tiers"""
+        with _counter_lock:
+            persistent = {'hits': _persistent_hits, 'misses': _persistent_misses}
+        return {'memory': _memory_cache.stats(), 'persistent': persistent}
@@ -0,0 +1,86 @@
+"""MinHash signatures and LSH banding for near-duplicate resume detection.
+
+A resume is reduced to the set of its word 3-gram shingles and summarised
+by a fixed-length MinHash signature; the fraction of equal positions in two
+signatures estimates the Jaccard similarity of their shingle sets. The
+signature is cut into bands, and each band is hashed to a key. Resumes that
+share any band key are candidates, so an index on the keys finds likely
+near-duplicates without comparing every pair.
+"""
+import hashlib
+import zlib
+from typing import Dict, List, Optional, Sequence, Tuple
+import numpy as np
+
+NUM_PERMUTATIONS = 64
+# 16 bands of 4 rows: pairs above ~0.5 similarity usually share a band
+LSH_BANDS = 16
+SHINGLE_SIZE = 3
+
+# Universal hashing (a * x + b) mod p over 32-bit shingle hashes; a < 2^31 keeps
+# the product within uint64. Fixed seed so signatures are stable across processes.
+_PRIME = np.uint64(4294967311)
+_random = np.random.RandomState(20240601)
+_A = _random.randint(1, 2 ** 31, size=NUM_PERMUTATIONS).astype(np.uint64)
+_B = _random.randint(0, 2 ** 31, size=NUM_PERMUTATIONS).astype(np.uint64)
+
+def shingles(tokens: Sequence[str], size: int = SHINGLE_SIZE) -> set:
+    """Word n-grams of a token list; short documents yield a single shingle"""
+    if len(tokens) < size:
+        return {' '.join(tokens)} if tokens else set()
+    return {' '.join(tokens[i:i + size]) for i in range(len(tokens) - size + 1)}
+
+def minhash_signature(tokens: Sequence[str]) -> Optional[List[int]]:
+    """MinHash signature of a document's shingles, or None for an empty document"""
+    shingle_set = shingles(tokens)
+    if not shingle_set:
+        return None
+
+    hashes = np.fromiter((zlib.crc32(shingle.encode('utf-8')) for shingle in shingle_set),
+                         dtype=np.uint64, count=len(shingle_set))
+    permuted = (hashes[:, None] * _A[None, :] + _B[None, :]) % _PRIME
+    return permuted.min(axis=0).tolist()
+
+def lsh_bands(signature: Optional[Sequence[int]]) -> List[str]:
+    """Band keys of a signature; documents sharing a key are near-duplicate candidates"""
+    if not signature:
+        return []
+
+    rows = len(signature) // LSH_BANDS
+    keys = []
+    for band in range(LSH_BANDS):
+        values = ','.join(str(value) for value in signature[band * rows:(band + 1) * rows])
+        digest = hashlib.blake2b(values.encode('ascii'), digest_size=8).hexdigest()
+        keys.append(f"{band}:{digest}")
+    return keys
+
+def estimated_similarity(signature1: Sequence[int], signature2: Sequence[int]) -> float:
+    """Estimate Jaccard similarity from the fraction of agreeing signature positions"""
+    if not signature1 or not signature2 or len(signature1) != len(signature2):
+        return 0.0
+    agreeing = sum(1 for value1, value2 in zip(signature1, signature2) if value1 == value2)
+    return agreeing / len(signature1)
+
+def find_near_duplicates(signatures: Sequence[Optional[Sequence[int]]],
+                         threshold: float) -> Dict[int, List[Tuple[int, float]]]:
+    """Group documents by band key and verify candidate pairs, returning index -> [(other, similarity)]"""
+    buckets = {}
+    for index, signature in enumerate(signatures):
+        for key in lsh_bands(signature):
+            buckets.setdefault(key, []).append(index)
+
+    checked = set()
+    duplicates = {}
+    for members in buckets.values():
+        for position, first in enumerate(members):
+            for second in members[position + 1:]:
+                if (first, second) in checked:
+                    continue
+                checked.add((first, second))
+
+                similarity = estimated_similarity(signatures[first], signatures[second])
+                if similarity >= threshold:
+                    duplicates.setdefault(first, []).append((second, similarity))
+                    duplicates.setdefault(second, []).append((first, similarity))
+
+    return duplicates
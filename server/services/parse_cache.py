@@ -0,0 +1,98 @@
+import hashlib
+from datetime import datetime
+from config import Config
+from services.resume_parser import ResumeParser, PARSER_VERSION
+from services.skill_taxonomy import TAXONOMY_VERSION
+from utils.lru_cache import LRUCache
+
+# Process-wide tier shared by every ParseCache instance
+_memory_cache = LRUCache(Config.PARSE_CACHE_SIZE)
+
+def file_content_hash(file_path, chunk_size=1024 * 1024):
+    """Calculate SHA-256 of a file's content"""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as file:
+        for chunk in iter(lambda: file.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+class ParseCache:
+    """Content-addressed cache of ResumeParser results.
+
+    Lookups go through an in-process LRU first and then the
+    ``parsed_resumes`` collection, so identical files are only decoded once.
+    """
+
+    def __init__(self, db=None, parser=None):
+        self.collection = db.parsed_resumes if db is not None else None
+        self.parser = parser or ResumeParser()
+
+    def parse(self, file_path):
+        """Parse resume, reusing a cached result for identical content"""
+        try:
+            content_hash = file_content_hash(file_path)
+        except OSError as e:
+            return {'error': f'Error parsing resume: {str(e)}'}
+
+        key = self._cache_key(content_hash)
+
+        resume_data = _memory_cache.get(key)
+        if resume_data is not None:
+            return dict(resume_data)
+
+        resume_data = self._load(key)
+        if resume_data is None:
+            resume_data = self.parser.parse_resume(file_path)
+            if 'error' in resume_data:
+                return resume_data
+            resume_data['content_hash'] = content_hash
+            self._store(key, content_hash, resume_data)
+
+        _memory_cache.put(key, resume_data)
+        return dict(resume_data)
+
+    def _cache_key(self, content_hash):
+        """Build cache key from content hash, parser and taxonomy versions and text budgets"""
+        # Text extracted under other page or character budgets was cut at a different point
+        return (f"{content_hash}:{PARSER_VERSION}:{TAXONOMY_VERSION}:"
+                f"{Config.MAX_RESUME_PAGES}:{Config.MAX_RESUME_CHARS}")
+
+    def _load(self, key):
+        """Load parsed resume from the persistent tier"""
+        if self.collection is None:
+            return None
+
+        try:
+            doc = self.collection.find_one({'_id': key})
+        except Exception as e:
+            print(f"Error reading parse cache: {e}")
+            return None
+
+        return doc['resumeData'] if doc else None
+
+    def _store(self, key, content_hash, resume_data):
+        """Save parsed resume to the persistent tier"""
+        if self.collection is None:
+            return
+
+        try:
+            self.collection.replace_one(
+                {'_id': key},
+                {
+                    'contentHash': content_hash,
+                    'parserVersion': PARSER_VERSION,
+                    'taxonomyVersion': TAXONOMY_VERSION,
+                    'maxPages': Config.MAX_RESUME_PAGES,
+                    'maxChars': Config.MAX_RESUME_CHARS,
+                    'resumeData': resume_data,
+                    'created_at': datetime.utcnow()
+                },
+                upsert=True
+            )
+        except Exception as e:
+            print(f"Error writing parse cache: {e}")
+
+    @staticmethod
+    def stats():
+        """Get in-process cache statistics"""
+        return _memory_cache.stats()
@@ -0,0 +1,120 @@
+"""Background rescoring of a job's applications after the posting changes.
+
+``Job.update_job`` queues the job when its scoring features changed. The
+worker streams the job's scored applications in batches, scores each batch
+from the stored resume feature records with ``BatchScorer`` and writes the
+changed scores back with one ``bulk_write`` per batch. Records from an older
+parser or taxonomy are rebuilt from the resume file and stored with the
+score; when the file is gone the old record is scored as it is. A single
+worker thread and a pause between batches keep the pipeline from competing
+with live requests.
+"""
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from bson import ObjectId
+from pymongo import UpdateOne
+from config import Config
+from models.application_model import Application
+from services.batch_scorer import BatchScorer
+from services.extraction_pool import ExtractionUnavailable
+from services.parse_cache import ParseCache
+from services.resume_features import build_resume_features, has_current_features, has_usable_features, to_resume_data
+
+_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='rescoring')
+_queued_lock = threading.Lock()
+_queued = set()
+
+def submit_job_rescoring(db, job_id):
+    """Queue rescoring of a job's applications, unless it is already waiting"""
+    job_id = str(job_id)
+    with _queued_lock:
+        if job_id in _queued:
+            return None
+        _queued.add(job_id)
+    return _executor.submit(_run, db, job_id)
+
+def _run(db, job_id):
+    # Leave the queue first, so an edit made while this runs queues another pass
+    with _queued_lock:
+        _queued.discard(job_id)
+    try:
+        return rescore_job(db, job_id)
+    except Exception as e:
+        print(f"Error rescoring applications for job {job_id}: {e}")
+        return None
+
+def rescore_job(db, job_id, batch_size=None, batch_delay=None):
+    """Rescore every scored application to a job; returns counts of scored, updated and skipped"""
+    batch_size = batch_size or Config.RESCORE_BATCH_SIZE
+    batch_delay = Config.RESCORE_BATCH_DELAY if batch_delay is None else batch_delay
+
+    job = db.jobs.find_one({'_id': ObjectId(job_id)})
+    counts = {'scored': 0, 'updated': 0, 'skipped': 0}
+    if not job:
+        return counts
+
+    scorer = BatchScorer()
+    applications = db.applications.find(
+        {'jobId': ObjectId(job_id), 'scoringStatus': 'completed'},
+        {'matchScore': 1, 'resumeFeatures': 1, 'resumeUrl': 1}
+    ).batch_size(batch_size)
+
+    parse_cache = ParseCache(db)
+    batch = []
+    for application in applications:
+        if not has_current_features(application.get('resumeFeatures')):
+            features = _rebuild_features(parse_cache, application.get('resumeUrl'))
+            if features is not None:
+                application['resumeFeatures'] = features
+                application['rebuilt'] = True
+            elif not has_usable_features(application.get('resumeFeatures')):
+                counts['skipped'] += 1
+                continue
+        batch.append(application)
+        if len(batch) >= batch_size:
+            _rescore_batch(db, scorer, job, batch, counts)
+            batch = []
+            time.sleep(batch_delay)
+
+    if batch:
+        _rescore_batch(db, scorer, job, batch, counts)
+    return counts
+
+def _rebuild_features(parse_cache, resume_path):
+    """Feature record built from the resume file, or None when the file can't be parsed now"""
+    if not resume_path or not os.path.exists(resume_path):
+        return None
+    try:
+        resume_data = parse_cache.parse(resume_path)
+    except ExtractionUnavailable as e:
+        print(f"Rescoring {resume_path} from its stored record: {e}")
+        return None
+    if 'error' in resume_data:
+        return None
+    return build_resume_features(resume_data)
+
+def _rescore_batch(db, scorer, job, applications, counts):
+    """Score one batch against the job and write back the scores and records that changed"""
+    resumes = [to_resume_data(application['resumeFeatures']) for application in applications]
+    scores = scorer.score_applicants(resumes, job)
+
+    application_model = Application(db)
+    now = datetime.utcnow()
+    operations = []
+    for application, score in zip(applications, scores):
+        update = {'matchScore': score, 'updated_at': now}
+        if application.get('rebuilt'):
+            # Store the rebuilt record, so the next pass scores without the file
+            features = application['resumeFeatures']
+            update.update({'resumeFeatures': features, **application_model.resume_index_fields(features)})
+        elif application.get('matchScore') == score:
+            continue
+        operations.append(UpdateOne({'_id': application['_id']}, {'$set': update}))
+    if operations:
+        db.applications.bulk_write(operations, ordered=False)
+
+    counts['scored'] += len(applications)
+    counts['updated'] += len(operations)
@@ -0,0 +1,122 @@
+"""Compact resume feature record persisted at upload time.
+
+The record holds everything SkillMatcher needs, so stored resumes can be
+scored without opening the original file. The version covers the parser,
+the skill taxonomy and this module; outdated records are rebuilt from the
+file when it is still available, and scored as they are when it is not.
+"""
+import os
+import re
+from typing import Dict, List, Optional
+from models.user_model import User
+from services.minhash import minhash_signature
+from services.parse_cache import ParseCache
+from services.resume_parser import PARSER_VERSION
+from services.skill_resolver import find_misspelled_skills
+from services.skill_taxonomy import TAXONOMY_VERSION, find_skills, resolve_skill, scan_skill_ids
+from services.text_preprocessing import TextPreprocessor
+
+RESUME_FEATURES_VERSION = f"5:{PARSER_VERSION}:{TAXONOMY_VERSION}"
+
+# Fields every record version has and SkillMatcher needs
+_SCORED_FIELDS = ('skills', 'keywords', 'sections', 'contact', 'experience', 'education')
+
+_preprocessor = TextPreprocessor()
+
+def _extract_years(experience) -> Optional[int]:
+    """Get years of experience from the parser's experience summary"""
+    match = re.search(r'(\d+)', experience or '')
+    return int(match.group(1)) if match else None
+
+def _skills_section_words(resume_data: Dict) -> List[str]:
+    """Keywords of the resume's skills sections, none when it has no such heading"""
+    text = resume_data.get('raw_text') or ''
+    words = set()
+    for span in resume_data.get('section_spans') or []:
+        if span['name'] == 'skills':
+            words.update(_preprocessor.tokenize(text[span['start']:span['end']]).keywords())
+    return sorted(words)
+
+def build_resume_features(resume_data: Dict) -> Dict:
+    """Compute the feature record for a parsed resume"""
+    # Raw text keeps symbols like c++ and c# that cleaning strips
+    text = resume_data.get('raw_text') or resume_data.get('cleaned_text') or ''
+
+    # Parsed skills first, then skills mentioned anywhere in the text
+    skills = []
+    for skill in list(resume_data.get('skills') or []) + find_skills(text):
+        normalized = _preprocessor.normalize_skill_name(skill)
+        if normalized not in skills:
+            skills.append(normalized)
+
+    # The parser already cleaned this text, so tokenize it without cleaning again
+    document = _preprocessor.tokenize(resume_data.get('cleaned_text', ''), cleaned=True)
+
+    # Then misspelled skills, only among the words listed under a skills heading
+    skills.extend(find_misspelled_skills(_skills_section_words(resume_data), [resolve_skill(skill) for skill in skills]))
+
+    contact_info = resume_data.get('contact_info') or {}
+
+    return {
+        'version': RESUME_FEATURES_VERSION,
+        'contentHash': resume_data.get('content_hash'),
+        'skills': skills,
+        'skillCounts': sorted([skill_id, count] for skill_id, count in scan_skill_ids(text).items()),
+        'keywords': sorted(document.keywords()),
+        'phrases': document.hashed_ngrams().indices.tolist(),
+        'sections': dict(resume_data.get('sections') or {}),
+        'contact': {field: field in contact_info for field in ('email', 'phone')},
+        'experience': resume_data.get('experience', 'Not specified'),
+        'experienceYears': _extract_years(resume_data.get('experience')),
+        'education': list(resume_data.get('education') or []),
+        'minhash': minhash_signature(document.tokens)
+    }
+
+def has_current_features(features: Optional[Dict]) -> bool:
+    """Whether a stored record was built by this version"""
+    return bool(features) and features.get('version') == RESUME_FEATURES_VERSION
+
+def has_usable_features(features: Optional[Dict]) -> bool:
+    """Whether a stored record of any version still holds what scoring reads"""
+    return bool(features) and all(field in features for field in _SCORED_FIELDS)
+
+def get_resume_features(resume_data: Dict) -> Dict:
+    """Get the attached feature record, rebuilding it if missing or outdated and the text is at hand"""
+    features = resume_data.get('features')
+    if has_current_features(features):
+        return features
+    # Built from a stored record alone: an outdated record beats one built from nothing
+    if has_usable_features(features) and not (resume_data.get('raw_text') or resume_data.get('cleaned_text')):
+        return features
+    return build_resume_features(resume_data)
+
+def to_resume_data(features: Dict) -> Dict:
+    """Build matcher input from a stored feature record, without the file"""
+    return {
+        'skills': list(features['skills']),
+        'experience': features['experience'],
+        'education': list(features['education']),
+        'sections': dict(features['sections']),
+        'contact_info': {field: True for field, present in features['contact'].items() if present},
+        'features': features
+    }
+
+def load_profile_resume_data(db, user) -> Optional[Dict]:
+    """Get matcher input for a candidate's profile resume, preferring the stored record"""
+    profile = user.get('profile') or {}
+    features = user.get('resumeFeatures')
+    if has_current_features(features):
+        return to_resume_data(features)
+
+    # Uploaded before the current version: parse the file once and backfill the record
+    resume_path = profile.get('resumeUrl')
+    if not resume_path or not os.path.exists(resume_path):
+        # Without the file, the outdated record is still the best we have
+        return to_resume_data(features) if has_usable_features(features) else None
+
+    resume_data = ParseCache(db).parse(resume_path)
+    if 'error' in resume_data:
+        return resume_data
+    features = build_resume_features(resume_data)
+    User(db).update_resume_features(user['_id'], features)
+    return to_resume_data(features)
@@ -1,8 +1,99 @@
 import os
 import re
+from typing import Iterable, List, NamedTuple
 from PyPDF2 import PdfReader
 from docx import Document
 from services.text_preprocessing import TextPreprocessor
+from services.skill_taxonomy import find_skill_labels
+from services import extraction_pool
+from config import Config
+
+# Bump whenever extraction logic changes so cached parses are invalidated
+PARSER_VERSION = '5'
+
+# Heading lines that open each section, matched case-insensitively on a line of their own
+# or followed by a colon and inline content
+SECTION_HEADINGS = {
+    'summary': ('summary', 'professional summary', 'career summary', 'profile', 'professional profile',
+                'objective', 'career objective', 'about me'),
+    'experience': ('experience', 'work experience', 'professional experience', 'work history',
+                   'employment', 'employment history'),
+    'education': ('education', 'academic background', 'academics', 'qualifications',
+                  'academic qualifications', 'educational qualifications'),
+    'skills': ('skills', 'technical skills', 'key skills', 'core skills', 'competencies', 'core competencies'),
+    'projects': ('projects', 'personal projects', 'academic projects', 'portfolio'),
+    'certifications': ('certifications', 'certificates', 'licenses', 'licenses and certifications',
+                       'licenses & certifications')
+}
+
+_HEADING_SECTIONS = {heading: section for section, headings in SECTION_HEADINGS.items() for heading in headings}
+# Longest headings first so 'work experience' wins over 'experience'
+_HEADING_PATTERN = re.compile(
+    r'^[ \t]*(' + '|'.join(re.escape(heading) for heading in sorted(_HEADING_SECTIONS, key=len, reverse=True)) +
+    r')[ \t]*(?::[ \t]*|$)',
+    re.IGNORECASE | re.MULTILINE
+)
+
+class Section(NamedTuple):
+    name: str
+    header: str
+    header_start: int
+    start: int  # Body span, after the heading
+    end: int
+
+def segment_sections(text: str) -> List[Section]:
+    """Split resume text into sections at heading lines, in one scan"""
+    matches = list(_HEADING_PATTERN.finditer(text))
+    sections = []
+    for index, match in enumerate(matches):
+        end = matches[index + 1].start() if index + 1 < len(matches) else len(text)
+        heading = match.group(1)
+        sections.append(Section(_HEADING_SECTIONS[heading.lower()], heading, match.start(), match.end(), end))
+    return sections
+
+def section_text(text: str, sections: List[Section], names: Iterable[str], include_intro: bool = False) -> str:
+    """Text of the named sections, or the whole text when the resume has none of them"""
+    names = set(names)
+    spans = [text[section.start:section.end] for section in sections if section.name in names]
+    if not spans:
+        return text
+    if include_intro:
+        # Lines before the first heading usually hold the name, contact details and a summary
+        spans.insert(0, text[:sections[0].header_start])
+    return '\n'.join(spans)
+
+def iter_pdf_pages(stream, max_pages=None):
+    """Lazily yield the text of each PDF page"""
+    pdf_reader = PdfReader(stream)
+    for index, page in enumerate(pdf_reader.pages):
+        if max_pages is not None and index >= max_pages:
+            break
+        yield page.extract_text() or ""
+
+def _join_within_budget(parts, max_chars=None):
+    """Join text parts once, stopping as soon as the character budget is reached"""
+    collected = []
+    total = 0
+    for part in parts:
+        collected.append(part)
+        total += len(part) + 1
+        if max_chars is not None and total >= max_chars:
+            break
+    
+    text = "\n".join(collected) + "\n" if collected else ""
+    return text[:max_chars] if max_chars is not None else text
+
+def read_pdf_text(stream, max_pages=None, max_chars=None):
+    """Extract PDF text from a file path or binary stream within page and character budgets"""
+    max_pages = Config.MAX_RESUME_PAGES if max_pages is None else max_pages
+    max_chars = Config.MAX_RESUME_CHARS if max_chars is None else max_chars
+    return _join_within_budget(iter_pdf_pages(stream, max_pages), max_chars)
+
+def read_docx_text(stream, max_chars=None):
+    """Extract DOCX text from a file path or binary stream within a character budget"""
+    max_chars = Config.MAX_RESUME_CHARS if max_chars is None else max_chars
+    doc = Document(stream)
+    return _join_within_budget((paragraph.text for paragraph in doc.paragraphs), max_chars)
 
 class ResumeParser:
     def __init__(self):
@@ -17,27 +108,51 @@ class ResumeParser:
             if not text:
                 return {'error': 'Could not extract text from resume'}
             
-            # Clean and preprocess text
-            cleaned_text = self.preprocessor.clean_text(text)
-            
-            # Extract information
-            resume_data = {
-                'raw_text': text,
-                'cleaned_text': cleaned_text,
-                'skills': self._extract_skills(cleaned_text),
-                'experience': self._extract_experience(cleaned_text),
-                'education': self._extract_education(cleaned_text),
-                'contact_info': self._extract_contact_info(text),
-                'sections': self._identify_sections(text)
-            }
-            
-            return resume_data
+            return self.parse_text(text)
             
+        except extraction_pool.ExtractionUnavailable:
+            # Worth retrying, unlike a file that can't be read
+            raise
         except Exception as e:
             return {'error': f'Error parsing resume: {str(e)}'}
     
+    def parse_text(self, text):
+        """Extract relevant information from already extracted resume text"""
+        # Clean and preprocess text
+        cleaned_text = self.preprocessor.clean_text(text)
+        
+        # Each extractor reads only its own sections
+        sections = segment_sections(text)
+        experience_text = section_text(text, sections, ('summary', 'experience'), include_intro=True)
+        education_text = section_text(text, sections, ('education', 'certifications'))
+        
+        # Extract information
+        return {
+            'raw_text': text,
+            'cleaned_text': cleaned_text,
+            'skills': self._extract_skills(section_text(text, sections, ('skills',))),
+            'experience': self._extract_experience(self.preprocessor.clean_text(experience_text)),
+            'education': self._extract_education(self.preprocessor.clean_text(education_text)),
+            'contact_info': self._extract_contact_info(text),
+            'sections': self._identify_sections(sections),
+            'section_spans': [section._asdict() for section in sections]
+        }
+    
     def _extract_text(self, file_path):
-        """Extract text from PDF or DOCX file"""
+        """Extract text from PDF or DOCX file, offloaded to the extraction pool"""
+        if not extraction_pool.is_enabled():
+            return self._read_text(file_path)
+        
+        try:
+            return extraction_pool.extract_text(file_path)
+        except extraction_pool.ExtractionUnavailable:
+            raise
+        except Exception as e:
+            print(f"Error extracting text: {e}")
+            return ""
+    
+    def _read_text(self, file_path):
+        """Extract text from PDF or DOCX file in the current process"""
         file_extension = os.path.splitext(file_path)[1].lower()
         
         try:
@@ -56,9 +171,7 @@ class ResumeParser:
         text = ""
         try:
             with open(file_path, 'rb') as file:
-                pdf_reader = PdfReader(file)
-                for page in pdf_reader.pages:
-                    text += page.extract_text() + "\n"
+                text = read_pdf_text(file)
         except Exception as e:
             print(f"Error reading PDF: {e}")
         return text
@@ -67,60 +180,14 @@ class ResumeParser:
         """Extract text from DOCX file"""
         text = ""
         try:
-            doc = Document(file_path)
-            for paragraph in doc.paragraphs:
-                text += paragraph.text + "\n"
+            text = read_docx_text(file_path)
         except Exception as e:
             print(f"Error reading DOCX: {e}")
         return text
     
     def _extract_skills(self, text):
         """Extract technical skills from resume text"""
-        # Common technical skills (this should be expanded)
-        skill_keywords = [
-            # Programming Languages
-            'python', 'java', 'javascript', 'typescript', 'c++', 'c#', 'php', 'ruby', 'go', 'rust',
-            'swift', 'kotlin', 'scala', 'r', 'matlab', 'sql', 'html', 'css', 'sass', 'less',
-            
-            # Frameworks & Libraries
-            'react', 'angular', 'vue', 'node.js', 'express', 'django', 'flask', 'spring', 'laravel',
-            'rails', 'asp.net', '.net', 'jquery', 'bootstrap', 'tailwind', 'material-ui',
-            
-            # Databases
-            'mysql', 'postgresql', 'mongodb', 'redis', 'elasticsearch', 'oracle', 'sqlite',
-            'cassandra', 'dynamodb', 'firebase',
-            
-            # Cloud & DevOps
-            'aws', 'azure', 'gcp', 'docker', 'kubernetes', 'jenkins', 'git', 'github', 'gitlab',
-            'ci/cd', 'terraform', 'ansible', 'nginx', 'apache',
-            
-            # Tools & Technologies
-            'linux', 'unix', 'windows', 'macos', 'bash', 'powershell', 'vim', 'vscode',
-            'intellij', 'eclipse', 'postman', 'jira', 'confluence', 'slack',
-            
-            # Data Science & ML
-            'machine learning', 'deep learning', 'tensorflow', 'pytorch', 'scikit-learn',
-            'pandas', 'numpy', 'matplotlib', 'seaborn', 'jupyter', 'tableau', 'power bi',
-            
-            # Mobile Development
-            'ios', 'android', 'react native', 'flutter', 'xamarin', 'cordova', 'ionic',
-            
-            # Testing
-            'jest', 'mocha', 'chai', 'selenium', 'cypress', 'junit', 'pytest', 'unit testing',
-            'integration testing', 'tdd', 'bdd'
-        ]
-        
-        found_skills = []
-        text_lower = text.lower()
-        
-        for skill in skill_keywords:
-            if skill.lower() in text_lower:
-                # Check for word boundaries to avoid partial matches
-                pattern = r'\b' + re.escape(skill.lower()) + r'\b'
-                if re.search(pattern, text_lower):
-                    found_skills.append(skill.title())
-        
-        return list(set(found_skills))  # Remove duplicates
+        return find_skill_labels(text)
     
     def _extract_experience(self, text):
         """Extract work experience information"""
@@ -176,24 +243,7 @@ class ResumeParser:
         
         return contact_info
     
-    def _identify_sections(self, text):
-        """Identify different sections in the resume"""
-        sections = {}
-        
-        section_patterns = {
-            'summary': r'(summary|profile|objective)',
-            'experience': r'(experience|work history|employment)',
-            'education': r'(education|academic|qualification)',
-            'skills': r'(skills|technical skills|competencies)',
-            'projects': r'(projects|portfolio)',
-            'certifications': r'(certifications|certificates|licenses)'
-        }
-        
-        text_lower = text.lower()
-        for section, pattern in section_patterns.items():
-            if re.search(pattern, text_lower):
-                sections[section] = True
-            else:
-                sections[section] = False
-        
-        return sections
\ No newline at end of file
+    def _identify_sections(self, sections):
+        """Identify which sections the resume has headings for"""
+        found = {section.name for section in sections}
+        return {name: name in found for name in SECTION_HEADINGS}
\ No newline at end of file
@@ -0,0 +1,81 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from config import Config
+from models.application_model import Application
+from models.job_model import Job
+from services.extraction_pool import ExtractionUnavailable
+from services.parse_cache import ParseCache
+from services.resume_features import build_resume_features, to_resume_data
+from services.skill_matcher import SkillMatcher
+
+# Scoring threads mostly wait on the extraction pool and MongoDB
+_executor = ThreadPoolExecutor(max_workers=Config.SCORING_WORKERS, thread_name_prefix='scoring')
+
+def is_async():
+    """Whether applications are scored in the background"""
+    return Config.SCORING_MODE == 'async'
+
+def submit_application_scoring(db, application_id, file_path, job_id):
+    """Queue match scoring for an application inserted with scoringStatus 'pending'"""
+    return _executor.submit(_score_application, db, application_id, file_path, str(job_id))
+
+def resume_pending_scoring(db, pending_after=0):
+    """Re-queue applications left pending, or stuck in processing by a process that stopped"""
+    application_model = Application(db)
+    queued = 0
+
+    for application in application_model.get_pending_scoring(Config.SCORING_STALE_AFTER, pending_after):
+        if not application.get('resumeUrl'):
+            application_model.update_score(application['_id'], 0, 'failed')
+            continue
+        submit_application_scoring(db, str(application['_id']), application['resumeUrl'], application['jobId'])
+        queued += 1
+
+    return queued
+
+def start_recovery(db):
+    """Re-queue unscored applications now, then keep sweeping for stalled ones"""
+    resume_pending_scoring(db)
+
+    def sweep():
+        while True:
+            time.sleep(Config.SCORING_STALE_AFTER)
+            try:
+                # Newer pending applications are still in some process's queue
+                resume_pending_scoring(db, pending_after=Config.SCORING_STALE_AFTER)
+            except Exception as e:
+                print(f"Error re-queuing stalled scoring: {e}")
+
+    threading.Thread(target=sweep, name='scoring-recovery', daemon=True).start()
+
+def _score_application(db, application_id, file_path, job_id):
+    """Parse the resume, score it against the current job and write the result back"""
+    application_model = Application(db)
+    if not application_model.claim_scoring(application_id, Config.SCORING_STALE_AFTER):
+        return None
+
+    try:
+        # Load the job now, so edits made while the application waited are scored
+        job = Job(db).get_job_by_id(job_id)
+        if not job:
+            raise ValueError('Job not found')
+
+        resume_data = ParseCache(db).parse(file_path)
+        if 'error' in resume_data:
+            raise ValueError(resume_data['error'])
+        resume_features = build_resume_features(resume_data)
+
+        matcher = SkillMatcher()
+        match_score = matcher.calculate_ats_score(to_resume_data(resume_features), job)
+        application_model.update_score(application_id, match_score, 'completed', resume_features)
+        return match_score
+    except ExtractionUnavailable as e:
+        # Back to pending, so the recovery sweep queues it again once extraction catches up
+        print(f"Deferring scoring of application {application_id}: {e}")
+        application_model.update_score(application_id, None, 'pending')
+        return None
+    except Exception as e:
+        print(f"Error scoring application {application_id}: {e}")
+        application_model.update_score(application_id, 0, 'failed')
+        return None
@@ -0,0 +1,63 @@
+"""Skill sets encoded as bitmaps over taxonomy skill ids.
+
+Bit ``n`` of the bitmap is set when the resume has the skill with id ``n``,
+counting from the least significant bit of the first byte. This is the bit
+order MongoDB's ``$bitsAllSet`` and ``$bitsAnySet`` use for binary data, so
+"has Python AND Kubernetes" is a query on the stored field with the skill
+ids as bit positions.
+"""
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+from bson import Binary
+from services.skill_resolver import resolve_skill_fuzzy
+from services.skill_taxonomy import SKILLS, SKILLS_BY_ID, resolve_skill
+
+# One bit per skill id; ids start at 1
+BITMAP_BYTES = max(skill.id for skill in SKILLS) // 8 + 1
+
+def encode_skill_ids(skill_ids: Iterable[int]) -> Binary:
+    """Pack skill ids into a fixed-length bitmap"""
+    bitmap = bytearray(BITMAP_BYTES)
+    for skill_id in skill_ids:
+        bitmap[skill_id // 8] |= 1 << (skill_id % 8)
+    return Binary(bytes(bitmap))
+
+def decode_skill_ids(bitmap: Optional[bytes]) -> List[int]:
+    """Skill ids set in a bitmap, in id order"""
+    if not bitmap:
+        return []
+    value = int.from_bytes(bitmap, 'little')
+    return [skill_id for skill_id in SKILLS_BY_ID if value >> skill_id & 1]
+
+def skill_bitmap(resume_features: Optional[Dict]) -> Optional[Binary]:
+    """Bitmap of the taxonomy skills in a resume feature record"""
+    if not resume_features:
+        return None
+    skill_ids = {skill_id for skill_id, _ in resume_features.get('skillCounts') or []}
+    for skill in resume_features.get('skills') or []:
+        skill_id = resolve_skill(skill)
+        if skill_id is not None:
+            skill_ids.add(skill_id)
+    return encode_skill_ids(skill_ids)
+
+def resolve_skill_query(names: Iterable[str]) -> Tuple[List[int], List[str]]:
+    """Resolve skill names or aliases, allowing small typos, to ids; returns (ids, unknown names)"""
+    skill_ids, unknown = [], []
+    for name in names:
+        name = name.strip()
+        if not name:
+            continue
+        skill_id = resolve_skill_fuzzy(name)
+        if skill_id is None:
+            unknown.append(name)
+        elif skill_id not in skill_ids:
+            skill_ids.append(skill_id)
+    return skill_ids, unknown
+
+def bitmap_query(field: str, all_ids: Sequence[int] = (), any_ids: Sequence[int] = ()) -> Dict:
+    """MongoDB filter on a bitmap field requiring every id in all_ids and at least one in any_ids"""
+    conditions = {}
+    if all_ids:
+        conditions['$bitsAllSet'] = list(all_ids)
+    if any_ids:
+        conditions['$bitsAnySet'] = list(any_ids)
+    return {field: conditions} if conditions else {}
@@ -1,48 +1,37 @@
-import re
-from typing import Dict, List, Tuple
-from services.text_preprocessing import TextPreprocessor
+from collections.abc import Mapping
+from functools import cached_property
+from typing import Dict, List, Optional, Tuple, Union
+from services.text_preprocessing import TextPreprocessor, TokenizedText, hashed_coverage
+from services import keyword_stats
+from services.skill_taxonomy import CATEGORY_WEIGHTS, find_skills
+from services.job_features import build_job_features, get_job_features
+from services.job_features import has_current_features as has_current_job_features
+from services.resume_features import get_resume_features
+
+# Bump whenever scoring logic changes so cached match scores are invalidated
+SCORER_VERSION = '2'
+
+# Share of the keyword points that goes to the job's two-word phrases found in the resume
+PHRASE_WEIGHT = 0.25
 
 class SkillMatcher:
     def __init__(self):
         self.preprocessor = TextPreprocessor()
         
-        # Skill categories with weights
-        self.skill_weights = {
-            'programming_languages': 1.0,
-            'frameworks': 0.9,
-            'databases': 0.8,
-            'cloud_platforms': 0.9,
-            'tools': 0.7,
-            'soft_skills': 0.6
-        }
+        # Skill categories with weights (shared with the skill taxonomy)
+        self.skill_weights = CATEGORY_WEIGHTS
     
-    def analyze_match(self, resume_data: Dict, job_data: Dict) -> Dict:
-        """Comprehensive analysis of resume-job match"""
+    def analyze_match(self, resume_data: Dict, job_data: Dict) -> Union['MatchResult', Dict]:
+        """Comprehensive analysis of resume-job match, computed lazily as parts are read"""
         try:
-            # Extract skills from both resume and job
-            resume_skills = self._extract_resume_skills(resume_data)
-            job_skills = self._extract_job_skills(job_data)
-            
-            # Perform skill matching
-            skill_analysis = self._analyze_skills(resume_skills, job_skills)
+            # Attach precomputed features once so nothing below re-parses either text
+            if not has_current_job_features(job_data):
+                job_data = {**job_data, 'features': build_job_features(job_data)}
+            resume_features = get_resume_features(resume_data)
+            if resume_features is not resume_data.get('features'):
+                resume_data = {**resume_data, 'features': resume_features}
             
-            # Calculate ATS score
-            ats_score = self._calculate_ats_score(resume_data, job_data, skill_analysis)
-            
-            # Generate recommendations
-            recommendations = self._generate_recommendations(skill_analysis, job_data)
-            
-            return {
-                'ats_score': ats_score,
-                'skill_analysis': skill_analysis,
-                'recommendations': recommendations,
-                'match_details': {
-                    'total_job_skills': len(job_skills),
-                    'matched_skills': len(skill_analysis['matched_skills']),
-                    'missing_skills': len(skill_analysis['missing_skills']),
-                    'match_percentage': (len(skill_analysis['matched_skills']) / len(job_skills) * 100) if job_skills else 0
-                }
-            }
+            return MatchResult(self, resume_data, job_data)
             
         except Exception as e:
             return {'error': f'Error in skill matching: {str(e)}'}
@@ -67,99 +56,21 @@ class SkillMatcher:
     
     def _extract_resume_skills(self, resume_data: Dict) -> List[str]:
         """Extract skills from resume data"""
-        skills = []
-        
-        # Get skills from parsed data
-        if 'skills' in resume_data:
-            skills.extend(resume_data['skills'])
-        
-        # Extract additional skills from text
-        if 'cleaned_text' in resume_data:
-            text_skills = self._extract_skills_from_text(resume_data['cleaned_text'])
-            skills.extend(text_skills)
-        
-        # Normalize and deduplicate
-        normalized_skills = []
-        for skill in skills:
-            normalized = self.preprocessor.normalize_skill_name(skill)
-            if normalized not in normalized_skills:
-                normalized_skills.append(normalized)
-        
-        return normalized_skills
+        # Parsed and text skills, normalized and deduplicated in the feature record
+        return list(get_resume_features(resume_data)['skills'])
     
     def _extract_job_skills(self, job_data: Dict) -> List[str]:
         """Extract required skills from job data"""
-        skills = []
-        
-        # Get skills from job requirements
-        if 'requiredSkills' in job_data:
-            skills.extend(job_data['requiredSkills'])
-        
-        # Extract skills from job description
-        if 'description' in job_data:
-            desc_skills = self._extract_skills_from_text(job_data['description'])
-            skills.extend(desc_skills)
-        
-        # Normalize and deduplicate
-        normalized_skills = []
-        for skill in skills:
-            normalized = self.preprocessor.normalize_skill_name(skill)
-            if normalized not in normalized_skills:
-                normalized_skills.append(normalized)
-        
-        return normalized_skills
+        # Required and description skills, normalized and deduplicated at write time
+        return list(get_job_features(job_data)['skills'])
     
-    def _extract_skills_from_text(self, text: str) -> List[str]:
+    def _extract_skills_from_text(self, text: Union[str, TokenizedText]) -> List[str]:
         """Extract technical skills from text"""
         if not text:
             return []
         
-        # Common technical skills database
-        skill_database = [
-            # Programming Languages
-            'python', 'java', 'javascript', 'typescript', 'c++', 'c#', 'php', 'ruby', 'go', 'rust',
-            'swift', 'kotlin', 'scala', 'r', 'matlab', 'sql', 'html', 'css', 'sass', 'less',
-            
-            # Frameworks & Libraries
-            'react', 'angular', 'vue', 'node.js', 'express', 'django', 'flask', 'spring', 'laravel',
-            'rails', 'asp.net', '.net', 'jquery', 'bootstrap', 'tailwind', 'material-ui', 'redux',
-            'next.js', 'nuxt.js', 'gatsby', 'svelte', 'ember', 'backbone',
-            
-            # Databases
-            'mysql', 'postgresql', 'mongodb', 'redis', 'elasticsearch', 'oracle', 'sqlite',
-            'cassandra', 'dynamodb', 'firebase', 'mariadb', 'couchdb', 'neo4j',
-            
-            # Cloud & DevOps
-            'aws', 'azure', 'gcp', 'docker', 'kubernetes', 'jenkins', 'git', 'github', 'gitlab',
-            'ci/cd', 'terraform', 'ansible', 'nginx', 'apache', 'heroku', 'vercel', 'netlify',
-            
-            # Tools & Technologies
-            'linux', 'unix', 'windows', 'macos', 'bash', 'powershell', 'vim', 'vscode',
-            'intellij', 'eclipse', 'postman', 'jira', 'confluence', 'slack', 'trello',
-            
-            # Data Science & ML
-            'machine learning', 'deep learning', 'tensorflow', 'pytorch', 'scikit-learn',
-            'pandas', 'numpy', 'matplotlib', 'seaborn', 'jupyter', 'tableau', 'power bi',
-            'spark', 'hadoop', 'kafka', 'airflow',
-            
-            # Mobile Development
-            'ios', 'android', 'react native', 'flutter', 'xamarin', 'cordova', 'ionic',
-            
-            # Testing
-            'jest', 'mocha', 'chai', 'selenium', 'cypress', 'junit', 'pytest', 'unit testing',
-            'integration testing', 'tdd', 'bdd', 'cucumber'
-        ]
-        
-        found_skills = []
-        text_lower = text.lower()
-        
-        for skill in skill_database:
-            # Use word boundaries for exact matching
-            pattern = r'\b' + re.escape(skill.lower()) + r'\b'
-            if re.search(pattern, text_lower):
-                found_skills.append(skill)
-        
-        return found_skills
+        # Skills are scanned on the original text, which keeps symbols like c++ and c#
+        return find_skills(str(text))
     
     def _analyze_skills(self, resume_skills: List[str], job_skills: List[str]) -> Dict:
         """Analyze skill overlap and gaps"""
@@ -195,9 +106,10 @@ class SkillMatcher:
     
     def _calculate_ats_score(self, resume_data: Dict, job_data: Dict, skill_analysis: Dict) -> int:
         """Calculate ATS score based on multiple factors"""
-        score = 0
-        max_score = 100
-        
+        return self._total_score(self._calculate_score_breakdown(resume_data, job_data, skill_analysis))
+    
+    def _calculate_score_breakdown(self, resume_data: Dict, job_data: Dict, skill_analysis: Dict) -> Dict[str, float]:
+        """Calculate the weighted points contributed by each scoring factor"""
         # Skill matching (40% of total score)
         skill_score = 0
         total_job_skills = len(skill_analysis['matched_skills']) + len(skill_analysis['missing_skills'])
@@ -205,7 +117,7 @@ class SkillMatcher:
             skill_match_ratio = len(skill_analysis['matched_skills']) / total_job_skills
             skill_score = skill_match_ratio * 40
         
-        # Keyword density in resume (20% of total score)
+        # TF-IDF weighted keyword coverage (20% of total score)
         keyword_score = self._calculate_keyword_score(resume_data, job_data) * 20
         
         # Experience relevance (20% of total score)
@@ -217,19 +129,58 @@ class SkillMatcher:
         # Resume structure and completeness (10% of total score)
         structure_score = self._calculate_structure_score(resume_data) * 10
         
-        total_score = skill_score + keyword_score + experience_score + education_score + structure_score
+        return {
+            'skill_match': skill_score,
+            'keyword_match': keyword_score,
+            'experience_match': experience_score,
+            'education_match': education_score,
+            'structure': structure_score
+        }
+    
+    def _total_score(self, score_breakdown: Dict[str, float]) -> int:
+        """Combine factor points into the final 0-100 score"""
+        max_score = 100
+        total_score = (
+            score_breakdown['skill_match'] + score_breakdown['keyword_match'] +
+            score_breakdown['experience_match'] + score_breakdown['education_match'] +
+            score_breakdown['structure']
+        )
         
         return min(int(total_score), max_score)
     
     def _calculate_keyword_score(self, resume_data: Dict, job_data: Dict) -> float:
         """Calculate score based on keyword matching"""
-        if 'cleaned_text' not in resume_data or 'description' not in job_data:
+        if 'description' not in job_data:
             return 0.0
         
-        resume_text = resume_data['cleaned_text']
-        job_text = job_data['description']
+        resume_keywords = set(get_resume_features(resume_data)['keywords'])
+        job_weights = self._job_term_weights(job_data)
         
-        return self.preprocessor.similarity_score(resume_text, job_text)
+        # Share of the job's TF-IDF keyword weight that the resume covers, so
+        # rare, specific terms count for more than words every posting uses
+        total_weight = sum(job_weights.values())
+        if not total_weight:
+            return 0.0
+        
+        matched_weight = sum(weight for keyword, weight in job_weights.items() if keyword in resume_keywords)
+        keyword_score = matched_weight / total_weight
+        
+        # Phrases like "machine learning" only count when the words stand together
+        phrase_score = self._calculate_phrase_score(resume_data, job_data)
+        if phrase_score is None:
+            return keyword_score
+        return (1 - PHRASE_WEIGHT) * keyword_score + PHRASE_WEIGHT * phrase_score
+    
+    def _calculate_phrase_score(self, resume_data: Dict, job_data: Dict) -> Optional[float]:
+        """Share of the job's hashed two-word phrases found in the resume, None when there are none to compare"""
+        resume_phrases = get_resume_features(resume_data).get('phrases')
+        if resume_phrases is None:
+            return None
+        return hashed_coverage(get_job_features(job_data).get('phrases') or [], resume_phrases)
+    
+    def _job_term_weights(self, job_data: Dict) -> Dict[str, int]:
+        """TF-IDF weight of each job keyword"""
+        return keyword_stats.job_term_weights(get_job_features(job_data))
     
     def _calculate_experience_score(self, resume_data: Dict, job_data: Dict) -> float:
         """Calculate score based on experience match"""
@@ -307,4 +258,85 @@ class SkillMatcher:
         if not recommendations:
             recommendations.append("Your resume shows good alignment with the job requirements. Consider adding specific metrics and achievements to strengthen your profile.")
         
-        return recommendations[:5]  # Limit to 5 recommendations
\ No newline at end of file
+        return recommendations[:5]  # Limit to 5 recommendations
+
+class MatchResult(Mapping):
+    """Result of matching one resume against one job.
+
+    Reads like the dict analyze_match used to return, but each part is
+    computed on first access and kept, so asking for the score does not build
+    recommendations and asking for skills does not score keywords. If a part
+    fails, the result turns into the ``{'error': ...}`` mapping analyze_match
+    returned for failures, so ``get`` falls back to its default and
+    ``to_dict`` gives the error payload.
+    """
+    KEYS = ('ats_score', 'score_breakdown', 'skill_analysis', 'recommendations', 'match_details')
+    
+    def __init__(self, matcher: SkillMatcher, resume_data: Dict, job_data: Dict):
+        self.matcher = matcher
+        self.resume_data = resume_data
+        self.job_data = job_data
+        self.error = None
+    
+    @cached_property
+    def resume_skills(self) -> List[str]:
+        return self.matcher._extract_resume_skills(self.resume_data)
+    
+    @cached_property
+    def job_skills(self) -> List[str]:
+        return self.matcher._extract_job_skills(self.job_data)
+    
+    @cached_property
+    def skill_analysis(self) -> Dict:
+        return self.matcher._analyze_skills(self.resume_skills, self.job_skills)
+    
+    @cached_property
+    def score_components(self) -> Dict[str, float]:
+        """Unrounded points per scoring factor"""
+        return self.matcher._calculate_score_breakdown(self.resume_data, self.job_data, self.skill_analysis)
+    
+    @cached_property
+    def ats_score(self) -> int:
+        return self.matcher._total_score(self.score_components)
+    
+    @cached_property
+    def score_breakdown(self) -> Dict[str, float]:
+        return {name: round(value, 1) for name, value in self.score_components.items()}
+    
+    @cached_property
+    def recommendations(self) -> List[str]:
+        return self.matcher._generate_recommendations(self.skill_analysis, self.job_data)
+    
+    @cached_property
+    def match_details(self) -> Dict:
+        matched = len(self.skill_analysis['matched_skills'])
+        return {
+            'total_job_skills': len(self.job_skills),
+            'matched_skills': matched,
+            'missing_skills': len(self.skill_analysis['missing_skills']),
+            'match_percentage': (matched / len(self.job_skills) * 100) if self.job_skills else 0
+        }
+    
+    def __getitem__(self, key):
+        if key == 'error' and self.error:
+            return self.error
+        if key not in self.KEYS or self.error:
+            raise KeyError(key)
+        try:
+            return getattr(self, key)
+        except Exception as e:
+            self.error = f'Error in skill matching: {str(e)}'
+            raise KeyError(key) from e
+    
+    def __iter__(self):
+        return iter(('error',) if self.error else self.KEYS)
+    
+    def __len__(self):
+        return 1 if self.error else len(self.KEYS)
+    
+    def to_dict(self) -> Dict:
+        """Every part as a plain dict, for JSON responses, or the error if one fails"""
+        try:
+            return {key: self[key] for key in self.KEYS}
+        except KeyError:
+            return {'error': self.error}
@@ -0,0 +1,203 @@
+"""Typo-tolerant skill resolution over the taxonomy's names and aliases.
+
+Lookups use a symmetric-delete index (as in SymSpell): every term is stored
+under each string obtained by deleting up to ``MAX_EDIT_DISTANCE``
+characters from it, so a misspelling finds its candidates by generating its
+own deletes and looking them up, and only those candidates get a full
+edit-distance check. Terms are compared with spaces and ``.``, ``-``, ``_``
+and ``/`` removed, so "Node JS" and "React.JS" resolve without any edits.
+
+Short terms are only matched exactly, and a term that is equally close to
+two different skills is left unresolved. Common English words that sit an
+edit or two away from a skill ("sprint", "trails", "docket") are never
+corrected. Resolved terms are cached.
+"""
+from typing import Dict, Iterable, List, Mapping, Optional, Set, Tuple
+from services.skill_taxonomy import SKILL_IDS, SKILLS_BY_ID, canonical_name, resolve_skill
+from utils.lru_cache import LRUCache
+
+MAX_EDIT_DISTANCE = 2
+
+# Shortest term allowed one edit, and the shortest allowed two
+MIN_LENGTH_ONE_EDIT = 4
+MIN_LENGTH_TWO_EDITS = 8
+
+# Resume tokens are ordinary words far more often than skills, so only longer
+# tokens are corrected and only by a single edit
+MIN_TOKEN_LENGTH = 6
+TOKEN_EDIT_DISTANCE = 1
+
+# Shorter skill names are too often real words or other skills to correct
+MIN_NAME_LENGTH = 6
+
+# Words within reach of a taxonomy name that must stay what they are
+COMMON_WORDS = frozenset({
+    # bash, sass
+    'dash', 'bask', 'base', 'bath', 'cash', 'hash', 'wash', 'rash', 'mash', 'bass',
+    'bush', 'gash', 'lash', 'sash', 'pass', 'mass', 'lass', 'sags',
+    # chai, jest, less, node, ruby, rust, unix, java
+    'chair', 'chain', 'chat', 'char', 'just', 'best', 'test', 'rest', 'zest', 'lest',
+    'vest', 'west', 'nest', 'pest', 'loss', 'mess', 'code', 'mode', 'note', 'none',
+    'nose', 'lode', 'rode', 'nude', 'nodes', 'nods', 'rugby', 'rube', 'rubs', 'rush',
+    'must', 'bust', 'dust', 'gust', 'lust', 'oust', 'rusty', 'trust', 'crust', 'unit',
+    'lava',
+    # rails
+    'trail', 'trails', 'rail', 'fails', 'sails', 'mails', 'nails', 'tails', 'jails',
+    'hails', 'wails', 'rains', 'raise', 'raids', 'roils',
+    # scala, spark, spring, slack, flask, mongo, react, redux, swift
+    'scalar', 'scalars', 'scale', 'scales', 'scaled', 'scalp', 'scald', 'spare',
+    'spars', 'stark', 'spank', 'shark', 'sparks', 'sprint', 'sprints', 'string',
+    'strings', 'sprang', 'sprung', 'springs', 'sprig', 'springy', 'stack', 'stacks',
+    'slick', 'black', 'flack', 'snack', 'slake', 'flash', 'flank', 'mango', 'mongol',
+    'reacts', 'redact', 'reach', 'redox', 'shift', 'sift',
+    # docker, ember, express, ionic, flutter and longer names
+    'docket', 'dockets', 'docked', 'locker', 'rocker', 'decker', 'dicker', 'ducker',
+    'embed', 'amber', 'embers', 'member', 'expresso', 'espresso', 'expressed',
+    'expresses', 'expressly', 'iconic', 'ironic', 'tonic', 'sonic', 'conic', 'bionic',
+    'flatter', 'clutter', 'fluster', 'flitter', 'tailwinds', 'terraforms',
+    'terraformed', 'influence', 'confluent', 'cordovan', 'linus', 'postmen',
+})
+
+_SEPARATORS = str.maketrans('', '', ' .-_/')
+_MISSING = object()
+
+def squash(term: str) -> str:
+    """Lowercase a term and drop the separators skill names are written with"""
+    return term.lower().strip().translate(_SEPARATORS)
+
+def allowed_distance(term: str) -> int:
+    """Edits tolerated for a term of this length"""
+    if len(term) >= MIN_LENGTH_TWO_EDITS:
+        return 2
+    if len(term) >= MIN_LENGTH_ONE_EDIT:
+        return 1
+    return 0
+
+def _deletes(term: str, max_distance: int) -> Set[str]:
+    """The term and every string made by deleting up to max_distance characters"""
+    results = {term}
+    frontier = {term}
+    for _ in range(max_distance):
+        frontier = {word[:i] + word[i + 1:] for word in frontier for i in range(len(word))} - results
+        results |= frontier
+    return results
+
+def edit_distance(source: str, target: str, max_distance: int) -> Optional[int]:
+    """Optimal string alignment distance (adjacent swaps count as one edit), or None above max_distance"""
+    if abs(len(source) - len(target)) > max_distance:
+        return None
+
+    previous_previous = None
+    previous = list(range(len(target) + 1))
+    for i in range(1, len(source) + 1):
+        current = [i] + [0] * len(target)
+        for j in range(1, len(target) + 1):
+            cost = 0 if source[i - 1] == target[j - 1] else 1
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if (i > 1 and j > 1 and source[i - 1] == target[j - 2]
+                    and source[i - 2] == target[j - 1]):
+                current[j] = min(current[j], previous_previous[j - 2] + 1)
+        if min(current) > max_distance:
+            return None
+        previous_previous, previous = previous, current
+
+    distance = previous[-1]
+    return distance if distance <= max_distance else None
+
+class FuzzySkillResolver:
+    def __init__(self, term_ids: Mapping[str, int], max_distance: int = MAX_EDIT_DISTANCE):
+        self.max_distance = max_distance
+        self._terms = {}  # squashed term -> skill id
+        ambiguous = set()
+        for term, skill_id in term_ids.items():
+            key = squash(term)
+            if self._terms.setdefault(key, skill_id) != skill_id:
+                ambiguous.add(key)
+        for key in ambiguous:
+            del self._terms[key]
+
+        self._index = {}  # delete -> squashed terms it came from
+        for key in self._terms:
+            for delete in _deletes(key, min(allowed_distance(key), max_distance)):
+                self._index.setdefault(delete, []).append(key)
+
+    def lookup(self, term: str, max_distance: Optional[int] = None) -> Optional[Tuple[int, int]]:
+        """Closest skill to a term as (skill id, edit distance), or None if none or several are closest"""
+        key = squash(term)
+        if key in self._terms:
+            return self._terms[key], 0
+
+        limit = allowed_distance(key)
+        if max_distance is not None:
+            limit = min(limit, max_distance)
+        limit = min(limit, self.max_distance)
+        if limit == 0:
+            return None
+
+        best_distance = limit + 1
+        best_ids = set()
+        checked = set()
+        for delete in _deletes(key, limit):
+            for candidate in self._index.get(delete, ()):
+                if candidate in checked:
+                    continue
+                checked.add(candidate)
+                distance = edit_distance(key, candidate, min(limit, allowed_distance(candidate)))
+                if distance is None or distance > best_distance:
+                    continue
+                if distance < best_distance:
+                    best_distance = distance
+                    best_ids = set()
+                best_ids.add(self._terms[candidate])
+
+        if len(best_ids) != 1:
+            return None
+        return best_ids.pop(), best_distance
+
+_resolver = FuzzySkillResolver(SKILL_IDS)
+_cache = LRUCache(4096)
+
+def resolve_skill_fuzzy(term: str, max_distance: Optional[int] = None) -> Optional[int]:
+    """Get skill id for a name or alias, tolerating separators and small typos"""
+    skill_id = resolve_skill(term)
+    if skill_id is not None or not term:
+        return skill_id
+
+    # Common words still match through separators, never through edits
+    if term.lower().strip() in COMMON_WORDS:
+        max_distance = 0
+
+    key = (term, max_distance)
+    skill_id = _cache.get(key, _MISSING)
+    if skill_id is _MISSING:
+        match = _resolver.lookup(term, max_distance)
+        skill_id = match[0] if match else None
+        _cache.put(key, skill_id)
+    return skill_id
+
+def fuzzy_canonical_name(term: str) -> str:
+    """Get canonical skill name for a possibly misspelled term, or the lowercased term if unknown"""
+    # Short names are only matched through aliases and separators
+    max_distance = None if len(squash(term)) >= MIN_NAME_LENGTH else 0
+    skill_id = resolve_skill_fuzzy(term, max_distance)
+    return SKILLS_BY_ID[skill_id].name if skill_id is not None else canonical_name(term)
+
+def find_misspelled_skills(tokens: Iterable[str], known_ids: Iterable[int] = ()) -> List[str]:
+    """Canonical names of skills that tokens with no exact match correct to, in taxonomy order.
+
+    Pass only tokens that are meant to be skills, such as a skills section;
+    free text has too many ordinary words one edit away from a skill.
+    """
+    found = set()
+    skipped = set(known_ids)
+    for token in tokens:
+        if len(token) < MIN_TOKEN_LENGTH or token in SKILL_IDS:
+            continue
+        skill_id = resolve_skill_fuzzy(token, TOKEN_EDIT_DISTANCE)
+        if skill_id is not None and skill_id not in skipped:
+            found.add(skill_id)
+    return [SKILLS_BY_ID[skill_id].name for skill_id in sorted(found)]
+
+def cache_stats() -> Dict:
+    """Hit and miss counts of the resolved-term cache"""
+    return _cache.stats()
@@ -0,0 +1,153 @@
+import re
+from collections import deque
+from typing import Dict, Iterable, List, Tuple
+
+# Splits text into word runs and single symbol characters, capturing any
+# whitespace in front so multi-word terms only match adjacent tokens.
+_TOKEN_PATTERN = re.compile(r'(\s*)(\w+|[^\w\s])')
+
+def _tokenize(text: str) -> List[Tuple[bool, str]]:
+    """Split a term into (preceded_by_space, token) pairs"""
+    return [(bool(space), token) for space, token in _TOKEN_PATTERN.findall(text)]
+
+def _is_word(token: str) -> bool:
+    return token[0].isalnum() or token[0] == '_'
+
+class SkillScanner:
+    """Aho-Corasick automaton over word/symbol tokens.
+
+    All terms are found in a single pass over the text. Because the automaton
+    walks whole ``\\w+`` runs, word-boundary semantics hold for every term,
+    including ones that start or end with symbols such as ``c++``, ``c#``,
+    ``.net`` and ``node.js``.
+    """
+
+    def __init__(self, terms: Iterable[str]):
+        self.terms = []
+        self._term_ids = {}
+        self._term_lengths = []
+        self._term_edges = []
+
+        # State 0 is the root; its transitions ignore leading whitespace
+        self._goto = [{}]
+        self._fail = [0]
+        self._output = [()]
+
+        for term in terms:
+            self._add_term(term.lower().strip())
+
+        self._build_failure_links()
+
+    def _add_term(self, term: str):
+        """Insert a term into the trie"""
+        if not term or term in self._term_ids:
+            return
+
+        tokens = _tokenize(term)
+        term_id = len(self.terms)
+        self.terms.append(term)
+        self._term_ids[term] = term_id
+        self._term_lengths.append(len(tokens))
+        self._term_edges.append((_is_word(tokens[0][1]), _is_word(tokens[-1][1])))
+
+        state = 0
+        for index, (space, token) in enumerate(tokens):
+            key = token if state == 0 else (space, token)
+            next_state = self._goto[state].get(key)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append(())
+                self._goto[state][key] = next_state
+            state = next_state
+
+        self._output[state] = self._output[state] + (term_id,)
+
+    def _build_failure_links(self):
+        """Compute failure links and merged outputs breadth-first"""
+        queue = deque()
+        for next_state in self._goto[0].values():
+            queue.append(next_state)
+
+        while queue:
+            state = queue.popleft()
+            for key, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fail_state = self._step(self._fail[state], key)
+                self._fail[next_state] = fail_state
+                if self._output[fail_state]:
+                    self._output[next_state] = self._output[next_state] + self._output[fail_state]
+
+    def _step(self, state: int, key: Tuple[bool, str]) -> int:
+        """Follow goto/failure transitions for one token"""
+        while True:
+            if state == 0:
+                return self._goto[0].get(key[1], 0)
+            next_state = self._goto[state].get(key)
+            if next_state is not None:
+                return next_state
+            state = self._fail[state]
+
+    def scan(self, text: str) -> List[Tuple[int, int, str]]:
+        """Find all term occurrences as (start, end, term) character spans"""
+        if not text:
+            return []
+
+        tokens = list(_TOKEN_PATTERN.finditer(text.lower()))
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        hits = []
+        state = 0
+
+        for index, match in enumerate(tokens):
+            space, token = match.group(1, 2)
+            key = (bool(space), token)
+
+            # Inlined _step for speed
+            while True:
+                if state == 0:
+                    state = goto[0].get(token, 0)
+                    break
+                next_state = goto[state].get(key)
+                if next_state is not None:
+                    state = next_state
+                    break
+                state = fail[state]
+
+            if output[state]:
+                for term_id in output[state]:
+                    start_index = index - self._term_lengths[term_id] + 1
+                    if self._has_boundaries(tokens, start_index, index, term_id):
+                        hits.append((tokens[start_index].start(2), match.end(2), self.terms[term_id]))
+
+        return hits
+
+    def _has_boundaries(self, tokens, start_index: int, end_index: int, term_id: int) -> bool:
+        """Reject symbol-edged terms glued to a neighbouring word (e.g. '.net' in 'asp.net')"""
+        starts_with_word, ends_with_word = self._term_edges[term_id]
+
+        if not starts_with_word and start_index > 0:
+            space, token = tokens[start_index].group(1, 2)
+            if not space and _is_word(tokens[start_index - 1].group(2)):
+                return False
+
+        if not ends_with_word and end_index + 1 < len(tokens):
+            space, token = tokens[end_index + 1].group(1, 2)
+            if not space and _is_word(token):
+                return False
+
+        return True
+
+    def count(self, text: str) -> Dict[str, int]:
+        """Count occurrences of each term found in text"""
+        counts = {}
+        for _, _, term in self.scan(text):
+            counts[term] = counts.get(term, 0) + 1
+        return counts
+
+    def find(self, text: str) -> List[str]:
+        """Get distinct terms found in text, in term order"""
+        counts = self.count(text)
+        return [term for term in self.terms if term in counts]
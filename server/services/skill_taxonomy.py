@@ -0,0 +1,101 @@
+"""Shared skill taxonomy loaded once at import from data/skill_taxonomy.json.
+
+Every extractor and matcher resolves skills through the frozen tables here,
+so skill names, ids and categories are consistent across code paths.
+"""
+import json
+import os
+from types import MappingProxyType
+from typing import Dict, List, NamedTuple, Optional, Tuple
+from services.skill_scanner import SkillScanner
+
+TAXONOMY_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'skill_taxonomy.json')
+
+class Skill(NamedTuple):
+    id: int
+    name: str
+    label: str
+    category: str
+    aliases: Tuple[str, ...]
+
+def _load_taxonomy(path):
+    """Read the taxonomy data file and build lookup tables"""
+    with open(path, encoding='utf-8') as file:
+        data = json.load(file)
+
+    categories = data['categories']
+    skills = []
+    term_ids = {}
+    scan_term_ids = {}
+
+    for entry in data['skills']:
+        if entry['category'] not in categories:
+            raise ValueError(f"Unknown category for skill {entry['name']}: {entry['category']}")
+
+        skill = Skill(
+            id=entry['id'],
+            name=entry['name'].lower(),
+            label=entry['label'],
+            category=entry['category'],
+            aliases=tuple(alias.lower() for alias in entry.get('aliases', []))
+        )
+        lookup_only = {alias.lower() for alias in entry.get('lookupOnly', [])}
+
+        for term in (skill.name,) + skill.aliases:
+            if term_ids.setdefault(term, skill.id) != skill.id:
+                raise ValueError(f"Term '{term}' is assigned to more than one skill")
+            if term not in lookup_only:
+                scan_term_ids[term] = skill.id
+
+        skills.append(skill)
+
+    return data['version'], categories, skills, term_ids, scan_term_ids
+
+TAXONOMY_VERSION, _categories, _skills, _term_ids, _scan_term_ids = _load_taxonomy(TAXONOMY_PATH)
+
+# Frozen lookup tables
+CATEGORY_WEIGHTS = MappingProxyType(dict(_categories))
+SKILLS = tuple(sorted(_skills, key=lambda skill: skill.id))
+SKILLS_BY_ID = MappingProxyType({skill.id: skill for skill in SKILLS})
+SKILL_IDS = MappingProxyType(_term_ids)
+SKILL_NAMES = tuple(skill.name for skill in SKILLS)
+
+_SCAN_TERM_IDS = MappingProxyType(_scan_term_ids)
+_SCANNER = SkillScanner(_scan_term_ids)
+
+del _categories, _skills, _term_ids, _scan_term_ids
+
+def resolve_skill(term: str) -> Optional[int]:
+    """Get skill id for a canonical name or alias"""
+    if not term:
+        return None
+    return SKILL_IDS.get(term.lower().strip())
+
+def canonical_name(term: str) -> str:
+    """Get canonical skill name, or the lowercased term if unknown"""
+    term = term.lower().strip()
+    skill_id = SKILL_IDS.get(term)
+    return SKILLS_BY_ID[skill_id].name if skill_id is not None else term
+
+def scan_skill_ids(text: str) -> Dict[int, int]:
+    """Count mentions of each taxonomy skill in text, keyed by skill id"""
+    counts = {}
+    last_end = {}
+
+    for start, end, term in _SCANNER.scan(text):
+        skill_id = _SCAN_TERM_IDS[term]
+        # An alias containing another alias ('spring boot', 'spring') is one mention
+        if start < last_end.get(skill_id, -1):
+            continue
+        last_end[skill_id] = end
+        counts[skill_id] = counts.get(skill_id, 0) + 1
+
+    return counts
+
+def find_skills(text: str) -> List[str]:
+    """Get canonical names of skills mentioned in text, in taxonomy order"""
+    return [SKILLS_BY_ID[skill_id].name for skill_id in sorted(scan_skill_ids(text))]
+
+def find_skill_labels(text: str) -> List[str]:
+    """Get display labels of skills mentioned in text, in taxonomy order"""
+    return [SKILLS_BY_ID[skill_id].label for skill_id in sorted(scan_skill_ids(text))]
@@ -1,6 +1,138 @@
 import re
 import string
-from typing import List, Dict
+import zlib
+from collections import Counter
+from itertools import islice
+from typing import Dict, FrozenSet, Iterable, List, NamedTuple, Optional, Tuple, Union
+import numpy as np
+from services.skill_resolver import fuzzy_canonical_name
+
+_WORD_PATTERN = re.compile(r'\w+')
+
+# Width of the hashed n-gram feature space (the hashing trick)
+NGRAM_FEATURES = 2 ** 20
+
+_HASH_MULTIPLIER = np.uint64(1099511628211)  # 64-bit FNV prime, arithmetic wraps mod 2^64
+# Tokens hashed per step; with the feature vector this bounds working memory
+_NGRAM_CHUNK_TOKENS = 4096
+
+# Punctuation that ends a phrase: an n-gram never spans a comma or a full stop
+_PHRASE_BREAKS = ',.;:()'
+
+class HashedFeatures(NamedTuple):
+    """Sparse count vector over the hashed n-gram space, indices sorted ascending"""
+    indices: np.ndarray
+    counts: np.ndarray
+    size: int
+
+def hash_ngrams(tokens: Iterable[Optional[str]], sizes: Tuple[int, ...] = (2,),
+                num_features: int = NGRAM_FEATURES) -> HashedFeatures:
+    """Hash the n-grams of a token stream into a fixed-width sparse count vector.
+
+    Tokens are consumed in order, a chunk at a time, and each n-gram's index
+    is combined from the hashes of its tokens, so no n-gram string is built.
+    A ``None`` token is a break that no n-gram spans. Working memory is one
+    chunk plus the distinct indices seen so far, at most ``num_features``,
+    whatever the document length.
+    """
+    longest = max(sizes)
+    width = np.uint64(num_features)
+    indices = np.empty(0, dtype=np.uint64)
+    counts = np.empty(0, dtype=np.float64)
+    carry = np.empty(0, dtype=np.uint64)  # last tokens of the previous chunk
+    carry_breaks = np.empty(0, dtype=np.int64)
+
+    iterator = iter(tokens)
+    while True:
+        chunk = list(islice(iterator, _NGRAM_CHUNK_TOKENS))
+        if not chunk:
+            break
+        hashes = np.concatenate([carry, np.fromiter(
+            (0 if token is None else zlib.crc32(token.encode('utf-8')) for token in chunk),
+            dtype=np.uint64, count=len(chunk))])
+        breaks = np.concatenate([carry_breaks, np.fromiter(
+            (token is None for token in chunk), dtype=np.int64, count=len(chunk))])
+        # breaks_before[i] is the number of breaks among the first i tokens
+        breaks_before = np.concatenate([[0], np.cumsum(breaks)])
+
+        found = [indices]
+        for size in sizes:
+            # N-grams ending in this chunk; those ending in the carry were counted already
+            first_end = max(len(carry), size - 1)
+            if first_end >= len(hashes):
+                continue
+            ends = np.arange(first_end, len(hashes))
+            ends = ends[breaks_before[ends + 1] == breaks_before[ends + 1 - size]]
+            # Seed with the size so a unigram and a bigram never share a value
+            value = np.full(len(ends), size, dtype=np.uint64)
+            for offset in range(size - 1, -1, -1):
+                value = (value * _HASH_MULTIPLIER) ^ hashes[ends - offset]
+            found.append(value % width)
+
+        weights = np.concatenate([counts] + [np.ones(len(part)) for part in found[1:]])
+        indices, inverse = np.unique(np.concatenate(found), return_inverse=True)
+        counts = np.bincount(inverse.ravel(), weights=weights, minlength=len(indices))
+        keep = min(longest - 1, len(hashes))
+        carry = hashes[len(hashes) - keep:]
+        carry_breaks = breaks[len(breaks) - keep:]
+
+    return HashedFeatures(indices.astype(np.uint32), counts.astype(np.uint32), num_features)
+
+def hashed_coverage(reference: Iterable[int], other: Iterable[int]) -> Optional[float]:
+    """Share of the reference's hashed n-gram indices also found in other, None without any"""
+    reference = set(reference)
+    if not reference:
+        return None
+    return len(reference.intersection(other)) / len(reference)
+
+def count_whole_words(text: str, terms: List[str]) -> Dict[str, int]:
+    """Count non-overlapping whole-word occurrences of each term in one pass over text.
+
+    Gives the same counts as ``len(re.findall(r'\\b' + re.escape(term) + r'\\b', text))``.
+    A match of a term that starts and ends with a word character covers whole
+    words of the text, so the text is split into words once; single-word terms
+    are looked up in a word count, and terms spanning several words
+    (``node.js``, ``ci-cd``) are checked at each occurrence of their first word.
+    """
+    words = []
+    separators = []
+    previous_end = None
+    for match in _WORD_PATTERN.finditer(text):
+        if previous_end is not None:
+            separators.append(text[previous_end:match.start()])
+        words.append(match.group())
+        previous_end = match.end()
+
+    word_counts = Counter(words)
+    counts = {}
+    compound_terms = {}
+    for term in terms:
+        if term in counts:
+            continue
+        term_words = _WORD_PATTERN.findall(term)
+        if not term_words or not _WORD_PATTERN.match(term[0]) or not _WORD_PATTERN.match(term[-1]):
+            # Symbol-edged terms have different boundary rules; keep the regex for them
+            counts[term] = len(re.findall(r'\b' + re.escape(term) + r'\b', text))
+        elif len(term_words) == 1:
+            counts[term] = word_counts.get(term, 0)
+        else:
+            compound_terms.setdefault(term_words[0], []).append(
+                (term, term_words, _WORD_PATTERN.split(term)[1:-1])
+            )
+            counts[term] = 0
+
+    if compound_terms:
+        next_start = {}
+        for index, word in enumerate(words):
+            for term, term_words, term_separators in compound_terms.get(word, ()):
+                end = index + len(term_words)
+                # Like re.findall, resume scanning after the end of the previous match
+                if (index >= next_start.get(term, 0) and words[index:end] == term_words and
+                        separators[index:end - 1] == term_separators):
+                    counts[term] += 1
+                    next_start[term] = end
+
+    return {term: count for term, count in counts.items() if count > 0}
 
 class TextPreprocessor:
     def __init__(self):
@@ -16,8 +148,16 @@ class TextPreprocessor:
             'come', 'made', 'may', 'part'
         }
     
+    def tokenize(self, text: Union[str, 'TokenizedText'], cleaned: bool = False) -> 'TokenizedText':
+        """Wrap text in a TokenizedText so its derived views are computed once"""
+        if isinstance(text, TokenizedText):
+            return text
+        return TokenizedText(text, self, cleaned)
+    
     def clean_text(self, text: str) -> str:
         """Clean and preprocess text"""
+        if isinstance(text, TokenizedText):
+            return text.cleaned
         if not text:
             return ""
         
@@ -35,88 +175,31 @@ class TextPreprocessor:
         
         return text.strip()
     
-    def extract_keywords(self, text: str, min_length: int = 2) -> List[str]:
+    def extract_keywords(self, text: Union[str, 'TokenizedText'], min_length: int = 2) -> List[str]:
         """Extract keywords from text"""
-        if not text:
-            return []
-        
-        # Clean text
-        cleaned_text = self.clean_text(text)
-        
-        # Split into words
-        words = cleaned_text.split()
-        
-        # Filter words
-        keywords = []
-        for word in words:
-            # Remove punctuation
-            word = word.strip(string.punctuation)
-            
-            # Skip if too short, is stop word, or is numeric
-            if (len(word) >= min_length and 
-                word.lower() not in self.stop_words and 
-                not word.isdigit()):
-                keywords.append(word.lower())
-        
-        return list(set(keywords))  # Remove duplicates
+        return list(self.tokenize(text).keywords(min_length))
     
-    def calculate_keyword_frequency(self, text: str) -> Dict[str, int]:
+    def calculate_keyword_frequency(self, text: Union[str, 'TokenizedText']) -> Dict[str, int]:
         """Calculate frequency of keywords in text"""
-        keywords = self.extract_keywords(text)
-        frequency = {}
-        
-        text_lower = text.lower()
-        for keyword in keywords:
-            # Count occurrences using word boundaries
-            pattern = r'\b' + re.escape(keyword) + r'\b'
-            count = len(re.findall(pattern, text_lower))
-            if count > 0:
-                frequency[keyword] = count
-        
-        return frequency
+        return dict(self.tokenize(text).keyword_frequency)
     
-    def extract_phrases(self, text: str, phrase_length: int = 2) -> List[str]:
+    def extract_phrases(self, text: Union[str, 'TokenizedText'], phrase_length: int = 2) -> List[str]:
         """Extract n-gram phrases from text"""
-        if not text:
-            return []
-        
-        words = self.extract_keywords(text)
-        phrases = []
-        
-        for i in range(len(words) - phrase_length + 1):
-            phrase = ' '.join(words[i:i + phrase_length])
-            phrases.append(phrase)
-        
-        return phrases
+        return list(self.tokenize(text).phrases(phrase_length))
+    
+    def extract_hashed_ngrams(self, text: Union[str, 'TokenizedText'], sizes: Tuple[int, ...] = (2,),
+                              num_features: int = NGRAM_FEATURES) -> HashedFeatures:
+        """Extract n-gram features as a fixed-width hashed sparse vector"""
+        return self.tokenize(text).hashed_ngrams(sizes, num_features)
     
     def normalize_skill_name(self, skill: str) -> str:
-        """Normalize skill names for better matching"""
-        skill = skill.lower().strip()
-        
-        # Common normalizations
-        normalizations = {
-            'js': 'javascript',
-            'ts': 'typescript',
-            'py': 'python',
-            'c++': 'cpp',
-            'c#': 'csharp',
-            'node': 'node.js',
-            'nodejs': 'node.js',
-            'reactjs': 'react',
-            'vuejs': 'vue',
-            'angularjs': 'angular',
-            'postgresql': 'postgres',
-            'mysql': 'mysql',
-            'mongodb': 'mongo',
-            'aws': 'amazon web services',
-            'gcp': 'google cloud platform',
-            'k8s': 'kubernetes'
-        }
-        
-        return normalizations.get(skill, skill)
+        """Normalize skill names for better matching, correcting small typos"""
+        return fuzzy_canonical_name(skill)
     
-    def extract_technical_terms(self, text: str) -> List[str]:
+    def extract_technical_terms(self, text: Union[str, 'TokenizedText']) -> List[str]:
         """Extract technical terms and acronyms"""
+        if isinstance(text, TokenizedText):
+            text = text.text
         if not text:
             return []
         
@@ -135,13 +218,17 @@ class TextPreprocessor:
         
         return list(set(technical_terms))
     
-    def similarity_score(self, text1: str, text2: str) -> float:
+    def similarity_score(self, text1: Union[str, 'TokenizedText'], text2: Union[str, 'TokenizedText']) -> float:
         """Calculate similarity score between two texts based on common keywords"""
         if not text1 or not text2:
             return 0.0
         
-        keywords1 = set(self.extract_keywords(text1))
-        keywords2 = set(self.extract_keywords(text2))
+        return self.keyword_similarity(self.tokenize(text1).keyword_set, self.tokenize(text2).keyword_set)
+    
+    def keyword_similarity(self, keywords1, keywords2) -> float:
+        """Calculate Jaccard similarity between two keyword collections"""
+        keywords1 = set(keywords1)
+        keywords2 = set(keywords2)
         
         if not keywords1 or not keywords2:
             return 0.0
@@ -150,4 +237,124 @@ class TextPreprocessor:
         intersection = keywords1.intersection(keywords2)
         union = keywords1.union(keywords2)
         
-        return len(intersection) / len(union) if union else 0.0
\ No newline at end of file
+        return len(intersection) / len(union) if union else 0.0
+
+class TokenizedText:
+    """A document whose cleaned text, tokens, keywords and n-grams are computed once"""
+    
+    def __init__(self, text: str, preprocessor: Optional[TextPreprocessor] = None, cleaned: bool = False):
+        self.text = text or ''
+        self.preprocessor = preprocessor or TextPreprocessor()
+        
+        # Text that already went through clean_text is its own cleaned form
+        self._cleaned = self.text if cleaned else None
+        self._tokens = None
+        self._keyword_tokens = None
+        self._keywords = {}
+        self._keyword_set = None
+        self._keyword_frequency = None
+        self._phrase_words = None
+        self._phrases = {}
+        self._hashed_ngrams = {}
+    
+    def __bool__(self):
+        return bool(self.text)
+    
+    def __str__(self):
+        return self.text
+    
+    @property
+    def cleaned(self) -> str:
+        """Text after TextPreprocessor.clean_text"""
+        if self._cleaned is None:
+            self._cleaned = self.preprocessor.clean_text(self.text)
+        return self._cleaned
+    
+    @property
+    def tokens(self) -> List[str]:
+        """Whitespace tokens of the cleaned text"""
+        if self._tokens is None:
+            self._tokens = self.cleaned.split()
+        return self._tokens
+    
+    @property
+    def keyword_tokens(self) -> List[str]:
+        """Tokens that qualify as keywords, in document order and with repeats"""
+        if self._keyword_tokens is None:
+            stop_words = self.preprocessor.stop_words
+            keyword_tokens = []
+            for token in self.tokens:
+                word = token.strip(string.punctuation)
+                if len(word) >= 2 and word not in stop_words and not word.isdigit():
+                    keyword_tokens.append(word)
+            self._keyword_tokens = keyword_tokens
+        return self._keyword_tokens
+    
+    def keywords(self, min_length: int = 2) -> List[str]:
+        """Distinct keywords: tokens without edge punctuation, stop words and numbers"""
+        if min_length == 2 and min_length not in self._keywords:
+            self._keywords[min_length] = list(set(self.keyword_tokens))
+        if min_length not in self._keywords:
+            stop_words = self.preprocessor.stop_words
+            keywords = set()
+            for token in self.tokens:
+                word = token.strip(string.punctuation)
+                if len(word) >= min_length and word not in stop_words and not word.isdigit():
+                    keywords.add(word)
+            self._keywords[min_length] = list(keywords)
+        return self._keywords[min_length]
+    
+    @property
+    def keyword_set(self) -> FrozenSet[str]:
+        """Default keywords as a set, for similarity measures"""
+        if self._keyword_set is None:
+            self._keyword_set = frozenset(self.keywords())
+        return self._keyword_set
+    
+    @property
+    def keyword_frequency(self) -> Dict[str, int]:
+        """Whole-word occurrences of each keyword in the lowercased text"""
+        if self._keyword_frequency is None:
+            self._keyword_frequency = count_whole_words(self.text.lower(), self.keywords())
+        return self._keyword_frequency
+    
+    @property
+    def phrase_words(self) -> List[Optional[str]]:
+        """Keyword tokens in document order, with None wherever a phrase has to stop.
+
+        Stop words, numbers and punctuation such as commas are breaks, so
+        n-grams only join words that stand next to each other in the text.
+        """
+        if self._phrase_words is None:
+            stop_words = self.preprocessor.stop_words
+            phrase_words = []
+            for token in self.tokens:
+                word = token.strip(string.punctuation)
+                if token[0] in _PHRASE_BREAKS:
+                    phrase_words.append(None)
+                if len(word) >= 2 and word not in stop_words and not word.isdigit():
+                    phrase_words.append(word)
+                else:
+                    phrase_words.append(None)
+                if token[-1] in _PHRASE_BREAKS:
+                    phrase_words.append(None)
+            self._phrase_words = phrase_words
+        return self._phrase_words
+    
+    def phrases(self, phrase_length: int = 2) -> List[str]:
+        """N-grams of adjacent keyword tokens, in document order"""
+        if phrase_length not in self._phrases:
+            words = self.phrase_words
+            self._phrases[phrase_length] = [
+                ' '.join(words[i:i + phrase_length])
+                for i in range(len(words) - phrase_length + 1)
+                if None not in words[i:i + phrase_length]
+            ]
+        return self._phrases[phrase_length]
+    
+    def hashed_ngrams(self, sizes: Tuple[int, ...] = (2,), num_features: int = NGRAM_FEATURES) -> HashedFeatures:
+        """N-grams of adjacent keyword tokens, hashed into a fixed-width sparse vector"""
+        key = (tuple(sizes), num_features)
+        if key not in self._hashed_ngrams:
+            self._hashed_ngrams[key] = hash_ngrams(self.phrase_words, key[0], num_features)
+        return self._hashed_ngrams[key]
@@ -0,0 +1,66 @@
+from datetime import datetime
+import mongomock
+import pytest
+from models import job_model
+from models.job_model import Job
+from services.job_features import JOB_FEATURES_VERSION, build_job_features
+
+@pytest.fixture
+def db():
+    return mongomock.MongoClient().db
+
+@pytest.fixture
+def builds(monkeypatch):
+    calls = []
+
+    def counting_build(job_data):
+        calls.append(job_data.get('title'))
+        return build_job_features(job_data)
+
+    monkeypatch.setattr(job_model, 'build_job_features', counting_build)
+    return calls
+
+def insert_job(db, title, features=None):
+    job = {'title': title, 'companyId': 'c' * 24, 'description': 'Python and Kubernetes services',
+           'requiredSkills': ['Python'], 'status': 'active',
+           'created_at': datetime.utcnow(), 'updated_at': datetime.utcnow()}
+    if features is not None:
+        job['features'] = features
+    return str(db.jobs.insert_one(job).inserted_id)
+
+def test_missing_features_are_rebuilt_once_and_stored(db, builds):
+    job_id = insert_job(db, 'Backend Engineer')
+
+    first = Job(db).get_job_by_id(job_id)
+    second = Job(db).get_job_by_id(job_id)
+
+    assert builds == ['Backend Engineer']
+    assert first['features'] == second['features']
+    assert db.jobs.find_one()['features']['version'] == JOB_FEATURES_VERSION
+
+def test_outdated_features_are_replaced(db, builds):
+    job_id = insert_job(db, 'Backend Engineer', {'version': '1:old', 'skills': [], 'keywords': []})
+
+    job = Job(db).get_job_by_id(job_id)
+
+    assert job['features']['skills'] == ['python', 'kubernetes']
+    assert db.jobs.find_one()['features']['version'] == JOB_FEATURES_VERSION
+
+def test_rebuilt_features_do_not_overwrite_a_newer_edit(db):
+    job_id = insert_job(db, 'Backend Engineer')
+    job = db.jobs.find_one()
+    job['features'] = build_job_features(job)
+    db.jobs.update_one({'_id': job['_id']}, {'$set': {'updated_at': datetime.utcnow(), 'features': 'edited'}})
+
+    assert Job(db)._store_features([job]) == 0
+    assert db.jobs.find_one()['features'] == 'edited'
+
+def test_backfill_stores_every_outdated_block(db, builds):
+    insert_job(db, 'Missing')
+    insert_job(db, 'Outdated', {'version': '1:old', 'skills': [], 'keywords': []})
+    insert_job(db, 'Current', build_job_features({'description': 'Python', 'requiredSkills': []}))
+
+    assert Job(db).backfill_features(batch_size=1) == 2
+    assert sorted(builds) == ['Missing', 'Outdated']
+    assert all(job['features']['version'] == JOB_FEATURES_VERSION for job in db.jobs.find())
+    assert Job(db).backfill_features() == 0
@@ -0,0 +1,105 @@
+import random
+from datetime import datetime, timedelta
+import mongomock
+import pytest
+from benchmarks.corpus import generate_jobs
+from config import Config
+from services.job_index_sync import JobIndexSync
+from services.job_search import JobSearchIndex, tokenize
+
+LOCATIONS = ['Berlin', 'Paris', 'Remote', 'New York']
+
+QUERIES = ['python', 'react engineer', 'kubernetes remote', 'pyth*', 'kube* berlin', 'dat* paris', 'nothingmatches']
+
+def make_job(job_id, title, description='', location='', skills=(), minutes_ago=0):
+    return {'_id': job_id, 'title': title, 'description': description, 'location': location,
+            'requiredSkills': list(skills), 'status': 'active',
+            'created_at': datetime(2024, 1, 1) - timedelta(minutes=minutes_ago)}
+
+@pytest.fixture(scope='module')
+def jobs():
+    rng = random.Random(3)
+    jobs = generate_jobs(300, seed=3)
+    for index, job in enumerate(jobs):
+        job.update({'_id': f'job{index}', 'location': rng.choice(LOCATIONS),
+                    'created_at': datetime(2024, 1, 1) - timedelta(minutes=index)})
+    return jobs
+
+@pytest.fixture(scope='module')
+def index(jobs):
+    index = JobSearchIndex()
+    for job in jobs:
+        index.add(job)
+    return index
+
+def scan(jobs, query):
+    """Jobs whose fields contain every query term, checked one by one"""
+    terms = [(term.rstrip('*'), term.endswith('*')) for term in query.lower().split()]
+    matches = set()
+    for job in jobs:
+        words = set(tokenize(' '.join([job['title'], job['description'], job['location'], ' '.join(job['requiredSkills'])])))
+        if all(any(word.startswith(term) for word in words) if prefix else term in words for term, prefix in terms):
+            matches.add(job['_id'])
+    return matches
+
+@pytest.mark.parametrize('query', QUERIES)
+def test_matches_agree_with_a_full_scan(jobs, index, query):
+    expected = scan(jobs, query)
+    total, page = index.search(query, 0, len(jobs))
+    assert total == len(expected)
+    assert {job_id for job_id, _ in page} == expected
+
+@pytest.mark.parametrize('query', ['python', 'pyth*', ''])
+def test_pages_split_the_ranking_without_gaps(index, query):
+    total, everything = index.search(query, 0, 1000)
+    pages = []
+    for offset in range(0, total, 7):
+        page_total, page = index.search(query, offset, 7)
+        assert page_total == total
+        pages.extend(page)
+    assert pages == everything
+    assert [score for _, score in everything] == sorted((score for _, score in everything), reverse=True)
+
+def test_title_hits_rank_above_description_hits():
+    index = JobSearchIndex()
+    index.add(make_job('body', 'Engineer', description='We use python daily'))
+    index.add(make_job('title', 'Python Engineer', description='We build services'))
+    assert [job_id for job_id, _ in index.search('python')[1]] == ['title', 'body']
+
+def test_empty_query_lists_newest_first():
+    index = JobSearchIndex()
+    for minutes_ago, job_id in [(5, 'old'), (0, 'new'), (2, 'middle')]:
+        index.add(make_job(job_id, 'Engineer', minutes_ago=minutes_ago))
+    assert [job_id for job_id, _ in index.search('')[1]] == ['new', 'middle', 'old']
+
+def test_updates_and_removals_apply_incrementally():
+    index = JobSearchIndex()
+    index.add(make_job('a', 'Python Engineer'))
+    index.add(make_job('b', 'Java Engineer'))
+
+    index.add(make_job('a', 'Golang Engineer'))
+    assert index.search('python') == (0, [])
+    assert [job_id for job_id, _ in index.search('golang')[1]] == ['a']
+
+    index.remove('b')
+    assert index.search('java') == (0, [])
+    assert index.search('engineer')[0] == 1
+    assert len(index) == 1
+
+def test_sync_pulls_writes_from_other_processes(monkeypatch):
+    monkeypatch.setattr(Config, 'JOB_SEARCH_REFRESH', 0)
+    db = mongomock.MongoClient().db
+    now = datetime.utcnow()
+    db.jobs.insert_one({**make_job('a', 'Python Engineer'), 'updated_at': now})
+    db.jobs.insert_one({**make_job('b', 'Closed Python role'), 'status': 'inactive', 'updated_at': now})
+    index = JobSearchIndex()
+    sync = JobIndexSync(index, None)
+
+    sync.sync(db)
+    assert [job_id for job_id, _ in index.search('python')[1]] == ['a']
+
+    later = now + timedelta(seconds=5)
+    db.jobs.update_one({'_id': 'a'}, {'$set': {'status': 'inactive', 'updated_at': later}})
+    db.jobs.insert_one({**make_job('c', 'Python Lead'), 'updated_at': later})
+    sync.sync(db)
+    assert [job_id for job_id, _ in index.search('python')[1]] == ['c']
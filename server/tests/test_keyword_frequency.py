@@ -0,0 +1,58 @@
+import random
+import re
+import pytest
+from services.text_preprocessing import TextPreprocessor, count_whole_words
+
+# Small alphabets make repeated and overlapping words likely
+_ALPHABET = ['a', 'b', 'ab', 'ba', 'x1', '_', 'é', ' ', ' ', '-', '.', ',', '(', ')', '+', '#', '\n', 'A', 'B', '2']
+
+def regex_frequency(text, terms):
+    """The per-keyword loop count_whole_words replaces: one word-boundary findall per term"""
+    frequency = {}
+    for term in terms:
+        count = len(re.findall(r'\b' + re.escape(term) + r'\b', text))
+        if count > 0:
+            frequency[term] = count
+    return frequency
+
+def single_pass_frequency(text, terms):
+    return {term: count for term, count in count_whole_words(text, terms).items() if count > 0}
+
+def random_text(rng, max_pieces=40):
+    return ''.join(rng.choice(_ALPHABET) for _ in range(rng.randint(0, max_pieces)))
+
+def random_terms(rng, text):
+    """Keywords of the text plus arbitrary fragments, including symbol-edged ones"""
+    terms = TextPreprocessor().extract_keywords(text)
+    for _ in range(rng.randint(0, 6)):
+        if text:
+            start = rng.randrange(len(text))
+            terms.append(text[start:start + rng.randint(1, 8)])
+        terms.append(random_text(rng, 6).lower())
+    return terms
+
+@pytest.mark.parametrize('seed', range(20))
+def test_matches_regex_count_on_random_inputs(seed):
+    rng = random.Random(seed)
+    for _ in range(100):
+        text = random_text(rng).lower()
+        terms = random_terms(rng, text)
+        assert single_pass_frequency(text, terms) == regex_frequency(text, terms), (text, terms)
+
+@pytest.mark.parametrize('text, terms', [
+    ('c++ and c# with .net, not c++11', ['c++', 'c#', '.net', 'c']),
+    ('node.js, node js and nodejs', ['node.js', 'node', 'js']),
+    ('ci/cd ci-cd ci / cd', ['ci/cd', 'ci-cd', 'ci', 'cd']),
+    ('(react) [vue] +go+ #rust#', ['(react)', 'react', '+go+', '#rust#', 'rust']),
+    ('a.b.a.b.a', ['a.b', 'b.a', 'a.b.a']),
+    ('++ -- ## ..', ['++', '-', '#', '.']),
+    ('', ['python', 'c++']),
+])
+def test_matches_regex_count_on_symbol_edged_terms(text, terms):
+    assert single_pass_frequency(text, terms) == regex_frequency(text, terms)
+
+def test_keyword_frequency_counts_whole_words():
+    text = 'Python developer, python scripts and pythonic code. Python!'
+    frequency = TextPreprocessor().calculate_keyword_frequency(text)
+    assert frequency['python'] == 3
+    assert frequency['pythonic'] == 1
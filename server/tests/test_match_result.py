@@ -0,0 +1,51 @@
+from flask import Flask
+from services.resume_features import build_resume_features
+from services.resume_parser import ResumeParser
+from services.skill_matcher import SkillMatcher
+from utils.match_helper import get_match
+
+RESUME = 'Jane Doe\njane@example.com\nEXPERIENCE\n5 years of Python\nSKILLS\nPython, Docker\n'
+
+JOB = {'_id': 'job1', 'title': 'Backend Engineer', 'description': 'Python services', 'requiredSkills': ['Python']}
+
+def broken_resume():
+    """A resume whose skills are fine but whose experience fails to score"""
+    resume_data = ResumeParser().parse_text(RESUME)
+    resume_data['features'] = build_resume_features(resume_data)
+    resume_data['experience'] = None
+    return resume_data
+
+def test_working_result_reads_like_a_dict():
+    resume_data = ResumeParser().parse_text(RESUME)
+    analysis = SkillMatcher().analyze_match(resume_data, JOB)
+    assert 'error' not in analysis
+    assert set(analysis.to_dict()) == set(analysis.KEYS)
+    assert analysis['skill_analysis']['matched_skills'] == ['python']
+
+def test_failing_part_gives_the_error_payload():
+    analysis = SkillMatcher().analyze_match(broken_resume(), JOB)
+
+    # Parts that don't depend on the failing one still work
+    assert analysis.get('skill_analysis', {})['matched_skills'] == ['python']
+    assert analysis.get('ats_score', 0) == 0
+    assert 'error' in analysis
+    assert analysis.to_dict() == {'error': analysis['error']}
+    assert analysis['error'].startswith('Error in skill matching: ')
+
+def test_failure_found_by_to_dict():
+    analysis = SkillMatcher().analyze_match(broken_resume(), JOB)
+    payload = analysis.to_dict()
+    assert list(payload) == ['error']
+    assert analysis.get('skill_analysis', {}) == {}
+
+def test_matcher_helpers_fall_back_to_defaults():
+    matcher = SkillMatcher()
+    assert matcher.calculate_ats_score(broken_resume(), JOB) == 0
+
+def test_get_match_reuses_the_result_and_its_error():
+    resume_data = broken_resume()
+    with Flask(__name__).test_request_context():
+        first = get_match(resume_data, JOB)
+        assert first.get('ats_score', 0) == 0
+        assert get_match(resume_data, JOB) is first
+        assert get_match(resume_data, JOB).to_dict() == {'error': first['error']}
@@ -0,0 +1,72 @@
+import random
+import mongomock
+import pytest
+from bson import ObjectId
+from benchmarks.corpus import generate_corpus
+from models.application_model import Application
+from services.minhash import LSH_BANDS, estimated_similarity, find_near_duplicates, lsh_bands, minhash_signature, shingles
+
+def tokens(text):
+    return text.lower().split()
+
+def edited_copy(text, rng, rate=0.01):
+    """The same resume with about one word in a hundred replaced"""
+    return ' '.join(f'edit{rng.randrange(1000)}' if rng.random() < rate else word for word in text.split())
+
+@pytest.fixture(scope='module')
+def resumes():
+    rng = random.Random(7)
+    originals = generate_corpus(40, seed=7, paragraphs=8)
+    copies = [edited_copy(text, rng) for text in originals[:20]]
+    return originals, copies
+
+def test_estimate_tracks_exact_jaccard(resumes):
+    originals, copies = resumes
+    for original, copy in zip(originals, copies):
+        first, second = shingles(tokens(original)), shingles(tokens(copy))
+        exact = len(first & second) / len(first | second)
+        estimate = estimated_similarity(minhash_signature(tokens(original)), minhash_signature(tokens(copy)))
+        assert abs(estimate - exact) < 0.2
+
+def test_lsh_finds_every_known_duplicate(resumes):
+    originals, copies = resumes
+    signatures = [minhash_signature(tokens(text)) for text in originals + copies]
+
+    duplicates = find_near_duplicates(signatures, threshold=0.8)
+
+    for index in range(len(copies)):
+        copy_index = len(originals) + index
+        assert copy_index in [other for other, _ in duplicates.get(index, [])]
+    # Only a resume and its own copy are ever paired
+    for index, found in duplicates.items():
+        for other, _ in found:
+            assert other % len(originals) == index % len(originals)
+
+def test_signatures_are_stable_and_banded():
+    signature = minhash_signature(tokens('Senior Python engineer building data pipelines'))
+    assert signature == minhash_signature(tokens('senior python engineer building data pipelines'))
+    assert len(lsh_bands(signature)) == LSH_BANDS
+    assert minhash_signature([]) is None
+    assert lsh_bands(None) == []
+
+def test_application_lookup_uses_band_keys(resumes):
+    originals, copies = resumes
+    db = mongomock.MongoClient().db
+    model = Application(db)
+    job_id, other_job_id = str(ObjectId()), str(ObjectId())
+
+    def apply(name, text, job):
+        return model.create_application({
+            'candidateId': str(ObjectId()), 'jobId': job, 'candidateName': name, 'email': f'{name}@example.com',
+            'degree': 'BSc', 'experience': '3 years', 'resumeFeatures': {'minhash': minhash_signature(tokens(text))}
+        })
+
+    original = apply('original', originals[0], job_id)
+    apply('copy', copies[0], job_id)
+    apply('other job copy', copies[0], other_job_id)
+    apply('unrelated', originals[1], job_id)
+
+    duplicates = model.get_near_duplicates(original, [job_id], threshold=0.8)
+
+    assert [duplicate['candidateName'] for duplicate in duplicates] == ['copy']
+    assert duplicates[0]['similarity'] >= 0.8
@@ -0,0 +1,69 @@
+import random
+import zlib
+import pytest
+from services import text_preprocessing
+from services.job_features import build_job_features
+from services.resume_features import build_resume_features
+from services.resume_parser import ResumeParser
+from services.skill_matcher import SkillMatcher
+from services.text_preprocessing import TextPreprocessor, hash_ngrams
+
+def reference_ngrams(tokens, sizes, num_features):
+    """Plain Python version of hash_ngrams: count every window without a break"""
+    counts = {}
+    for size in sizes:
+        for end in range(size - 1, len(tokens)):
+            window = tokens[end - size + 1:end + 1]
+            if None in window:
+                continue
+            value = size
+            for token in window:
+                value = ((value * 1099511628211) % 2 ** 64) ^ zlib.crc32(token.encode('utf-8'))
+            index = value % num_features
+            counts[index] = counts.get(index, 0) + 1
+    return counts
+
+def as_dict(features):
+    return dict(zip(features.indices.tolist(), features.counts.tolist()))
+
+def test_phrases_only_join_adjacent_words():
+    document = TextPreprocessor().tokenize('Experience with Python, machine learning and unit testing.')
+    assert document.phrases() == ['machine learning', 'unit testing']
+
+def test_hashed_ngrams_follow_the_original_token_order():
+    preprocessor = TextPreprocessor()
+    hashed = preprocessor.extract_hashed_ngrams('Experience with Python, machine learning and unit testing.')
+    expected = hash_ngrams(['machine', 'learning', None, 'unit', 'testing'])
+    assert as_dict(hashed) == as_dict(expected)
+    assert as_dict(hashed) != as_dict(hash_ngrams(['experience', 'python']))
+    assert as_dict(preprocessor.extract_hashed_ngrams('learning machine')) != as_dict(hash_ngrams(['machine', 'learning']))
+
+@pytest.mark.parametrize('chunk', [1, 2, 3, 7, 4096])
+def test_hashed_ngrams_match_reference_across_chunks(monkeypatch, chunk):
+    monkeypatch.setattr(text_preprocessing, '_NGRAM_CHUNK_TOKENS', chunk)
+    rng = random.Random(chunk)
+    tokens = [None if rng.random() < 0.15 else f'w{rng.randrange(40)}' for _ in range(300)]
+    for sizes in [(1,), (2,), (1, 2, 3)]:
+        assert as_dict(hash_ngrams(tokens, sizes, 997)) == reference_ngrams(tokens, sizes, 997)
+
+def test_hashed_ngrams_stay_within_the_feature_width():
+    words = [f'term{index}' for index in range(50000)]
+    features = hash_ngrams(words, (1, 2, 3), 256)
+    assert features.size == 256
+    assert len(features.indices) <= 256
+    assert features.indices.max() < 256
+    assert int(features.counts.sum()) == 3 * len(words) - 3
+
+def test_phrase_overlap_counts_towards_the_keyword_score():
+    job = {'title': 'ML Engineer', 'description': 'Machine learning engineer for unit testing of models',
+           'requiredSkills': ['Python']}
+    job['features'] = build_job_features(job)
+
+    def keyword_points(text):
+        resume_data = ResumeParser().parse_text(f'Jane Doe\njane@example.com\nSUMMARY\n{text}\n')
+        resume_data['features'] = build_resume_features(resume_data)
+        return SkillMatcher().analyze_match(resume_data, job)['score_breakdown']['keyword_match']
+
+    # Same words, but only one resume has them as the job's phrases
+    assert keyword_points('Machine learning and unit testing of models, engineer') > \
+        keyword_points('Learning machine and testing unit of models, engineer')
@@ -0,0 +1,48 @@
+import mongomock
+import pytest
+from benchmarks.corpus import build_docx
+from config import Config
+from services import parse_cache
+from services.parse_cache import ParseCache
+from services.resume_parser import ResumeParser
+from utils.lru_cache import LRUCache
+
+RESUME = 'Jane Doe\njane@example.com\nSKILLS\nPython, Docker, Kubernetes\n' + 'Built data pipelines. ' * 50
+
+class CountingParser(ResumeParser):
+    def __init__(self):
+        super().__init__()
+        self.calls = 0
+
+    def parse_resume(self, file_path):
+        self.calls += 1
+        return super().parse_resume(file_path)
+
+@pytest.fixture
+def resume_path(tmp_path, monkeypatch):
+    monkeypatch.setattr(Config, 'EXTRACTION_WORKERS', 0)
+    monkeypatch.setattr(parse_cache, '_memory_cache', LRUCache(16))
+    path = tmp_path / 'resume.docx'
+    path.write_bytes(build_docx(RESUME))
+    return str(path)
+
+def test_identical_content_is_parsed_once(resume_path):
+    parser = CountingParser()
+    cache = ParseCache(mongomock.MongoClient().db, parser)
+    first = cache.parse(resume_path)
+    assert cache.parse(resume_path) == first
+    assert parser.calls == 1
+
+@pytest.mark.parametrize('setting, value', [('MAX_RESUME_CHARS', 200), ('MAX_RESUME_PAGES', 1)])
+def test_budget_changes_miss_both_tiers(resume_path, monkeypatch, setting, value):
+    db = mongomock.MongoClient().db
+    parser = CountingParser()
+    full = ParseCache(db, parser).parse(resume_path)
+
+    monkeypatch.setattr(Config, setting, value)
+    budgeted = ParseCache(db, parser).parse(resume_path)
+
+    assert parser.calls == 2
+    assert db.parsed_resumes.count_documents({}) == 2
+    if setting == 'MAX_RESUME_CHARS':
+        assert len(budgeted['raw_text']) <= value < len(full['raw_text'])
@@ -0,0 +1,62 @@
+import mongomock
+import pytest
+from benchmarks.corpus import build_docx
+from config import Config
+from services.job_features import build_job_features
+from services.rescoring import rescore_job
+from services.resume_features import RESUME_FEATURES_VERSION, build_resume_features
+from services.resume_parser import ResumeParser
+
+RESUME = ('Jane Doe\njane@example.com 555-123-4567\nEXPERIENCE\n5 years building services in Python and Docker\n'
+          'EDUCATION\nBachelor of Computer Science\nSKILLS\nPython, Docker, Kubernetes\n')
+
+@pytest.fixture
+def db(monkeypatch):
+    monkeypatch.setattr(Config, 'EXTRACTION_WORKERS', 0)
+    db = mongomock.MongoClient().db
+    job = {'title': 'Backend Engineer', 'description': 'Python services on Kubernetes',
+           'requiredSkills': ['Python', 'Kubernetes'], 'status': 'active'}
+    job['features'] = build_job_features(job)
+    db.jobs.insert_one(job)
+    return db
+
+def outdated_record():
+    features = build_resume_features(ResumeParser().parse_text(RESUME))
+    features['version'] = '4:4:old'
+    return features
+
+def add_application(db, resume_url, resume_features):
+    job_id = db.jobs.find_one()['_id']
+    return db.applications.insert_one({
+        'jobId': job_id, 'scoringStatus': 'completed', 'matchScore': 1,
+        'resumeUrl': resume_url, 'resumeFeatures': resume_features
+    }).inserted_id
+
+def test_outdated_records_without_a_file_are_scored_as_stored(db, tmp_path):
+    application_id = add_application(db, str(tmp_path / 'missing.docx'), outdated_record())
+
+    counts = rescore_job(db, str(db.jobs.find_one()['_id']), batch_delay=0)
+
+    assert counts == {'scored': 1, 'updated': 1, 'skipped': 0}
+    assert db.applications.find_one({'_id': application_id})['matchScore'] > 1
+
+def test_outdated_records_are_rebuilt_from_the_file(db, tmp_path):
+    resume_path = tmp_path / 'resume.docx'
+    resume_path.write_bytes(build_docx(RESUME))
+    application_id = add_application(db, str(resume_path), outdated_record())
+
+    counts = rescore_job(db, str(db.jobs.find_one()['_id']), batch_delay=0)
+
+    application = db.applications.find_one({'_id': application_id})
+    assert counts['scored'] == 1
+    assert application['resumeFeatures']['version'] == RESUME_FEATURES_VERSION
+    assert application['matchScore'] > 1
+    assert application['skillBitmap']
+
+def test_applications_without_record_or_file_are_skipped(db, tmp_path):
+    application_id = add_application(db, str(tmp_path / 'missing.docx'), None)
+
+    counts = rescore_job(db, str(db.jobs.find_one()['_id']), batch_delay=0)
+
+    assert counts == {'scored': 0, 'updated': 0, 'skipped': 1}
+    assert db.applications.find_one({'_id': application_id})['matchScore'] == 1
@@ -0,0 +1,40 @@
+import mongomock
+from services.resume_features import RESUME_FEATURES_VERSION, build_resume_features, load_profile_resume_data
+from services.resume_parser import ResumeParser
+from services.skill_matcher import SkillMatcher
+
+RESUME = ('Jane Doe\njane@example.com 555-123-4567\nEXPERIENCE\n5 years building services in Python and Docker\n'
+          'EDUCATION\nBachelor of Computer Science\nSKILLS\nPython, Docker, Kubernetes\n')
+
+JOB = {'title': 'Backend Engineer', 'description': 'Python services on Kubernetes', 'requiredSkills': ['Python', 'Go']}
+
+def outdated_record():
+    features = build_resume_features(ResumeParser().parse_text(RESUME))
+    # As stored before a parser or taxonomy bump, and before phrases were recorded
+    features['version'] = '4:4:old'
+    del features['phrases']
+    return features
+
+def test_outdated_record_is_used_when_the_file_is_gone(tmp_path):
+    db = mongomock.MongoClient().db
+    user = {'_id': 'u1', 'resumeFeatures': outdated_record(),
+            'profile': {'resumeUrl': str(tmp_path / 'missing.pdf')}}
+
+    resume_data = load_profile_resume_data(db, user)
+    assert resume_data is not None
+    assert resume_data['skills'] == user['resumeFeatures']['skills']
+
+    analysis = SkillMatcher().analyze_match(resume_data, JOB)
+    assert analysis['skill_analysis']['matched_skills'] == ['python', 'kubernetes']
+    assert analysis['ats_score'] > 0
+
+def test_no_record_and_no_file_is_no_resume(tmp_path):
+    db = mongomock.MongoClient().db
+    user = {'_id': 'u1', 'profile': {'resumeUrl': str(tmp_path / 'missing.pdf')}}
+    assert load_profile_resume_data(db, user) is None
+
+def test_current_record_is_used_as_stored():
+    features = build_resume_features(ResumeParser().parse_text(RESUME))
+    assert features['version'] == RESUME_FEATURES_VERSION
+    resume_data = load_profile_resume_data(None, {'_id': 'u1', 'resumeFeatures': features, 'profile': {}})
+    assert resume_data['features'] is features
@@ -0,0 +1,77 @@
+import random
+import mongomock
+import pytest
+from bson import ObjectId
+from mongomock import filtering
+from models.application_model import Application
+from services.skill_bitmap import (BITMAP_BYTES, bitmap_query, decode_skill_ids, encode_skill_ids,
+                                   resolve_skill_query, skill_bitmap)
+from services.skill_taxonomy import SKILLS_BY_ID, resolve_skill
+
+PYTHON, KUBERNETES, REACT = resolve_skill('python'), resolve_skill('kubernetes'), resolve_skill('react')
+
+def bits_set(value, positions):
+    """Bits at the given positions of BinData, counted from the low bit of the first byte as MongoDB does"""
+    number = int.from_bytes(value, 'little')
+    return [number >> position & 1 for position in positions]
+
+@pytest.fixture
+def db(monkeypatch):
+    # mongomock doesn't implement the bitwise query operators
+    operators = filtering._filterer_inst._operator_map
+    monkeypatch.setitem(operators, '$bitsAllSet', lambda value, positions: isinstance(value, bytes) and all(bits_set(value, positions)))
+    monkeypatch.setitem(operators, '$bitsAnySet', lambda value, positions: isinstance(value, bytes) and any(bits_set(value, positions)))
+    return mongomock.MongoClient().db
+
+@pytest.mark.parametrize('seed', range(10))
+def test_bitmaps_round_trip(seed):
+    rng = random.Random(seed)
+    skill_ids = sorted(rng.sample(sorted(SKILLS_BY_ID), rng.randint(0, 20)))
+    bitmap = encode_skill_ids(skill_ids)
+    assert len(bitmap) == BITMAP_BYTES
+    assert decode_skill_ids(bitmap) == skill_ids
+    assert all(bits_set(bitmap, skill_ids))
+
+def test_bitmap_covers_counted_and_listed_skills():
+    features = {'skillCounts': [[PYTHON, 3]], 'skills': ['ReactJS', 'Underwater basket weaving']}
+    assert decode_skill_ids(skill_bitmap(features)) == sorted([PYTHON, REACT])
+    assert skill_bitmap(None) is None
+    assert decode_skill_ids(None) == []
+
+def test_skill_queries_resolve_aliases_and_typos():
+    assert resolve_skill_query(['Python', 'k8s', 'Kubernets', ' ', 'Cobolt basket']) == \
+        ([PYTHON, KUBERNETES], ['Cobolt basket'])
+
+def test_bitmap_query_shape():
+    assert bitmap_query('skillBitmap', [PYTHON], [REACT, KUBERNETES]) == {
+        'skillBitmap': {'$bitsAllSet': [PYTHON], '$bitsAnySet': [REACT, KUBERNETES]}
+    }
+    assert bitmap_query('skillBitmap') == {}
+
+def test_filter_applications_by_skills(db):
+    model = Application(db)
+    job_id, other_job_id = str(ObjectId()), str(ObjectId())
+
+    def apply(name, skill_ids, job=job_id):
+        model.create_application({
+            'candidateId': str(ObjectId()), 'jobId': job, 'candidateName': name, 'email': f'{name}@example.com',
+            'degree': 'BSc', 'experience': '3 years',
+            'resumeFeatures': {'skillCounts': [[skill_id, 1] for skill_id in skill_ids], 'skills': []}
+        })
+
+    apply('both', [PYTHON, KUBERNETES])
+    apply('python', [PYTHON])
+    apply('react', [REACT])
+    apply('other job', [PYTHON, KUBERNETES], other_job_id)
+    apply('no resume', [])
+
+    def names(**query):
+        return sorted(app['candidateName'] for app in model.filter_by_skills([job_id], **query))
+
+    assert names(all_skill_ids=[PYTHON, KUBERNETES]) == ['both']
+    assert names(all_skill_ids=[PYTHON]) == ['both', 'python']
+    assert names(any_skill_ids=[KUBERNETES, REACT]) == ['both', 'react']
+    assert names(all_skill_ids=[PYTHON], any_skill_ids=[REACT]) == []
+
+    both = model.filter_by_skills([job_id], all_skill_ids=[PYTHON, KUBERNETES])[0]
+    assert both['skills'] == [SKILLS_BY_ID[skill_id].label for skill_id in sorted([PYTHON, KUBERNETES])]
@@ -0,0 +1,42 @@
+import pytest
+from services.resume_features import build_resume_features
+from services.resume_parser import ResumeParser
+from services.skill_matcher import SkillMatcher
+from services.skill_resolver import find_misspelled_skills, resolve_skill_fuzzy
+from services.text_preprocessing import TextPreprocessor
+
+@pytest.mark.parametrize('word', ['sprint', 'string', 'trails', 'scalar', 'docket', 'stack', 'influence'])
+def test_common_words_are_not_corrected(word):
+    assert resolve_skill_fuzzy(word) is None
+    assert find_misspelled_skills([word]) == []
+
+@pytest.mark.parametrize('name', ['Dash', 'Sails', 'Embed', 'Iconic', 'Expresso', 'Nodes'])
+def test_unknown_job_skill_names_are_kept(name):
+    assert TextPreprocessor().normalize_skill_name(name) == name.lower()
+
+@pytest.mark.parametrize('name, expected', [
+    ('Kubernets', 'kubernetes'),
+    ('Javascrpt', 'javascript'),
+    ('Node JS', 'node.js'),
+    ('ReactJS', 'react'),
+])
+def test_misspelled_job_skill_names_are_corrected(name, expected):
+    assert TextPreprocessor().normalize_skill_name(name) == expected
+
+def test_free_text_words_do_not_become_skills():
+    text = ('Jane Doe\njane@example.com\nEXPERIENCE\n'
+            'Led sprint planning and string formatting, built the Trails runner\n')
+    features = build_resume_features(ResumeParser().parse_text(text))
+    assert 'spring' not in features['skills']
+    assert 'rails' not in features['skills']
+
+    job = {'title': 'Engineer', 'description': 'Spring and Rails', 'requiredSkills': ['Spring', 'Rails']}
+    analysis = SkillMatcher().analyze_match({**ResumeParser().parse_text(text), 'features': features}, job)
+    assert analysis['skill_analysis']['matched_skills'] == []
+
+def test_skills_section_misspellings_are_corrected():
+    text = 'Jane Doe\njane@example.com\nSKILLS\nPyhton, Kubernets, Sprint\n'
+    features = build_resume_features(ResumeParser().parse_text(text))
+    assert 'python' in features['skills']
+    assert 'kubernetes' in features['skills']
+    assert 'spring' not in features['skills']
@@ -0,0 +1,51 @@
+import re
+import pytest
+from benchmarks.corpus import generate_corpus
+from services.skill_scanner import SkillScanner
+from services.skill_taxonomy import SKILL_NAMES, find_skills, resolve_skill, scan_skill_ids
+
+def regex_extract(terms, text):
+    """The loop the scanner replaced: one word-boundary regex per term"""
+    text = text.lower()
+    return [term for term in terms if re.search(r'\b' + re.escape(term.lower()) + r'\b', text)]
+
+@pytest.fixture(scope='module')
+def scanner():
+    return SkillScanner(SKILL_NAMES)
+
+@pytest.mark.parametrize('seed', range(5))
+def test_scanner_matches_the_regex_loop(scanner, seed):
+    # \b can't express boundaries after symbols, so compare word-edged terms only
+    comparable = [term for term in SKILL_NAMES if term[0].isalnum() and term[-1].isalnum()]
+    for document in generate_corpus(20, seed=seed, skill_ratio=0.3):
+        expected = regex_extract(comparable, document)
+        assert [term for term in scanner.find(document) if term in comparable] == expected
+
+@pytest.mark.parametrize('text, found', [
+    ('Wrote C++ and C# services', ['c++', 'c#']),
+    ('Shipped .NET apps and node.js APIs.', ['.net', 'node.js']),
+    ('Built ASP.NET sites', []),
+    ('javascript only', ['javascript']),
+    ('machine\nlearning and more', ['machine learning']),
+    ('machine, learning', []),
+    ('', []),
+])
+def test_symbol_and_phrase_boundaries(text, found):
+    scanner = SkillScanner(['c++', 'c#', '.net', 'node.js', 'java', 'javascript', 'machine learning'])
+    assert sorted(scanner.find(text)) == sorted(found)
+
+def test_hits_carry_positions_and_counts():
+    scanner = SkillScanner(['python', 'c++'])
+    text = 'Python, C++ and more Python'
+    assert scanner.scan(text) == [(0, 6, 'python'), (8, 11, 'c++'), (21, 27, 'python')]
+    assert scanner.count(text) == {'python': 2, 'c++': 1}
+
+def test_taxonomy_scan_counts_nested_aliases_once():
+    # 'spring boot' and 'spring' are aliases of one skill
+    assert resolve_skill('spring boot') == resolve_skill('spring')
+    assert scan_skill_ids('Spring Boot services, then Spring') == {resolve_skill('spring'): 2}
+
+def test_find_skills_returns_canonical_names():
+    assert find_skills('Experience with ReactJS and Python') == [
+        name for name in SKILL_NAMES if name in ('python', 'react')
+    ]
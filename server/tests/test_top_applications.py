@@ -0,0 +1,84 @@
+import random
+import mongomock
+import pytest
+from bson import ObjectId
+from models.application_model import Application
+
+@pytest.fixture
+def ranking():
+    """An application model with 40 ranked applications to one job; many share a score"""
+    db = mongomock.MongoClient().db
+    model = Application(db)
+    model.ensure_indexes()
+    job_id = str(ObjectId())
+    rng = random.Random(5)
+    for index in range(40):
+        model.create_application({
+            'candidateId': str(ObjectId()), 'jobId': job_id, 'candidateName': f'candidate {index}',
+            'email': f'c{index}@example.com', 'degree': 'BSc', 'experience': '2 years',
+            'matchScore': rng.choice([40, 55, 55, 70, 70, 70, 90])
+        })
+    # Unscored and other-job applications never appear
+    model.create_application({'candidateId': str(ObjectId()), 'jobId': job_id, 'candidateName': 'pending',
+                              'email': 'p@example.com', 'degree': 'BSc', 'experience': '1 year',
+                              'matchScore': None, 'scoringStatus': 'pending'})
+    model.create_application({'candidateId': str(ObjectId()), 'jobId': str(ObjectId()), 'candidateName': 'elsewhere',
+                              'email': 'e@example.com', 'degree': 'BSc', 'experience': '1 year', 'matchScore': 99})
+    return db, model, job_id
+
+def expected_order(db, job_id, statuses=None):
+    query = {'jobId': ObjectId(job_id), 'matchScore': {'$ne': None}}
+    if statuses:
+        query['status'] = {'$in': statuses}
+    applications = sorted(db.applications.find(query), key=lambda app: (app['matchScore'], app['_id']), reverse=True)
+    return [str(app['_id']) for app in applications]
+
+def all_pages(model, job_id, limit, statuses=None):
+    pages, cursor = [], None
+    while True:
+        applications, cursor = model.get_top_applications(job_id, limit, statuses, cursor)
+        pages.append([app['_id'] for app in applications])
+        if cursor is None:
+            return pages
+
+@pytest.mark.parametrize('limit', [1, 3, 7, 8, 40, 50])
+def test_pages_follow_the_ranking_without_gaps_or_repeats(ranking, limit):
+    db, model, job_id = ranking
+    pages = all_pages(model, job_id, limit)
+
+    assert [app_id for page in pages for app_id in page] == expected_order(db, job_id)
+    assert all(len(page) == limit for page in pages[:-1])
+    # No empty trailing page when the total is a multiple of the page size
+    assert 0 < len(pages[-1]) <= limit
+
+def test_status_filter_pages(ranking):
+    db, model, job_id = ranking
+    accepted = expected_order(db, job_id)[::3]
+    db.applications.update_many({'_id': {'$in': [ObjectId(app_id) for app_id in accepted]}},
+                                {'$set': {'status': 'accepted'}})
+
+    pages = all_pages(model, job_id, 4, ['accepted'])
+
+    assert [app_id for page in pages for app_id in page] == expected_order(db, job_id, ['accepted'])
+
+def test_cursor_is_stable_when_higher_scores_arrive(ranking):
+    db, model, job_id = ranking
+    first, cursor = model.get_top_applications(job_id, 10)
+    model.create_application({'candidateId': str(ObjectId()), 'jobId': job_id, 'candidateName': 'late',
+                              'email': 'l@example.com', 'degree': 'BSc', 'experience': '1 year', 'matchScore': 100})
+
+    second, _ = model.get_top_applications(job_id, 10, cursor=cursor)
+
+    order = expected_order(db, job_id)
+    assert [app['_id'] for app in first + second] == order[1:21]
+
+def test_malformed_cursor_is_rejected(ranking):
+    _, model, job_id = ranking
+    for cursor in ['70', '70:not-an-id', f'high:{ObjectId()}']:
+        with pytest.raises(ValueError):
+            model.get_top_applications(job_id, 10, cursor=cursor)
+
+def test_ranking_index_exists(ranking):
+    db, _, _ = ranking
+    keys = [list(index['key']) for index in db.applications.index_information().values()]
+    assert [('jobId', 1), ('matchScore', -1), ('_id', -1)] in keys
@@ -0,0 +1,8 @@
+from flask import jsonify
+from config import Config
+
+def extraction_unavailable(error):
+    """503 response telling the client when to retry a resume that couldn't be extracted yet"""
+    response = jsonify({'error': str(error)})
+    response.headers['Retry-After'] = str(Config.EXTRACTION_RETRY_AFTER)
+    return response, 503
@@ -0,0 +1,56 @@
+import threading
+from collections import OrderedDict
+
+class LRUCache:
+    """Thread-safe in-process LRU cache with hit/miss counters"""
+
+    def __init__(self, maxsize=1024):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, default=None):
+        """Return cached value and mark it as recently used"""
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return self._data[key]
+            self.misses += 1
+            return default
+
+    def put(self, key, value):
+        """Store value, evicting the least recently used entry if full"""
+        if self.maxsize <= 0:
+            return
+
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key, default=None):
+        """Remove a single entry"""
+        with self._lock:
+            return self._data.pop(key, default)
+
+    def clear(self):
+        """Remove all entries"""
+        with self._lock:
+            self._data.clear()
+
+    def stats(self):
+        """Get cache statistics"""
+        with self._lock:
+            return {
+                'size': len(self._data),
+                'maxsize': self.maxsize,
+                'hits': self.hits,
+                'misses': self.misses
+            }
+
+    def __len__(self):
+        return len(self._data)
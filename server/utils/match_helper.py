@@ -0,0 +1,11 @@
+from flask import g
+from services.skill_matcher import SkillMatcher
+
+def get_match(resume_data, job):
+    """Match a resume against a job once per request, reusing the result for later lookups"""
+    matches = g.setdefault('matches', {})
+    # The resume dict is kept alongside the result so its id stays unique for the request
+    key = (id(resume_data), str(job['_id']))
+    if key not in matches:
+        matches[key] = (resume_data, SkillMatcher().analyze_match(resume_data, job))
+    return matches[key][1]